@@ -1,25 +1,80 @@
+import argparse
+import random
 import constants
+from game.benchmarking.asteroid_swarm_scenario import AsteroidSwarmScenario
+from game.benchmarking.benchmark_runner import BenchmarkRunner
+from game.benchmarking.shotgun_scenario import ShotgunScenario
+from game.benchmarking.stage_progression_scenario import StageProgressionScenario
 from game.casting.cast import Cast
 from game.scripting.script import Script
 from game.scripting.draw_actors_action import DrawActorsAction
+from game.directing.action_profiler import ActionProfiler
 from game.directing.director import Director
-from game.services.keyboard_service import KeyboardService
-from game.services.video_service import VideoService
-from game.services.audio_service import AudioService
+from game.directing.replay_director import ReplayDirector
+from game.services.null_audio_service import NullAudioService
+from game.services.null_video_service import NullVideoService
+from game.services.recording_keyboard_service import RecordingKeyboardService
+from game.services.scripted_keyboard_service import ScriptedKeyboardService
 from game.shared.color import Color
+from game.shared.input_log import InputLog
 from game.shared.point import Point
 from game.scripting.handle_menu_system import handleMenuSystem
 
 
-def main():
+# key script used when running headless: start the game, then keep firing while weaving side to side
+HEADLESS_KEY_SCRIPT = [(1, ["enter"]), (3, []), (5, ["space", "left"]), (40, ["space", "right"]), (80, ["space"])]
+
+
+def main(headless=False, frames=None, profile=False, grid=False, record=None, replay=None,
+         seek=None, seed=None, audio_thread=False):
+    """Runs the game.
+
+    Args:
+        headless (bool): run without a window, sound or keyboard (uses the null services)
+        frames (int): stop after this many frames (None runs until the window is closed)
+        profile (bool): time every action and print where the time went when the game closes
+        grid (bool): draw grid-aligned characters a whole row at a time (see VideoService)
+        record (string): save the keys pressed on every tick and the seed to this file
+        replay (string): play the game saved in this file instead of reading the keyboard
+        seek (int): when replaying, jump straight to this tick
+        seed (int): seed for the random number generator when recording (None picks one)
+        audio_thread (bool): call the audio device from its own thread (see AudioService)
+    """
+
+    # a replay has to use the seed its game was recorded with
+    replay_log = None
+    if replay:
+        replay_log = InputLog.load(replay)
+        # the same keys at another tick rate would play a different game
+        if replay_log.get_frame_rate() != constants.FRAME_RATE:
+            raise ValueError(f"{replay} was recorded at {replay_log.get_frame_rate()} ticks per "
+                             f"second, but the game runs at {constants.FRAME_RATE}")
+        seed = replay_log.get_seed()
+    elif record and seed is None:
+        seed = random.randrange(2 ** 32)
+    if seed is not None:
+        random.seed(seed)
 
     # create the cast
     cast = Cast()
 
     # create services
-    keyboard_service = KeyboardService()
-    audio_service = AudioService()
-    video_service = VideoService(audio_service)
+    if headless:
+        keyboard_service = ScriptedKeyboardService(HEADLESS_KEY_SCRIPT)
+        audio_service = NullAudioService()
+        video_service = NullVideoService(audio_service, frames, grid)
+    else:
+        # imported here so running headless doesn't need pyray
+        from game.services.keyboard_service import KeyboardService
+        from game.services.video_service import VideoService
+        from game.services.audio_service import AudioService
+        keyboard_service = KeyboardService()
+        audio_service = AudioService(audio_thread)
+        video_service = VideoService(audio_service, grid=grid)
+    if replay_log is not None:
+        keyboard_service = ScriptedKeyboardService(replay_log.get_key_script())
+    if record:
+        keyboard_service = RecordingKeyboardService(keyboard_service, InputLog(seed))
 
     # create actions
     draw_actors_instance = DrawActorsAction(video_service)
@@ -32,9 +87,113 @@ def main():
     script.add_action("output", draw_actors_instance)
 
     # create director to execute scripts
-    director = Director(video_service)
+    if replay_log is not None:
+        director = ReplayDirector(video_service, keyboard_service, audio_service,
+                                  replay_log.get_tick_count())
+        if seek is not None:
+            director.seek(seek)
+    else:
+        director = Director(video_service, keyboard_service)
+    if profile:
+        profiler = ActionProfiler()
+        director.add_hook(profiler)
     director.start_game(cast, script)
 
+    if profile:
+        for line in profiler.get_report():
+            print(line)
+        # and how the audio kept up
+        loaded, total = audio_service.get_load_progress()
+        load = audio_service.get_load_stats()
+        voices = audio_service.get_voice_stats()
+        commands = audio_service.get_queue_stats()
+        print(f"audio: {loaded}/{total} sounds decoded in {sum(load['decode_ms'].values()):.1f} ms, "
+              f"all ready after {load['seconds'] or 0:.2f} s")
+        print(f"audio: {voices['played']} sounds played, {voices['stolen']} stole a voice, "
+              f"{voices['dropped']} dropped")
+        print(f"audio: {commands['commands']} commands, {commands['errors']} failed, "
+              f"queue depth max {commands['max_depth']}, latency mean "
+              f"{commands['mean_latency_ms']:.3f} ms, max {commands['max_latency_ms']:.3f} ms")
+
+    if record:
+        log = keyboard_service.get_log()
+        log.save(record)
+        print(f"recorded {log.get_tick_count()} ticks with seed {seed} to {record}")
+
+    if headless:
+        print(f"{video_service.get_frame_count()} frames, {video_service.get_draw_calls()} draw calls, "
+              f"{len(audio_service.get_played_sounds())} sounds played")
+
+
+def bench(seed=0, output="benchmark.json", compare=None, scenario_names=None, swarm_size=1000,
+          grid=False):
+    """Runs the benchmark scenarios headless, saves the results as JSON and optionally compares
+    them with an earlier run.
+
+    Args:
+        seed (int): seeds the random module before each scenario
+        output (string): where to save the results
+        compare (string): earlier results to compare against (None to skip)
+        scenario_names (list of strings): which scenarios to run (None runs them all)
+        swarm_size (int): how many asteroids the swarm scenario creates
+        grid (bool): count draw calls the way grid mode makes them
+    """
+    scenarios = [StageProgressionScenario(), AsteroidSwarmScenario(swarm_size), ShotgunScenario()]
+    if scenario_names:
+        scenarios = [scenario for scenario in scenarios
+                     if any(scenario.get_name().startswith(name) for name in scenario_names)]
+
+    runner = BenchmarkRunner(seed, grid)
+    results = runner.run(scenarios)
+    runner.save(results, output)
+
+    for name, scenario in results["scenarios"].items():
+        print(f"{name}: {scenario['ticks']} ticks in {scenario['wall_seconds']} s")
+        for section_name, section in scenario["sections"].items():
+            frame_ms = section["frame_ms"]
+            print(f"  {section_name}: p50 {frame_ms['p50']:.3f} ms, p99 {frame_ms['p99']:.3f} ms, "
+                  f"max {frame_ms['max']:.3f} ms")
+    print(f"results saved to {output}")
+
+    if compare:
+        for line in runner.compare(runner.load(compare), results):
+            print(line)
+
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(prog="starcruiser", description=constants.GAME_TITLE)
+    parser.add_argument("command", nargs="?", default="play", choices=["play", "bench"],
+                        help="play the game (default) or run the benchmark scenarios")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window, sound or keyboard (plays a key script)")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="stop after this many frames")
+    parser.add_argument("--profile", action="store_true",
+                        help="time every action and print where the time went when the game closes")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the random number generator (bench, or play with --record)")
+    parser.add_argument("--output", default="benchmark.json",
+                        help="bench: where to save the results")
+    parser.add_argument("--compare", default=None,
+                        help="bench: earlier results to compare against")
+    parser.add_argument("--scenario", action="append", default=None,
+                        help="bench: only run scenarios starting with this name (can be repeated)")
+    parser.add_argument("--swarm-size", type=int, default=1000,
+                        help="bench: how many asteroids the swarm scenario creates")
+    parser.add_argument("--record", default=None,
+                        help="play: save the keys pressed on every tick to this file")
+    parser.add_argument("--replay", default=None,
+                        help="play: play back a game saved with --record")
+    parser.add_argument("--seek", type=int, default=None,
+                        help="play: with --replay, jump straight to this tick")
+    parser.add_argument("--grid", action="store_true",
+                        help="draw grid-aligned characters a whole row at a time")
+    parser.add_argument("--audio-thread", action="store_true",
+                        help="play: call the audio device from its own thread, not the game loop")
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        bench(args.seed or 0, args.output, args.compare, args.scenario, args.swarm_size, args.grid)
+    else:
+        main(args.headless, args.frames, args.profile, args.grid, args.record, args.replay,
+             args.seek, args.seed, args.audio_thread)
@@ -6,31 +6,39 @@ GAME_TITLE = "STAR CRUISER 5000"
 
 # Game grid sizes
 COLUMNS = 40
-ROWS = 60
+ROWS = 47
 CELL_SIZE = 15
+STRUCTURE_CELLS = 8  # cells across each cell of the collision index for multi-part enemies
+RASTER_TOP_ROWS = 20  # rows above the screen the occupancy raster covers (where enemies spawn)
+RASTER_GROUPS = ["asteroids", "ufos", "lasers", "ships"]  # groups the raster tracks (later ones win a shared cell)
 
 # Screen size
 MAX_X = 600  # COLUMNS * CELL_SIZE
 MAX_Y = 705  # ROWS * CELL_SIZE
 
 # Pyray window settings
-FRAME_RATE = 18
+FRAME_RATE = 18  # simulation ticks per second (controls game speed)
+RENDER_RATE = 144  # most frames drawn per second (actors are interpolated between ticks)
+MAX_TICKS_PER_FRAME = 5  # most ticks run to catch up after a slow frame
+FRAME_BUDGET = 1 / FRAME_RATE  # seconds of actions a frame may take before the profiler reports it
+PROFILER_WINDOW = 600  # recent samples each profiler histogram keeps
+KEYFRAME_INTERVAL = FRAME_RATE * 10  # ticks between the game copies a replay keeps for seeking
 FONT_SIZE = 15
 CAPTION = "STAR CRUISER 5000 ✈"
 
 # Colors
-WHITE = Color(255, 255, 255)
-BLACK = Color(0, 0, 0)
-RED = Color(255, 0, 0)
-YELLOW = Color(255, 255, 0)
-GREEN = Color(0, 255, 0)
-BROWN = Color(145, 20, 22)
-BLUE = Color(5, 90, 255)
-ORANGE = Color(255, 140, 0)
-AQUA = Color(100, 255, 255)
-PINK = Color(255, 150, 150)
-PURPLE = Color(255, 0, 150)
-BREEN = Color(245, 120, 22)
+WHITE = Color.get(255, 255, 255)
+BLACK = Color.get(0, 0, 0)
+RED = Color.get(255, 0, 0)
+YELLOW = Color.get(255, 255, 0)
+GREEN = Color.get(0, 255, 0)
+BROWN = Color.get(145, 20, 22)
+BLUE = Color.get(5, 90, 255)
+ORANGE = Color.get(255, 140, 0)
+AQUA = Color.get(100, 255, 255)
+PINK = Color.get(255, 150, 150)
+PURPLE = Color.get(255, 0, 150)
+BREEN = Color.get(245, 120, 22)
 
 # Ship shields and damage
 MAXSHIELDS = 40
@@ -41,6 +49,15 @@ HIGHSCORE_FILE = "starcruiser/game/data/highscores.txt"
 
 # SOUNDS - - - - - - -
 SOUNDS_FOLDER = "starcruiser/game/sounds/"
+SOUNDS_MADE_PER_FRAME = 2  # sounds decoded in the background made playable each frame (see AudioService)
+MUSIC_FADE_SECONDS = 1.5  # how long changing the music takes to fade one track out and the other in
+MAX_VOICES = 16  # sounds that can play at once (more are dropped unless they are priority sounds)
+# voices each sound can overlap itself with (sounds not listed have one, which restarts)
+SOUND_VOICES = {"laser": 3, "ast-hit": 4, "ast-hit-sml": 4, "ast-hit-lrg": 3, "ast-hit-giant": 2,
+                "ast-exp-huge": 2, "ast-exp-giant": 2, "ufo-laser": 3, "ufo-exp": 2}
+PRIORITY_SOUNDS = ["ship-hit", "low-shields", "ship-exp", "game-over"]  # always played, even past MAX_VOICES
+AUDIO_THREAD_WAIT = 0.05  # seconds the audio thread waits for a command before topping up the music anyway
+AUDIO_LOAD_TIMEOUT = 10  # seconds wait_until_loaded waits for the audio thread before going on without it
 # ship
 SHIP_FIRE_SOUND = f"{SOUNDS_FOLDER}lasr.mp3"
 SHIP_HIT_SOUND = f"{SOUNDS_FOLDER}ship-hit.mp3"
@@ -0,0 +1,39 @@
+import constants
+import random
+from game.benchmarking.scenario import Scenario
+from game.casting.asteroid import Asteroid
+from game.shared.point import Point
+
+
+class AsteroidSwarmScenario(Scenario):
+    """Fills the screen with a huge number of asteroids at once.
+
+    The responsibility of AsteroidSwarmScenario is to stress moving, colliding and drawing far more
+    enemies than any stage creates.
+
+    Attributes:
+        _count (int): How many asteroids to create.
+    """
+
+    def __init__(self, count=1000, ticks=360):
+        """Constructs a new AsteroidSwarmScenario.
+
+        Args:
+            count (int): How many asteroids to create.
+            ticks (int): How many ticks to run.
+        """
+        super().__init__(f"asteroid-swarm-{count}", ticks)
+        self._count = count
+
+    def set_up(self, cast, script):
+        """(OVERRIDE) Creates the swarm spread over the top two thirds of the screen."""
+        super().set_up(cast, script)
+        rows = int(constants.MAX_Y / constants.CELL_SIZE)
+        for i in range(0, self._count):
+            x = random.randint(1, constants.COLUMNS - 1)
+            y = random.randint(-10, int(rows * 0.66))
+            asteroid = Asteroid(cast)
+            asteroid.set_position(Point(x, y).scale(constants.CELL_SIZE))
+            asteroid.set_velocity(Point(0, constants.CELL_SIZE))
+            asteroid.set_up_type(random.randint(0, len(constants.ASTEROID_TYPES_LIST) - 1))
+            cast.add_actor("asteroids", asteroid)
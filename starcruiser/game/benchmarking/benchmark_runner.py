@@ -0,0 +1,180 @@
+import json
+import platform
+import random
+from time import perf_counter
+import constants
+from game.casting.cast import Cast
+from game.directing.benchmark_director import BenchmarkDirector
+from game.scripting.draw_actors_action import DrawActorsAction
+from game.scripting.handle_menu_system import handleMenuSystem
+from game.scripting.script import Script
+from game.services.null_audio_service import NullAudioService
+from game.services.null_video_service import NullVideoService
+from game.services.scripted_keyboard_service import ScriptedKeyboardService
+from game.shared.rolling_histogram import RollingHistogram
+
+
+class BenchmarkRunner:
+    """Runs scenarios headless and summarizes how fast the game ran.
+
+    The responsibility of BenchmarkRunner is to drive the real Cast, Script and Director loop
+    through each scenario with the null services and a seeded random number generator, and to turn
+    the raw measurements into results that can be saved as JSON and compared between runs.
+
+    Attributes:
+        _seed (int): Seeds the random module before each scenario.
+        _grid (bool): Whether the video service counts draw calls the way grid mode makes them.
+    """
+
+    def __init__(self, seed=0, grid=False):
+        """Constructs a new BenchmarkRunner.
+
+        Args:
+            seed (int): Seeds the random module before each scenario.
+            grid (bool): Whether the video service counts draw calls the way grid mode makes them.
+        """
+        self._seed = seed
+        self._grid = grid
+
+    def run(self, scenarios):
+        """Runs every scenario and summarizes the results.
+
+        Args:
+            scenarios (list of Scenario): The scenarios to run.
+
+        Returns:
+            dict: The results, ready to be saved as JSON.
+        """
+        results = {
+            "seed": self._seed,
+            "frame_rate": constants.FRAME_RATE,
+            "grid": self._grid,
+            "python": platform.python_version(),
+            "scenarios": {}
+        }
+        for scenario in scenarios:
+            results["scenarios"][scenario.get_name()] = self._run_scenario(scenario)
+        return results
+
+    def _run_scenario(self, scenario):
+        """Plays one scenario from the start menu until it is finished."""
+        random.seed(self._seed)
+
+        # set up the game the same way main() does, with headless services
+        cast = Cast()
+        keyboard_service = ScriptedKeyboardService(scenario.get_key_script())
+        audio_service = NullAudioService()
+        video_service = NullVideoService(audio_service, grid=self._grid)
+        draw_actors_instance = DrawActorsAction(video_service)
+        handle_menu_system = handleMenuSystem(
+            keyboard_service, draw_actors_instance, video_service, audio_service)
+        script = Script()
+        script.add_action("update", handle_menu_system)
+        script.add_action("output", draw_actors_instance)
+
+        director = BenchmarkDirector(video_service, keyboard_service, scenario)
+        start = perf_counter()
+        director.start_game(cast, script)
+        wall_seconds = perf_counter() - start
+
+        sections = {}
+        for name, section in director.get_sections().items():
+            sections[name] = self._summarize_section(section)
+
+        return {
+            "ticks": director.get_ticks(),
+            "wall_seconds": round(wall_seconds, 3),
+            "sounds_played": len(audio_service.get_played_sounds()),
+            "sound_requests": sum(audio_service.get_sound_counts().values()),
+            "pools": cast.get_pool_stats(),
+            "sections": sections
+        }
+
+    def _summarize_section(self, section):
+        """Turns the raw measurements of one section into percentiles and totals."""
+        frame_times = RollingHistogram(None)
+        for seconds in section["frame_times"]:
+            frame_times.add(seconds)
+        frame_count = frame_times.get_count()
+        draw_calls = section["draw_calls"]
+        profiler = section["profiler"]
+        actions = {}
+        for name, stats in profiler.get_action_stats().items():
+            actions[name] = {
+                "calls": stats["calls"],
+                "total_ms": round(stats["total_ms"], 3),
+                "mean_ms": round(stats["total_ms"] / stats["calls"], 4),
+                "p99_ms": round(stats["p99_ms"], 4)
+            }
+
+        return {
+            "frames": frame_count,
+            "frame_ms": {
+                "mean": self._to_ms(frame_times.get_total() / frame_count) if frame_count else 0,
+                "p50": self._to_ms(frame_times.get_percentile(50)),
+                "p90": self._to_ms(frame_times.get_percentile(90)),
+                "p99": self._to_ms(frame_times.get_percentile(99)),
+                "max": self._to_ms(frame_times.get_percentile(100))
+            },
+            "draw_calls": {
+                "mean": round(sum(draw_calls) / len(draw_calls), 1) if draw_calls else 0,
+                "max": max(draw_calls) if draw_calls else 0
+            },
+            "peak_actors": section["peak_actors"],
+            "actions": actions,
+            "overruns": profiler.get_overruns()
+        }
+
+    def _to_ms(self, seconds):
+        return round(seconds * 1000, 4)
+
+    def save(self, results, path):
+        """Saves results as JSON (sorted keys so two files diff cleanly).
+
+        Args:
+            results (dict): Results from run().
+            path (string): Where to save them.
+        """
+        with open(path, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    def load(self, path):
+        """Loads results saved by save().
+
+        Args:
+            path (string): The file to load.
+
+        Returns:
+            dict: The results.
+        """
+        with open(path) as file:
+            return json.load(file)
+
+    def compare(self, old, new):
+        """Compares the frame times of two sets of results, section by section.
+
+        Args:
+            old (dict): The results to compare against.
+            new (dict): The new results.
+
+        Returns:
+            list of strings: One line per section found in both results.
+        """
+        lines = []
+        for scenario_name, scenario in new["scenarios"].items():
+            old_scenario = old["scenarios"].get(scenario_name)
+            if old_scenario is None:
+                continue
+            for section_name, section in scenario["sections"].items():
+                old_section = old_scenario["sections"].get(section_name)
+                if old_section is None:
+                    continue
+                changes = []
+                for stat in ["p50", "p99"]:
+                    before = old_section["frame_ms"][stat]
+                    after = section["frame_ms"][stat]
+                    change = (after - before) / before * 100 if before else 0
+                    changes.append(f"{stat} {before:.3f} -> {after:.3f} ms ({change:+.1f}%)")
+                lines.append(f"{scenario_name} / {section_name}: " + ", ".join(changes))
+        return lines
@@ -0,0 +1,96 @@
+import constants
+
+# how many ticks of key script to generate (longer than any scenario runs)
+KEY_SCRIPT_TICKS = 60000
+# how many ticks the ship moves in one direction before turning around
+WEAVE_TICKS = 36
+
+
+class Scenario:
+    """A repeatable piece of gameplay to measure.
+
+    The responsibility of Scenario is to say which keys are pressed, to set up the cast once the
+    game has started and to decide when the measurement is over. It also names the section of the
+    run each tick belongs to (for example the current stage) so results can be grouped.
+
+    The base scenario starts the game from the menu, keeps firing while weaving side to side and
+    makes the ship's shields big enough that the game never ends.
+
+    Attributes:
+        _name (string): The name used in the results.
+        _ticks (int): How many ticks to run once the game has started (None lets the scenario decide).
+    """
+
+    def __init__(self, name, ticks=None):
+        """Constructs a new Scenario.
+
+        Args:
+            name (string): The name used in the results.
+            ticks (int): How many ticks to run once the game has started (None lets the scenario decide).
+        """
+        self._name = name
+        self._ticks = ticks
+
+    def get_name(self):
+        return self._name
+
+    def get_key_script(self):
+        """Gets the keys to press, for a ScriptedKeyboardService.
+
+        Returns:
+            list: (tick, keys) pairs sorted by tick.
+        """
+        # press enter on the start menu to start the game
+        script = [(1, ["enter"]), (3, [])]
+        # then keep firing while weaving back and forth
+        direction = "left"
+        for tick in range(5, KEY_SCRIPT_TICKS, WEAVE_TICKS):
+            script.append((tick, ["space", direction]))
+            direction = "right" if direction == "left" else "left"
+        return script
+
+    def set_up(self, cast, script):
+        """Prepares the cast once the game has started.
+
+        Args:
+            cast (Cast): The cast of Actors in the game.
+            script (Script): The script of Actions in the game.
+        """
+        # give the ship enough shields to survive the whole run
+        cast.get_first_actor("shields").add_points(constants.MAXSHIELDS * 100000)
+
+    def on_tick(self, cast, script, tick):
+        """Called after the update actions of every tick once the game has started.
+
+        Args:
+            cast (Cast): The cast of Actors in the game.
+            script (Script): The script of Actions in the game.
+            tick (int): Ticks since the game started.
+        """
+        pass
+
+    def get_section(self, cast, script):
+        """Gets the name of the part of the run the next tick belongs to.
+
+        Returns:
+            string: The section name.
+        """
+        return "all"
+
+    def is_finished(self, cast, script, tick):
+        """Whether or not the measurement is over.
+
+        Args:
+            tick (int): Ticks since the game started.
+
+        Returns:
+            bool: True if the run should stop.
+        """
+        return self._ticks is not None and tick >= self._ticks
+
+    def _get_action(self, script, group, action_type):
+        """Finds the first action of the given type in a script group (None if there isn't one)."""
+        for action in script.get_actions(group):
+            if isinstance(action, action_type):
+                return action
+        return None
@@ -0,0 +1,40 @@
+import constants
+from game.benchmarking.scenario import Scenario
+from game.casting.asteroid import Asteroid
+from game.shared.point import Point
+
+
+class ShotgunScenario(Scenario):
+    """Keeps the shotgun upgrade firing into rows of large asteroids.
+
+    The responsibility of ShotgunScenario is to stress lasers, laser collisions, explosions and
+    sparks, which is what late stages with the shotgun spend their time on.
+
+    Attributes:
+        _wave_ticks (int): Ticks between each new row of asteroids.
+    """
+
+    def __init__(self, ticks=900, wave_ticks=18):
+        """Constructs a new ShotgunScenario.
+
+        Args:
+            ticks (int): How many ticks to run.
+            wave_ticks (int): Ticks between each new row of asteroids.
+        """
+        super().__init__("shotgun", ticks)
+        self._wave_ticks = wave_ticks
+
+    def on_tick(self, cast, script, tick):
+        """(OVERRIDE) Keeps the shotgun from running out and sends a new row of asteroids."""
+        ship = cast.get_first_actor("ships")
+        ship.set_gun_type("shotgun")
+        ship.set_upgrade_shots(0)
+
+        if tick % self._wave_ticks == 0:
+            for x in range(1, constants.COLUMNS, 2):
+                asteroid = Asteroid(cast)
+                asteroid.set_position(Point(x, -2).scale(constants.CELL_SIZE))
+                asteroid.set_velocity(Point(0, constants.CELL_SIZE))
+                # large asteroids take two shots
+                asteroid.set_up_type(2)
+                cast.add_actor("asteroids", asteroid)
@@ -0,0 +1,33 @@
+import constants
+from game.benchmarking.scenario import Scenario
+from game.scripting.handle_enemy_creation import HandleEnemyCreation
+
+
+class StageProgressionScenario(Scenario):
+    """Plays through every entry of constants.GAME_STAGES.
+
+    The responsibility of StageProgressionScenario is to group the measurements by the stage that
+    was running, so a change can be judged stage by stage.
+
+    Attributes:
+        _max_ticks (int): Stops the run after this many ticks even if the stages aren't finished.
+    """
+
+    def __init__(self, max_ticks=30000):
+        """Constructs a new StageProgressionScenario.
+
+        Args:
+            max_ticks (int): Stops the run after this many ticks even if the stages aren't finished.
+        """
+        super().__init__("stages")
+        self._max_ticks = max_ticks
+
+    def get_section(self, cast, script):
+        """(OVERRIDE) Names the section after the current stage (Ex: "stage 07")."""
+        enemy_creation = self._get_action(script, "update", HandleEnemyCreation)
+        return f"stage {enemy_creation.get_stage_number():02d}"
+
+    def is_finished(self, cast, script, tick):
+        """(OVERRIDE) Finished once the last stage is over."""
+        enemy_creation = self._get_action(script, "update", HandleEnemyCreation)
+        return enemy_creation.get_stage_number() >= len(constants.GAME_STAGES) or tick >= self._max_ticks
@@ -1,5 +1,5 @@
 import constants
-from game.shared.color import Color
+from game.casting.appearance import Appearance
 from game.shared.point import Point
 
 
@@ -9,22 +9,27 @@ class Actor:
     The responsibility of Actor is to keep track of its appearance, position and velocity in 2d 
     space.
 
+    Actors only have the attributes named in __slots__ (subclasses list their own), which keeps
+    each one small. The text, font size and color live in an Appearance that is shared with every
+    other actor that looks the same.
+
     Attributes:
-        _text (string): The text to display
-        _font_size (int): The font size to use.
-        _color (Color): The color of the text.
+        _appearance (Appearance): The text, font size and color (shared).
         _position (Point): The screen coordinates.
         _velocity (Point): The speed and direction.
+        _is_dead (bool): Whether or not the actor has been destroyed.
+        _last_position (Point): The position at the start of the current tick (None if not saved yet).
     """
 
+    __slots__ = ("_appearance", "_position", "_velocity", "_is_dead", "_last_position")
+
     def __init__(self):
         """Constructs a new Actor."""
-        self._text = ""
-        self._font_size = 15
-        self._color = constants.WHITE
+        self._appearance = Appearance.get("", 15, constants.WHITE)
         self._position = Point(0, 0)
         self._velocity = Point(0, 0)
         self._is_dead = False
+        self._last_position = None
 
     def get_color(self):
         """Gets the actor's color as a tuple of three ints (r, g, b).
@@ -32,7 +37,15 @@ class Actor:
         Returns:
             Color: The actor's text color.
         """
-        return self._color
+        return self._appearance._color
+
+    def get_appearance(self):
+        """Gets the actor's shared text, font size and color.
+
+        Returns:
+            Appearance: The actor's appearance.
+        """
+        return self._appearance
 
     def get_font_size(self):
         """Gets the actor's font size.
@@ -40,7 +53,7 @@ class Actor:
         Returns:
             Point: The actor's font size.
         """
-        return self._font_size
+        return self._appearance._font_size
 
     def get_position(self):
         """Gets the actor's position in 2d space.
@@ -50,13 +63,44 @@ class Actor:
         """
         return self._position
 
+    def get_interpolated_position(self, amount):
+        """Gets a position part-way between where the actor was at the start of the tick and where
+        it is now. Used to draw smooth motion between ticks.
+
+        Args:
+            amount (float): How far between the two positions (0 = last position, 1 = current).
+
+        Returns:
+            Tuple(float, float): The x and y screen coordinates.
+        """
+        x = self._position.get_x()
+        y = self._position.get_y()
+        last = self._last_position
+        if last is None:
+            return (x, y)
+        dx = x - last.get_x()
+        dy = y - last.get_y()
+        # don't slide across the whole screen when the position wrapped around an edge
+        if abs(dx) > constants.MAX_X / 2 or abs(dy) > constants.MAX_Y / 2:
+            return (x, y)
+        return (x - dx * (1 - amount), y - dy * (1 - amount))
+
+    def get_last_position(self):
+        """Gets where the actor was at the start of the current tick.
+
+        Returns:
+            Point: The position at the start of the tick (None if it hasn't been saved yet, for
+                example for an actor created during this tick).
+        """
+        return self._last_position
+
     def get_text(self):
         """Gets the actor's textual representation.
 
         Returns:
             string: The actor's textual representation.
         """
-        return self._text
+        return self._appearance._text
 
     def get_velocity(self):
         """Gets the actor's speed and direction.
@@ -74,9 +118,48 @@ class Actor:
             max_x (int): The maximum x value.
             max_y (int): The maximum y value.
         """
-        x = (self._position.get_x() + self._velocity.get_x()) % constants.MAX_X
-        y = (self._position.get_y() + self._velocity.get_y()) % constants.MAX_Y
-        self._position = Point(x, y)
+        self._position.iadd(self._velocity).wrap(constants.MAX_X, constants.MAX_Y)
+
+    @classmethod
+    def move_all(cls, actors):
+        """Moves every actor in a list, all of this class, like calling move_next on each one.
+        MoveActorsAction moves actors this way so a whole group of plain movers is one tight loop
+        instead of a method call per actor. A subclass that changes move_next is moved one actor
+        at a time, unless it also overrides move_all.
+
+        Args:
+            actors (list): The actors to move (all of this class).
+        """
+        if cls.move_next is not Actor.move_next:
+            for actor in actors:
+                actor.move_next()
+            return
+
+        max_x = constants.MAX_X
+        max_y = constants.MAX_Y
+        for actor in actors:
+            position = actor._position
+            velocity = actor._velocity
+            position._x = (position._x + velocity._x) % max_x
+            position._y = (position._y + velocity._y) % max_y
+
+    def reset(self):
+        """Puts the actor back the way the constructor left it, so a pooled actor can be reused
+        (see ActorPool). Subclasses that add state reset it too.
+        """
+        self._appearance = Appearance.get("", 15, constants.WHITE)
+        self._position.set(0, 0)
+        self._velocity.set(0, 0)
+        self._is_dead = False
+        self._last_position = None
+
+    def save_position(self):
+        """Remembers the current position as the position at the start of the tick."""
+        # copy it, because the position itself changes as the actor moves
+        if self._last_position is None:
+            self._last_position = self._position.copy()
+        else:
+            self._last_position.set_from(self._position)
 
     def set_color(self, color):
         """Updates the color to the given one.
@@ -84,15 +167,16 @@ class Actor:
         Args:
             color (Color): The given color.
         """
-        self._color = color
+        self._appearance = self._appearance.with_color(color)
 
     def set_position(self, position):
-        """Updates the position to the given one.
+        """Updates the position to the given one. The values are copied, so the given point can
+        be changed or reused afterwards without moving the actor.
 
         Args:
             position (Point): The given position.
         """
-        self._position = position
+        self._position.set_from(position)
 
     def set_font_size(self, font_size):
         """Updates the font size to the given one.
@@ -100,7 +184,7 @@ class Actor:
         Args:
             font_size (int): The given font size.
         """
-        self._font_size = font_size
+        self._appearance = self._appearance.with_font_size(font_size)
 
     def set_text(self, text):
         """Updates the text to the given value.
@@ -108,39 +192,13 @@ class Actor:
         Args:
             text (string): The given value.
         """
-        self._text = text
+        self._appearance = self._appearance.with_text(text)
 
     def set_velocity(self, velocity):
-        """Updates the velocity to the given one.
+        """Updates the velocity to the given one. The values are copied, so the given point can
+        be changed or reused afterwards without changing the actor's velocity.
 
         Args:
             velocity (Point): The given velocity.
         """
-        self._velocity = velocity
-
-    def _generate_structure(self, origin, velocity, layout_list, color_list):
-        """
-        Returns a list of actors according to a layout list.
-        Basec positions relative to an origin point.
-        Used for creating multi-part structures (Ex: ship, asteroid)
-        """
-        # declare empty list
-        parts = []
-        # go through layout list
-        for part in layout_list:
-            # get part position relative to origin point
-            x = origin.get_x() + part[1] * constants.CELL_SIZE
-            y = origin.get_y() + part[2] * constants.CELL_SIZE
-            position = Point(x, y)
-            # set other attributes
-            text = part[0]
-            color = color_list[part[3]]
-            part = Actor()
-            part.set_position(position)
-            part.set_velocity(velocity)
-            part.set_text(text)
-            part.set_color(color)
-            # append it to the list
-            parts.append(part)
-        # returns the list of parts
-        return parts
+        self._velocity.set_from(velocity)
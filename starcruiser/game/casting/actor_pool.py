@@ -0,0 +1,88 @@
+class ActorPool:
+    """A supply of reusable actors of one kind.
+
+    The responsibility of ActorPool is to hand out actors that are no longer in use instead of
+    creating new ones, so short-lived actors (lasers, explosions, upgrades) don't keep the memory
+    allocator and garbage collector busy. A pool belongs to a cast group (see Cast.add_pool):
+    acquire an actor, set it up and add it to the group as usual, and when it is removed from the
+    group the cast gives it back to the pool.
+
+    Attributes:
+        _factory (function): Creates a new actor when the pool is empty.
+        _factory_args (tuple): What the factory is called with (for example the cast).
+        _actor_class (type): The class of actor the pool holds (others are never taken back).
+        _free (list): Actors waiting to be reused.
+        _hits (int): How many acquires were served by reusing an actor.
+        _misses (int): How many acquires had to create a new actor.
+        _releases (int): How many actors have been given back.
+        _in_use (int): How many actors are acquired and not yet given back.
+        _high_water (int): The most actors that have been in use at once.
+    """
+
+    def __init__(self, factory, *factory_args):
+        """Constructs a new ActorPool.
+
+        The factory's arguments are kept with the pool instead of in a closure, so a copy of the
+        game (see ReplayDirector) gets a pool that creates actors for the copied cast.
+
+        Args:
+            factory (function): Returns a new actor when called with factory_args. Every actor it
+                returns must be of the same class and have a reset() method.
+            factory_args: What to call the factory with (for example the cast).
+        """
+        self._factory = factory
+        self._factory_args = factory_args
+        self._actor_class = None
+        self._free = []
+        self._hits = 0
+        self._misses = 0
+        self._releases = 0
+        self._in_use = 0
+        self._high_water = 0
+
+    def acquire(self):
+        """Gets an actor in the state its constructor leaves it, reusing a free one if there is one.
+
+        Returns:
+            Actor: The actor.
+        """
+        if self._free:
+            actor = self._free.pop()
+            actor.reset()
+            self._hits += 1
+        else:
+            actor = self._factory(*self._factory_args)
+            self._actor_class = type(actor)
+            self._misses += 1
+
+        self._in_use += 1
+        if self._in_use > self._high_water:
+            self._high_water = self._in_use
+        return actor
+
+    def release(self, actor):
+        """Gives an actor back so it can be reused. Nothing must use the actor after this.
+
+        Args:
+            actor (Actor): An actor that came from acquire.
+        """
+        if type(actor) is not self._actor_class:
+            return
+        self._free.append(actor)
+        self._releases += 1
+        self._in_use = max(self._in_use - 1, 0)
+
+    def get_stats(self):
+        """Gets how well the pool is working.
+
+        Returns:
+            dict: hits, misses, releases, in_use, free and high_water counts.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "releases": self._releases,
+            "in_use": self._in_use,
+            "free": len(self._free),
+            "high_water": self._high_water
+        }
@@ -0,0 +1,81 @@
+# how many different appearances to remember before starting over (keeps text that changes all the
+# time, like the score, from filling memory)
+MAX_APPEARANCES = 4096
+
+
+class Appearance:
+    """What an actor looks like: its text, font size and color.
+
+    The responsibility of Appearance is to hold the look that many actors have in common, so each
+    actor only keeps a reference to one shared record instead of its own copy of every value (for
+    example every "@" part of a large asteroid of one color shares a single Appearance).
+    Appearances never change; use Appearance.get to find the one with the values you want.
+
+    Attributes:
+        _text (string): The text to display.
+        _font_size (int): The font size to use.
+        _color (Color): The color of the text.
+    """
+
+    __slots__ = ("_text", "_font_size", "_color")
+
+    # every appearance created so far { key: (text, font size, color), value: Appearance }
+    _interned = {}
+
+    def __init__(self, text, font_size, color):
+        """Constructs a new Appearance. Use Appearance.get instead so equal appearances are shared.
+
+        Args:
+            text (string): The text to display.
+            font_size (int): The font size to use.
+            color (Color): The color of the text.
+        """
+        self._text = text
+        self._font_size = font_size
+        self._color = color
+
+    @classmethod
+    def get(cls, text, font_size, color):
+        """Gets the shared appearance with the given values, creating it the first time.
+
+        Args:
+            text (string): The text to display.
+            font_size (int): The font size to use.
+            color (Color): The color of the text.
+
+        Returns:
+            Appearance: The shared appearance.
+        """
+        key = (text, font_size, color)
+        appearance = cls._interned.get(key)
+        if appearance is None:
+            if len(cls._interned) >= MAX_APPEARANCES:
+                # actors keep the appearances they already have, only new lookups start over
+                cls._interned.clear()
+            appearance = cls._interned[key] = cls(text, font_size, color)
+        return appearance
+
+    def get_text(self):
+        return self._text
+
+    def get_font_size(self):
+        return self._font_size
+
+    def get_color(self):
+        return self._color
+
+    def with_text(self, text):
+        """Gets the shared appearance that is like this one but with different text."""
+        return Appearance.get(text, self._font_size, self._color)
+
+    def with_font_size(self, font_size):
+        """Gets the shared appearance that is like this one but with a different font size."""
+        return Appearance.get(self._text, font_size, self._color)
+
+    def with_color(self, color):
+        """Gets the shared appearance that is like this one but with a different color."""
+        return Appearance.get(self._text, self._font_size, color)
+
+    def __deepcopy__(self, memo):
+        # appearances never change, so a replay keyframe (see ReplayDirector) shares them
+        return self
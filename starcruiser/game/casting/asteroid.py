@@ -1,13 +1,11 @@
 
 import constants
 import random
-from game.casting.actor import Actor
+from game.casting.composite_actor import CompositeActor
 from game.shared.point import Point
-from game.casting.explosion import Explosion
-from game.casting.spark import Spark
 
 
-class Asteroid(Actor):
+class Asteroid(CompositeActor):
     """
     Asteriod are objects that will be flying in space
     different size asteriod will do diffent amounts of damage if they hit the space ship
@@ -30,13 +28,16 @@ class Asteroid(Actor):
 
     """
 
+    __slots__ = ("_cast", "_name", "_health", "_damage", "_points",
+                 "_move_wait", "_move_timer", "_hit_sound", "_exp_sound")
+
     def __init__(self, cast):
         super().__init__()
         self._cast = cast
 
         # these are set in the set_up_type() method
         self._name = "SML"
-        self._text = "."
+        self.set_text(".")
         self._health = 1
         self._damage = 1
         self._points = 1
@@ -52,9 +53,6 @@ class Asteroid(Actor):
         # for building out larger asteroid structures
         self._parts = [self]
 
-    def get_parts(self):
-        return self._parts
-
     def get_name(self):
         return self._name
 
@@ -88,9 +86,10 @@ class Asteroid(Actor):
                 scoreboard.add_points(self._points)
 
             # Do special effects ( explosion and sparks )
+            sparks = self._cast.get_first_actor("sparks")
             for part in self._parts:
                 # create an explosion at each parts position
-                explosion = Explosion(self._cast)
+                explosion = self._cast.acquire_actor("explosions")
                 explosion.set_text(".")
                 explosion.set_color(constants.WHITE)
                 explosion.set_velocity(
@@ -100,16 +99,10 @@ class Asteroid(Actor):
                 # add explosion to "explosions" cast group
                 self._cast.add_actor("explosions", explosion)
 
-                for i in range(0, 3):
-                    # create three sparks at each parts location
-                    spark = Spark(self._cast)
-                    spark.set_text(".")
-                    spark.set_color(constants.WHITE)
-                    spark.set_speed(random.choice([5, 8, 9, 10, ]))
-                    spark.set_direction(random.random()*360)
-                    spark.set_position(part.get_position())
-                    # add explosion to "explosions" cast group
-                    self._cast.add_actor("sparks", spark)
+                if sparks is not None:
+                    for i in range(0, 3):
+                        # create three sparks at each parts location
+                        sparks.emit(part.get_position(), random.choice([5, 8, 9, 10, ]), random.random()*360)
 
             # if this is a giant asteroid, generate some HUGE asteroids when we are broken:
             if self.get_name() == "GIANT":
@@ -140,7 +133,7 @@ class Asteroid(Actor):
         asteroid_type_info = constants.ASTEROID_TYPES_LIST[type]
         # update our member variables with that objects values
         self._name = asteroid_type_info["name"]
-        self._text = asteroid_type_info["text"]
+        self.set_text(asteroid_type_info["text"])
         self._health = asteroid_type_info["health"]
         self._damage = asteroid_type_info["damage"]
         self._points = asteroid_type_info["points"]
@@ -161,10 +154,8 @@ class Asteroid(Actor):
     def _prepare_structured_asteroid_body(self):
         """
         Creates the structure of actors to form a huge asteroid using a layout.
-        Stores each Actor reference in self._parts list.
+        Stores each part (a CompositePart) in self._parts list.
         """
-        # set origin position for layout
-        origin = self.get_position()
         # get layout information based on type/name
         if self._name == "HUGE":
             asteroid_layout = constants.HUGE_ASTEROID_LAYOUT
@@ -173,10 +164,9 @@ class Asteroid(Actor):
         # get layout color info
         asteroid_colors = [self.get_color()]
 
-        # generate structure from layout and store in parts list
-        self._parts = self._generate_structure(origin, self._velocity, asteroid_layout, asteroid_colors)
-        # add self to parts list as the center piece of the structure
-        self._parts.append(self)
+        # generate structure from layout around our position and store in parts list
+        # (with self added to the parts list as the center piece of the structure)
+        self.set_layout(asteroid_layout, asteroid_colors, include_self=True)
 
     def _create_asteroid_when_destroyed(self, asteroidtype):
         """
@@ -189,7 +179,7 @@ class Asteroid(Actor):
         # make it move randomly horizontally
         velocity = Point(random.randint(-1, 1) *constants.CELL_SIZE, 1 * constants.CELL_SIZE)
         asteroid = Asteroid(self._cast)
-        asteroid.set_color(self._color)
+        asteroid.set_color(self.get_color())
         asteroid.set_position(position)
         asteroid.set_velocity(velocity)
         # call it's set up type so it's attributes get applied
@@ -198,28 +188,34 @@ class Asteroid(Actor):
         return asteroid
 
     def move_next(self):
-        """ (OVERRIDE) Moves the actor to its next position according to its velocity. 
-        Will wrap the x position from one side of the screen to the other when it reaches the given maximum x.
-        Args:
-            max_x (int): The maximum x value.
+        """ (OVERRIDE) Moves the asteroid to its next position according to its velocity (see
+        move_all, which has the rules).
+        """
+        type(self).move_all([self])
+
+    @classmethod
+    def move_all(cls, asteroids):
+        """ (OVERRIDE) Moves every asteroid in a list to its next position according to its
+        velocity, in one loop. An asteroid only moves every few ticks (its move wait), wraps the
+        x position from one side of the screen to the other and is deleted near the bottom.
+        Large asteroids only move their origin (their parts are placed around it).
         """
-        # if the move wait timer is up
-        if self._move_timer == 0:
-            # reset move timer
-            self._move_timer = self._move_wait
-
-            # check if asteroid is off screen
-            if self._position.get_y() >= constants.MAX_Y - constants.CELL_SIZE * 2:
-                # delete it
-                self._cast.remove_actor("asteroids", self)
+        max_x = constants.MAX_X
+        bottom = constants.MAX_Y - constants.CELL_SIZE * 2
+        for asteroid in asteroids:
+            # if the move wait timer is up
+            if asteroid._move_timer == 0:
+                asteroid._move_timer = asteroid._move_wait
+                position = asteroid._position
+                # check if asteroid is off screen
+                if position._y >= bottom:
+                    # delete it
+                    asteroid._cast.remove_actor("asteroids", asteroid)
+                else:
+                    # otherwise apply movement (wrap x)
+                    velocity = asteroid._velocity
+                    position._x = (position._x + velocity._x) % max_x
+                    position._y += velocity._y
             else:
-                # otherwise apply movement to asteroid (all parts)
-                for part in self._parts:
-                    # wrap x
-                    x = (part._position.get_x() + self._velocity.get_x()) % constants.MAX_X
-                    y = (part._position.get_y() + self._velocity.get_y())
-                    # apply movement
-                    part._position = Point(x, y)
-        else:
-            # waiting a few frames before moving again
-            self._move_timer -= 1
+                # waiting a few frames before moving again
+                asteroid._move_timer -= 1
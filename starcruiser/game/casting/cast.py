@@ -1,32 +1,100 @@
+from itertools import chain
+
+# shared by every lookup of a group that doesn't exist, so a missing group never allocates
+EMPTY_GROUP = {}
+
+
 class Cast:
     """A collection of actors.
 
     The responsibility of a cast is to keep track of a collection of actors. It has methods for 
     adding, removing and getting them by a group name.
 
+    Each group is a dictionary whose keys are its actors (the values are unused). Dictionaries keep
+    insertion order, so a group still iterates in the order actors were added, while adding,
+    removing, finding and counting actors take the same time however big the group gets.
+
+    A group can also have an ActorPool. Actors removed from that group are given back to the
+    pool so they can be reused by acquire_actor.
+
+    The cast can also own an OccupancyRaster, a grid of which cells its actors are in. It is
+    brought up to date after the actors move (see MoveActorsAction) and shared by everything that
+    asks what is in a cell.
+
     Attributes:
-        _actors (dict): A dictionary of actors { key: group_name, value: a list of actors }
+        _actors (dict): A dictionary of actors { key: group_name, value: { key: actor, value: None } }
+        _pools (dict): A dictionary of pools { key: group_name, value: ActorPool }
+        _raster (OccupancyRaster): Which cells the actors are in (None if the cast has none).
     """
 
     def __init__(self):
         """Constructs a new Actor."""
         self._actors = {}
+        self._pools = {}
+        self._raster = None
+
+    def add_pool(self, group, pool):
+        """Gives a group a pool of reusable actors. Actors of the pool's kind that are removed from
+        the group are given back to the pool.
+
+        Args:
+            group (string): The name of the group.
+            pool (ActorPool): The pool.
+        """
+        self._pools[group] = pool
+
+    def get_pool(self, group):
+        """Gets the pool of the given group.
+
+        Args:
+            group (string): The name of the group.
+
+        Returns:
+            ActorPool: The pool (None if the group doesn't have one).
+        """
+        return self._pools.get(group)
+
+    def get_pool_stats(self):
+        """Gets the statistics of every pool.
+
+        Returns:
+            dict: { key: group name, value: ActorPool.get_stats() }
+        """
+        return {group: pool.get_stats() for group, pool in self._pools.items()}
+
+    def get_raster(self):
+        return self._raster
+
+    def set_raster(self, raster):
+        self._raster = raster
+
+    def acquire_actor(self, group):
+        """Gets a fresh actor from the given group's pool. The actor still has to be added to the
+        group with add_actor.
+
+        Args:
+            group (string): The name of the group.
+
+        Returns:
+            Actor: The actor.
+        """
+        return self._pools[group].acquire()
 
     def add_actor(self, group, actor):
-        """Adds an actor to the given group.
+        """Adds an actor to the given group (an actor already in the group is not added twice).
 
         Args:
             group (string): The name of the group.
             actor (Actor): The actor to add.
         """
-        if not group in self._actors.keys():
-            self._actors[group] = []
-
-        if not actor in self._actors[group]:
-            self._actors[group].append(actor)
+        actors = self._actors.get(group)
+        if actors is None:
+            actors = self._actors[group] = {}
+        actors[actor] = None
 
     def get_actors(self, group):
-        """Gets the actors in the given group.
+        """Gets a copy of the actors in the given group. Use this when actors may be added or
+        removed while looping through them; otherwise get_actors_view is cheaper.
 
         Args:
             group (string): The name of the group.
@@ -34,21 +102,55 @@ class Cast:
         Returns:
             List: The actors in the group.
         """
-        results = []
-        if group in self._actors.keys():
-            results = self._actors[group].copy()
-        return results
+        return list(self._actors.get(group, EMPTY_GROUP))
+
+    def get_actors_view(self, group):
+        """Gets the actors in the given group without copying them. The view always shows the
+        current actors, so the group must not change while looping through it.
+
+        Args:
+            group (string): The name of the group.
+
+        Returns:
+            Iterable: A read-only view of the actors in the group.
+        """
+        return self._actors.get(group, EMPTY_GROUP).keys()
+
+    def get_actor_count(self, group):
+        """Gets how many actors are in the given group.
+
+        Args:
+            group (string): The name of the group.
+
+        Returns:
+            int: The number of actors (0 if the group doesn't exist).
+        """
+        return len(self._actors.get(group, EMPTY_GROUP))
 
     def get_all_actors(self):
-        """Gets all of the actors in the cast.
+        """Gets a copy of all of the actors in the cast.
 
         Returns:
             List: All of the actors in the cast.
         """
-        results = []
-        for group in self._actors:
-            results.extend(self._actors[group])
-        return results
+        return list(self.get_all_actors_view())
+
+    def get_all_actors_view(self):
+        """Gets all of the actors in the cast without copying them. The cast must not change while
+        looping through them.
+
+        Returns:
+            Iterable: Every actor, group by group.
+        """
+        return chain.from_iterable(self._actors.values())
+
+    def get_groups(self):
+        """Gets the names of every group in the cast.
+
+        Returns:
+            List: The group names.
+        """
+        return list(self._actors.keys())
 
     def get_first_actor(self, group):
         """Gets the first actor in the given group.
@@ -57,12 +159,9 @@ class Cast:
             group (string): The name of the group.
 
         Returns:
-            List: The first actor in the group.
+            Actor: The first actor in the group (None if the group is empty or doesn't exist).
         """
-        result = None
-        if group in self._actors.keys():
-            result = self._actors[group][0]
-        return result
+        return next(iter(self._actors.get(group, EMPTY_GROUP)), None)
 
     def remove_actor(self, group, actor):
         """Removes an actor from the given group.
@@ -71,17 +170,29 @@ class Cast:
             group (string): The name of the group.
             actor (Actor): The actor to remove.
         """
-        if group in self._actors:
-            self._actors[group].remove(actor)
+        actors = self._actors.get(group)
+        if actors is not None and actor in actors:
+            del actors[actor]
+            # the raster still has the actor's cells until it is rebuilt
+            if self._raster is not None and self._raster.is_tracking(group):
+                self._raster.invalidate()
+            # give it back to the group's pool to be reused
+            pool = self._pools.get(group)
+            if pool is not None:
+                pool.release(actor)
 
     def remove_actors(self, group):
-        """Removes an actor from the given group.
+        """Removes all of the actors from the given group.
 
         Args:
             group (string): The name of the group.
-            actor (Actor): The actor to remove.
         """
-        actors = self.get_actors(group)
-        # remove all actors
-        for actor in actors:
-            self.remove_actor(group, actor)
+        actors = self._actors.get(group)
+        if actors is not None:
+            pool = self._pools.get(group)
+            if pool is not None:
+                for actor in actors:
+                    pool.release(actor)
+            actors.clear()
+            if self._raster is not None and self._raster.is_tracking(group):
+                self._raster.invalidate()
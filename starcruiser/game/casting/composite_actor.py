@@ -0,0 +1,152 @@
+from math import ceil, floor
+import constants
+from game.casting.actor import Actor
+from game.casting.appearance import Appearance
+from game.casting.composite_part import CompositePart
+
+
+class CompositeActor(Actor):
+    """An actor made of several characters laid out around one origin (ex: ship, ufo, large
+    asteroids).
+
+    The responsibility of CompositeActor is to keep its parts together. Only the origin (the
+    actor's own position) moves; each part is an offset from it, so moving a composite costs the
+    same however many parts it has. The parts are CompositePart views that work out their
+    position when drawing or a collision check asks for it.
+
+    The offsets and starting appearances of a layout are worked out once and shared by every
+    composite built from the same layout and colors. Each composite keeps its own list of part
+    appearances, so a single part can still change its text or color (like the ship's thrust).
+
+    Because the offsets never change, a composite also knows its bounding box and the set of
+    offsets its parts occupy, both relative to the origin (see get_bounds and get_offsets).
+    get_offsets_in uses them to find the parts inside a box: a box outside the bounding box is
+    turned away with four comparisons, and otherwise only the cells of the box are looked up in
+    the set, instead of checking every part.
+
+    Attributes:
+        _part_appearances (list): The Appearance of each part, in layout order.
+        _parts (list): The CompositePart of each layout entry (subclasses may add more actors).
+        _occupied (frozenset): The (x, y) offset of every part.
+        _bounds (tuple): The smallest and largest x and y offsets (left, top, right, bottom).
+    """
+
+    __slots__ = ("_part_appearances", "_parts", "_occupied", "_bounds")
+
+    # layouts already worked out { key: (layout, colors), value: (parts, occupied, bounds) }
+    _tables = {}
+
+    def __init__(self):
+        """Constructs a new CompositeActor with no parts."""
+        super().__init__()
+        self._part_appearances = []
+        self._parts = []
+        self._occupied = frozenset()
+        self._bounds = (0, 0, -1, -1)
+
+    def get_parts(self):
+        return self._parts
+
+    def remove_parts(self):
+        self._parts.clear()
+        self._occupied = frozenset()
+        self._bounds = (0, 0, -1, -1)
+
+    def has_layout(self):
+        """Whether the composite has been given a layout (otherwise it is a single actor)."""
+        return bool(self._occupied)
+
+    def get_bounds(self):
+        """Gets the bounding box of the parts, relative to the origin.
+
+        Returns:
+            Tuple(int, int, int, int): The smallest x, smallest y, largest x and largest y offset.
+        """
+        return self._bounds
+
+    def get_offsets(self):
+        """Gets where every part is, relative to the origin.
+
+        Returns:
+            frozenset: The (x, y) offset of every part (shared by composites with the same layout).
+        """
+        return self._occupied
+
+    def get_offsets_in(self, left, top, right, bottom):
+        """Gets the offsets of the parts inside a box, relative to the origin (edges included).
+        The box is checked against the bounding box first, so a box nowhere near the composite
+        costs four comparisons.
+
+        Args:
+            left (float): The smallest x offset of the box.
+            top (float): The smallest y offset of the box.
+            right (float): The largest x offset of the box.
+            bottom (float): The largest y offset of the box.
+
+        Returns:
+            list: The (x, y) offset of each part inside the box.
+        """
+        bounds_left, bounds_top, bounds_right, bounds_bottom = self._bounds
+        left = max(left, bounds_left)
+        top = max(top, bounds_top)
+        right = min(right, bounds_right)
+        bottom = min(bottom, bounds_bottom)
+        if left > right or top > bottom:
+            return []
+
+        # layouts are in whole cells, so only offsets on a cell corner can be parts
+        cell = constants.CELL_SIZE
+        found = []
+        for y in range(ceil(top / cell) * cell, floor(bottom / cell) * cell + 1, cell):
+            for x in range(ceil(left / cell) * cell, floor(right / cell) * cell + 1, cell):
+                if (x, y) in self._occupied:
+                    found.append((x, y))
+        return found
+
+    def set_layout(self, layout_list, color_list, include_self=False):
+        """Replaces the parts with the ones in a layout, placed around the current position.
+
+        Args:
+            layout_list (list): [text character, x, y, color reference] for each part, with x and
+                y in cells from the origin.
+            color_list (list): The colors the layout's color references point to.
+            include_self (bool): Whether the composite itself is also a part (drawn at the origin,
+                after the others).
+        """
+        table, occupied, bounds = CompositeActor.get_table(layout_list, color_list)
+        self._part_appearances = [appearance for x, y, appearance in table]
+        self._parts = [CompositePart(self, index, x, y) for index, (x, y, appearance)
+                       in enumerate(table)]
+        if include_self:
+            self._parts.append(self)
+            occupied = occupied | {(0, 0)}
+            left, top, right, bottom = bounds
+            bounds = (min(left, 0), min(top, 0), max(right, 0), max(bottom, 0))
+        self._occupied = occupied
+        self._bounds = bounds
+
+    @classmethod
+    def get_table(cls, layout_list, color_list):
+        """Gets the shared offsets and appearances of a layout, working them out the first time.
+
+        Args:
+            layout_list (list): [text character, x, y, color reference] for each part.
+            color_list (list): The colors the layout's color references point to.
+
+        Returns:
+            tuple: The (x offset, y offset, Appearance) of each part in screen coordinates, the
+                frozenset of (x offset, y offset) and the bounds (left, top, right, bottom).
+        """
+        key = (tuple(tuple(part) for part in layout_list), tuple(color_list))
+        table = cls._tables.get(key)
+        if table is None:
+            parts = tuple(
+                (part[1] * constants.CELL_SIZE, part[2] * constants.CELL_SIZE,
+                 Appearance.get(part[0], constants.FONT_SIZE, color_list[part[3]]))
+                for part in layout_list)
+            occupied = frozenset((x, y) for x, y, appearance in parts)
+            xs = [x for x, y in occupied]
+            ys = [y for x, y in occupied]
+            bounds = (min(xs), min(ys), max(xs), max(ys))
+            table = cls._tables[key] = (parts, occupied, bounds)
+        return table
@@ -0,0 +1,111 @@
+import constants
+from game.shared.point import Point
+
+
+class CompositePart:
+    """One part of a CompositeActor, seen as if it were an actor of its own.
+
+    The responsibility of CompositePart is to answer the questions drawing and collision checks
+    ask an actor (where is it, what does it look like, how fast is it going) for one entry of its
+    composite's layout. A part stores no position of its own: it is worked out from the
+    composite's origin and the part's offset when it is asked for, so moving the composite never
+    has to touch its parts.
+
+    Attributes:
+        _owner (CompositeActor): The composite this part belongs to.
+        _index (int): Which entry of the composite's layout this part is.
+        _offset_x (int): How far right of the composite's origin the part is.
+        _offset_y (int): How far below the composite's origin the part is.
+        _position (Point): Reused to hand out the part's position.
+        _last_position (Point): Reused to hand out the part's position at the start of the tick.
+    """
+
+    __slots__ = ("_owner", "_index", "_offset_x", "_offset_y", "_position", "_last_position")
+
+    def __init__(self, owner, index, offset_x, offset_y):
+        """Constructs a new CompositePart.
+
+        Args:
+            owner (CompositeActor): The composite this part belongs to.
+            index (int): Which entry of the composite's layout this part is.
+            offset_x (int): How far right of the composite's origin the part is.
+            offset_y (int): How far below the composite's origin the part is.
+        """
+        self._owner = owner
+        self._index = index
+        self._offset_x = offset_x
+        self._offset_y = offset_y
+        self._position = Point(0, 0)
+        self._last_position = Point(0, 0)
+
+    def get_position(self):
+        """Gets the part's position, worked out from its composite's origin. The point is reused
+        by the next call, so copy its values to keep them.
+
+        Returns:
+            Point: The part's position in 2d space.
+        """
+        origin = self._owner._position
+        return self._position.set((origin._x + self._offset_x) % constants.MAX_X,
+                                  origin._y + self._offset_y)
+
+    def get_last_position(self):
+        """Gets where the part was at the start of the current tick, worked out from where its
+        composite was. The point is reused by the next call, so copy its values to keep them.
+
+        Returns:
+            Point: The position at the start of the tick (None if the composite's hasn't been
+                saved yet).
+        """
+        last = self._owner.get_last_position()
+        if last is None:
+            return None
+        return self._last_position.set((last._x + self._offset_x) % constants.MAX_X,
+                                       last._y + self._offset_y)
+
+    def get_interpolated_position(self, amount):
+        """Gets a position part-way between where the part was at the start of the tick and where
+        it is now, by offsetting the composite's interpolated position.
+
+        Args:
+            amount (float): How far between the two positions (0 = last position, 1 = current).
+
+        Returns:
+            Tuple(float, float): The x and y screen coordinates.
+        """
+        x, y = self._owner.get_interpolated_position(amount)
+        return ((x + self._offset_x) % constants.MAX_X, y + self._offset_y)
+
+    def get_velocity(self):
+        """Gets the part's speed and direction, which is its composite's.
+
+        Returns:
+            Point: The composite's velocity.
+        """
+        return self._owner._velocity
+
+    def get_appearance(self):
+        return self._owner._part_appearances[self._index]
+
+    def get_text(self):
+        return self._owner._part_appearances[self._index]._text
+
+    def get_font_size(self):
+        return self._owner._part_appearances[self._index]._font_size
+
+    def get_color(self):
+        return self._owner._part_appearances[self._index]._color
+
+    def set_text(self, text):
+        """Updates the part's text (only this part changes)."""
+        appearances = self._owner._part_appearances
+        appearances[self._index] = appearances[self._index].with_text(text)
+
+    def set_color(self, color):
+        """Updates the part's color (only this part changes)."""
+        appearances = self._owner._part_appearances
+        appearances[self._index] = appearances[self._index].with_color(color)
+
+    def save_position(self):
+        """Nothing to remember, the composite remembers its origin."""
+        pass
@@ -1,7 +1,14 @@
 from math import floor
 import constants
 from game.casting.actor import Actor
-from game.shared.point import Point
+from game.casting.appearance import Appearance
+
+# text characters that are dislpayed in succession as an animation
+FRAME_TEXT_ANIMATION = [".", "*", "@", "0", "()"]
+# references to colors that are displayed in succession as an animation
+FRAME_COLOR_ANIMATION = [0, 1, 2, 3, 3]
+# list of the colors used by this animation
+FRAME_COLORS = [constants.WHITE, constants.YELLOW, constants.ORANGE, constants.RED]
 
 
 class Explosion(Actor):
@@ -12,38 +19,57 @@ class Explosion(Actor):
 
     Attributes:
         frame (int): the frame of the animation
-        frame_text_animation (list of strings): text characters that are dislpayed in succession as an animation
-        frame_color_animation (list of ints): references to colors that are displayed in succession as an animation
-        frame_colors (list of Colors): list of the colors used by this animation
+        frame_appearances (list of Appearances): the look of each animation frame (shared by all explosions)
         animate_speed (float): the rate at which to progress the animation frames
     """
 
+    __slots__ = ("_cast", "_frame", "_animate_speed")
+
+    _frame_appearances = [Appearance.get(text, constants.FONT_SIZE, FRAME_COLORS[color])
+                          for text, color in zip(FRAME_TEXT_ANIMATION, FRAME_COLOR_ANIMATION)]
+
     def __init__(self, cast):
         super().__init__()
         self._cast = cast
 
         self._frame = 0
-        self._frame_text_animation = [".", "*", "@", "0", "()"]
-        self._frame_color_animation = [0, 1, 2, 3, 3]
-        self._frame_colors = [constants.WHITE,constants.YELLOW, constants.ORANGE, constants.RED]
+        self._animate_speed = 1
+
+    def reset(self):
+        """ (OVERRIDE) Resets the explosion for reuse
+        """
+        super().reset()
+        self._frame = 0
         self._animate_speed = 1
 
     def set_animate_speed(self, speed):
         self._animate_speed = speed
 
     def move_next(self):
-        """ (OVERRIDE) Animates an explosion that also moves
+        """ (OVERRIDE) Animates an explosion that also moves (see move_all, which has the rules)
+        """
+        type(self).move_all([self])
+
+    @classmethod
+    def move_all(cls, explosions):
+        """ (OVERRIDE) Animates and moves every explosion in a list, in one loop. An explosion
+        deletes itself once its animation is complete
         """
-        if self._frame >= len(self._frame_text_animation):
-            # after animation is complete delete ourself
-            self._cast.remove_actor("explosions", self)
-        else:  
-            # continue animation (update visuals)
-            self.set_text(self._frame_text_animation[floor(self._frame)])
-            self.set_color(self._frame_colors[self._frame_color_animation[floor(self._frame)]])
-            # increment frame by speed
-            self._frame += self._animate_speed
-            # move location
-            x = (self._position.get_x() + self._velocity.get_x()) % constants.MAX_X
-            y = (self._position.get_y() + self._velocity.get_y()) % constants.MAX_Y
-            self._position = Point(x, y)
+        max_x = constants.MAX_X
+        max_y = constants.MAX_Y
+        frame_appearances = cls._frame_appearances
+        frame_count = len(frame_appearances)
+        for explosion in explosions:
+            if explosion._frame >= frame_count:
+                # after animation is complete delete it
+                explosion._cast.remove_actor("explosions", explosion)
+            else:
+                # continue animation (update visuals)
+                explosion._appearance = frame_appearances[floor(explosion._frame)]
+                # increment frame by speed
+                explosion._frame += explosion._animate_speed
+                # move location
+                position = explosion._position
+                velocity = explosion._velocity
+                position._x = (position._x + velocity._x) % max_x
+                position._y = (position._y + velocity._y) % max_y
@@ -1,6 +1,5 @@
 import constants
 from game.casting.actor import Actor
-from game.shared.point import Point
 
 
 class Laser(Actor):
@@ -13,12 +12,20 @@ class Laser(Actor):
         damage (int): how powerful this laser is (how much damage it does to enemies)
     """
 
+    __slots__ = ("_cast", "_damage")
+
     def __init__(self, cast):
         super().__init__()
         self._cast = cast
         # default
         self._damage = 1
 
+    def reset(self):
+        """ (OVERRIDE) Resets the laser for reuse
+        """
+        super().reset()
+        self._damage = 1
+
     def get_damage(self):
         return self._damage
         
@@ -27,18 +34,30 @@ class Laser(Actor):
 
     
     def move_next(self):
-        """ (OVERRIDE) Moves the laser to its next position according to its velocity. 
-        Will wrap the x position from one side of the screen to the other when it reaches the given maximum x.
+        """ (OVERRIDE) Moves the laser to its next position according to its velocity (see
+        move_all, which has the rules).
+        """
+        type(self).move_all([self])
+
+    @classmethod
+    def move_all(cls, lasers):
+        """ (OVERRIDE) Moves every laser in a list to its next position according to its
+        velocity, in one loop. Wraps the x position from one side of the screen to the other and
+        deletes lasers that go off the top or bottom of the screen
         Args:
-            max_x (int): The maximum x value.
+            lasers (list): The lasers to move.
         """
-        # determine movement (wrap x)
-        x = (self._position.get_x() + self._velocity.get_x()) % constants.MAX_X
-        y = (self._position.get_y() + self._velocity.get_y())
-        # if laser goes off the top of the screen
-        if y <= 0 or y >= constants.MAX_Y:
-            # delete it
-            self._cast.remove_actor("lasers", self)
-        else:
-            # apply movement
-            self._position = Point(x, y)
+        max_x = constants.MAX_X
+        max_y = constants.MAX_Y
+        for laser in lasers:
+            position = laser._position
+            velocity = laser._velocity
+            y = position._y + velocity._y
+            # if laser goes off the top of the screen
+            if y <= 0 or y >= max_y:
+                # delete it
+                laser._cast.remove_actor("lasers", laser)
+            else:
+                # apply movement (wrap x)
+                position._x = (position._x + velocity._x) % max_x
+                position._y = y
@@ -2,7 +2,6 @@ import constants
 from game.casting.actor import Actor
 from game.shared.point import Point
 import random
-from game.casting.upgrade import Upgrade
 
 
 class Score(Actor):
@@ -17,6 +16,8 @@ class Score(Actor):
         _points (int): The points earned in the game.
     """
 
+    __slots__ = ("_points", "_cast", "_upgrade_list", "_upgrade_progress")
+
     def __init__(self, cast):
         super().__init__()
         self._points = 0
@@ -61,7 +62,7 @@ class Score(Actor):
         text = "+"  # cross keyboard symbol (for health)
         color = constants.YELLOW
         # apply attributes to a new instance of laser
-        upgrade = Upgrade(self._cast)
+        upgrade = self._cast.acquire_actor("upgrades")
         upgrade.set_position(position)
         upgrade.set_velocity(velocity)
         upgrade.set_text(text)
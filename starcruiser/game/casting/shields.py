@@ -12,6 +12,8 @@ class Shields(Actor):
         color_toggle (int): used by flash_timer
     """
 
+    __slots__ = ("_points", "_flash_timer", "_wait_flash", "_color_toggle")
+
     def __init__(self):
         super().__init__()
         # default amount of points
@@ -1,9 +1,9 @@
 import constants
-from game.casting.actor import Actor
+from game.casting.composite_actor import CompositeActor
 from game.shared.point import Point
 
 
-class Ship(Actor):
+class Ship(CompositeActor):
     """
     A spaceship
 
@@ -19,9 +19,11 @@ class Ship(Actor):
         
     """
 
+    __slots__ = ("_is_hurt", "_is_hurt_timer", "_flash_color", "_gun_type",
+                 "_upgrade_shots")
+
     def __init__(self):
         super().__init__() 
-        self._parts = []
         # prepare ship structure and save actors to parts list
         self._prepare_ship()
         # default values
@@ -62,12 +64,6 @@ class Ship(Actor):
         if is_hurt == True:
             self._is_hurt_timer = 10
 
-    def get_parts(self):
-        return self._parts
-
-    def remove_parts(self):
-        self._parts.clear()
-
     def reset_ship(self):
         # resets the ship to display again
         self._is_hurt = False
@@ -80,17 +76,8 @@ class Ship(Actor):
         # make sure the body exists
         if len(self._parts) > 0:
 
-            # move all parts
-            for part in self._parts:
-                # set velocity of all ship parts
-                part.set_velocity(self._velocity)
-                # apply base move_next() method of Actor class
-                part.move_next()
-            
-            # move ship origin point as well
-            x = (self._position.get_x() + self._velocity.get_x()) % constants.MAX_X
-            y = (self._position.get_y() + self._velocity.get_y()) % constants.MAX_Y
-            self._position = Point(x, y)
+            # move the ship origin point (the parts are placed around it)
+            self._position.iadd(self._velocity).wrap(constants.MAX_X, constants.MAX_Y)
 
             # HANDLE ANIMATIONS - - - - - - - 
             # animate thrust (seventh part)
@@ -142,4 +129,4 @@ class Ship(Actor):
 
         self.set_position(Point(x,y))
         # generate parts list based on layout
-        self._parts = self._generate_structure(Point(x, y), Point(0, 0), constants.SHIP_LAYOUT, constants.SHIP_COLORS)
+        self.set_layout(constants.SHIP_LAYOUT, constants.SHIP_COLORS)
@@ -0,0 +1,137 @@
+from array import array
+from math import cos, sin, radians
+import random
+import constants
+from game.casting.actor import Actor
+
+# how much brightness a spark can lose each tick (one is picked at random for every spark)
+DIM_SPEEDS = [5, 8, 12]
+
+
+class SparkSystem(Actor):
+    """
+    Every spark on the screen
+
+    The responsibility of SparkSystem is to move, dim and remove sparks. Instead of one actor per
+    spark it keeps each value in its own array (x positions, y positions, velocities,
+    brightness...), so a spark is just an index and updating thousands of them is one loop over
+    numbers. A spark moves in a straight line and fades from white to black, then disappears, or
+    disappears when it leaves the screen.
+
+    Only one SparkSystem is needed; it lives in the "sparks" cast group.
+
+    Attributes:
+        _x (array of floats): x screen coordinate of each spark
+        _y (array of floats): y screen coordinate of each spark
+        _last_x (array of floats): x coordinate of each spark before its last move (for drawing)
+        _last_y (array of floats): y coordinate of each spark before its last move (for drawing)
+        _velocity_x (array of floats): how far each spark moves across per tick
+        _velocity_y (array of floats): how far each spark moves down per tick
+        _bright (array of ints): brightness of each spark 255=white 0=black
+        _dim_speed (array of ints): how quickly the brightness of each spark fades
+    """
+
+    __slots__ = ("_x", "_y", "_last_x", "_last_y", "_velocity_x",
+                 "_velocity_y", "_bright", "_dim_speed")
+
+    def __init__(self):
+        super().__init__()
+        self.set_text(".")
+        self._x = array("d")
+        self._y = array("d")
+        self._last_x = array("d")
+        self._last_y = array("d")
+        self._velocity_x = array("d")
+        self._velocity_y = array("d")
+        self._bright = array("i")
+        self._dim_speed = array("i")
+
+    def emit(self, position, speed, direction):
+        """Creates a new white spark.
+
+        Args:
+            position (Point): where the spark starts
+            speed (float): how far the spark moves each tick
+            direction (float): direction in degrees the spark moves in
+        """
+        x = position.get_x()
+        y = position.get_y()
+        angle = radians(direction)
+        self._x.append(x)
+        self._y.append(y)
+        self._last_x.append(x)
+        self._last_y.append(y)
+        # the direction never changes, so work out the movement once
+        self._velocity_x.append(speed * cos(angle))
+        self._velocity_y.append(speed * sin(angle))
+        self._bright.append(255)
+        self._dim_speed.append(random.choice(DIM_SPEEDS))
+
+    def get_count(self):
+        """Gets how many sparks there are.
+
+        Returns:
+            int: The number of sparks.
+        """
+        return len(self._x)
+
+    def get_sparks(self):
+        """Gets the arrays that describe the sparks, for drawing. The same index in each array is
+        the same spark.
+
+        Returns:
+            Tuple: (x, y, last x, last y, brightness) arrays.
+        """
+        return (self._x, self._y, self._last_x, self._last_y, self._bright)
+
+    def clear(self):
+        """Removes every spark."""
+        for values in (self._x, self._y, self._last_x, self._last_y,
+                       self._velocity_x, self._velocity_y, self._bright, self._dim_speed):
+            del values[:]
+
+    def save_position(self):
+        """ (OVERRIDE) Sparks remember their last position as they move (see move_next)
+        """
+        pass
+
+    def move_next(self):
+        """ (OVERRIDE) Moves and dims every spark, and removes those that are outside the window
+        or have faded to black
+        """
+        x = self._x
+        y = self._y
+        last_x = self._last_x
+        last_y = self._last_y
+        velocity_x = self._velocity_x
+        velocity_y = self._velocity_y
+        bright = self._bright
+        dim_speed = self._dim_speed
+        max_x = constants.MAX_X
+        max_y = constants.MAX_Y
+
+        # sparks that are still alive are moved down to index "kept", so the dead ones end up
+        # at the end of the arrays where they are cut off in one go
+        kept = 0
+        for i in range(len(x)):
+            spark_x = x[i]
+            spark_y = y[i]
+            brightness = bright[i]
+            # skip (remove) sparks outside the screen or with no brightness left
+            if spark_x >= max_x or spark_x <= 0 or spark_y <= 0 or spark_y >= max_y or brightness <= 0:
+                continue
+
+            last_x[kept] = spark_x
+            last_y[kept] = spark_y
+            x[kept] = round(spark_x + velocity_x[i])
+            y[kept] = round(spark_y + velocity_y[i])
+            velocity_x[kept] = velocity_x[i]
+            velocity_y[kept] = velocity_y[i]
+            # dim spark brightness over time, no less than zero
+            bright[kept] = max(brightness - dim_speed[i], 0)
+            dim_speed[kept] = dim_speed[i]
+            kept += 1
+
+        if kept < len(x):
+            for values in (x, y, last_x, last_y, velocity_x, velocity_y, bright, dim_speed):
+                del values[kept:]
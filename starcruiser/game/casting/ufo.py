@@ -1,13 +1,10 @@
 
 import constants
 import random
-from game.casting.actor import Actor
+from game.casting.composite_actor import CompositeActor
 from game.shared.point import Point
-from game.casting.explosion import Explosion
-from game.casting.spark import Spark
-from game.casting.laser import Laser
 
-class Ufo(Actor):
+class Ufo(CompositeActor):
     """
     Ufo are objects that fly back and forth in space and shoot lasers at the player ship
 
@@ -22,6 +19,9 @@ class Ufo(Actor):
         parts (list): list of individual parts of a large structured asteroid
     """
 
+    __slots__ = ("_cast", "_health", "_damage", "_points", "_hit_sound",
+                 "_exp_sound", "_shoot_wait", "_audio_service")
+
     def __init__(self, cast, audio_service):
         super().__init__()
         self._cast = cast
@@ -42,9 +42,6 @@ class Ufo(Actor):
         # allow ufo to play a flying loop sound
         self._audio_service = audio_service
 
-    def get_parts(self):
-        return self._parts
-
     def get_hit_sound(self):
         return self._hit_sound
 
@@ -79,9 +76,10 @@ class Ufo(Actor):
                 scoreboard.add_points(self._points)
 
             # Do special effects ( explosion and sparks )
+            sparks = self._cast.get_first_actor("sparks")
             for part in self._parts:
                 # create an explosion at each parts position
-                explosion = Explosion(self._cast)
+                explosion = self._cast.acquire_actor("explosions")
                 explosion.set_text(".")
                 explosion.set_color(constants.WHITE)
                 explosion.set_velocity(
@@ -91,16 +89,10 @@ class Ufo(Actor):
                 # add explosion to "explosions" cast group
                 self._cast.add_actor("explosions", explosion)
 
-                for i in range(0, 3):
-                    # create three sparks at each parts location
-                    spark = Spark(self._cast)
-                    spark.set_text(".")
-                    spark.set_color(constants.WHITE)
-                    spark.set_speed(random.choice([5, 8, 9, 10, ]))
-                    spark.set_direction(random.random()*360)
-                    spark.set_position(part.get_position())
-                    # add explosion to "explosions" cast group
-                    self._cast.add_actor("sparks", spark)
+                if sparks is not None:
+                    for i in range(0, 3):
+                        # create three sparks at each parts location
+                        sparks.emit(part.get_position(), random.choice([5, 8, 9, 10, ]), random.random()*360)
 
             # remove ourselves
             self._cast.remove_actor("ufos", self)
@@ -114,18 +106,22 @@ class Ufo(Actor):
     def _prepare_structured_ufo_body(self):
         """
         Creates the structure of actors to form a ufo ship using a layout.
-        Stores each Actor reference in self._parts list.
+        Stores each part (a CompositePart) in self._parts list.
         """
-        # set origin position for layout
-        origin = self.get_position()
-        # get layout information to draw ufo
-        ufo_layout = constants.UFO_LAYOUT
-        ufo_colors = constants.UFO_COLORS
-        # generate structure from layout and store in parts list
-        self._parts = self._generate_structure(origin, self._velocity, ufo_layout, ufo_colors)
-        # add self to front of parts list as the center piece of the structure
-        self._parts.append(self)#insert(0, self)
+        # generate structure from layout around our position and store in parts list
+        # (with self added to the end of the parts list as the center piece of the structure)
+        self.set_layout(constants.UFO_LAYOUT, constants.UFO_COLORS, include_self=True)
+
 
+    def _is_ship_below(self):
+        """Whether the ship's center is within 3 cells of our x position.
+
+        This asks the ship where it is now rather than using the cast's OccupancyRaster: ufos aim
+        while the actors are still moving, and the raster is only brought up to date once they
+        have all moved (see MoveActorsAction).
+        """
+        ship = self._cast.get_first_actor("ships")
+        return abs(ship.get_position().get_x() - self._position._x) < 3 * constants.CELL_SIZE
 
     def move_next(self):
         """ (OVERRIDE) Moves the actor to its next position according to its velocity. 
@@ -153,26 +149,19 @@ class Ufo(Actor):
             else:
                 self._velocity._y = 0
 
-            # apply movement to ufo (all parts)
-            for part in self._parts:
-                # wrap x
-                x = (part._position.get_x() + self._velocity.get_x()) % constants.MAX_X
-                y = (part._position.get_y() + self._velocity.get_y())
-                # apply movement
-                part._position = Point(x, y)
+            # apply movement to ufo (wrap x, the parts are placed around it)
+            self._position.iadd(self._velocity).wrap(constants.MAX_X)
 
             # handle shooting
             if self._shoot_wait > 0:
                 # increment the shoot timer
                 self._shoot_wait -= 1
             else:
-                # if the timer is zero
-                ship = self._cast.get_first_actor("ships")
-                # check to see if the ship is below our x position (within 3cells away)
-                if abs(ship.get_position().get_x() - self._position._x) < 3 * constants.CELL_SIZE:
+                # if the timer is zero, check to see if the ship is below us
+                if self._is_ship_below():
                     if self._shoot_wait == 0:
                         # apply attributes to a new instance of laser
-                        laser = Laser(self._cast)
+                        laser = self._cast.acquire_actor("lasers")
                         laser.set_position(Point(self._position._x,self._position._y+constants.CELL_SIZE))
                         laser.set_velocity(Point(0,constants.CELL_SIZE))
                         laser.set_text("|")
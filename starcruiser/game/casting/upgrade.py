@@ -1,6 +1,5 @@
 import constants
 from game.casting.actor import Actor
-from game.shared.point import Point
 from game.shared.color import Color
 from math import cos, sin, radians
 
@@ -15,12 +14,21 @@ class Upgrade(Actor):
     color_fade (float): used to oscillate the color to make it noticable to the player
     """
 
+    __slots__ = ("_cast", "_type", "_color_fade")
+
     def __init__(self, cast):
         super().__init__()
         self._cast = cast
         self._type = "shield"
         self._color_fade = 0
 
+    def reset(self):
+        """ (OVERRIDE) Resets the upgrade for reuse
+        """
+        super().reset()
+        self._type = "shield"
+        self._color_fade = 0
+
     def get_type(self):
         return self._type
         
@@ -35,26 +43,34 @@ class Upgrade(Actor):
 
 
     def move_next(self):
-        """ (OVERRIDE) moves sparks and destroys when outside window
+        """ (OVERRIDE) moves the upgrade and destroys it when outside window (see move_all,
+        which has the rules)
+        """
+        type(self).move_all([self])
+
+    @classmethod
+    def move_all(cls, upgrades):
+        """ (OVERRIDE) Moves and recolors every upgrade in a list, in one loop. Upgrades are
+        destroyed once they are outside the window
         """
-        if self._position._x > constants.MAX_X or self._position._x < 0 or self._position._y < 0 or self._position._y > constants.MAX_Y:
-            # after animation is complete delete ourself
-            self._cast.remove_actor("upgrades", self)
-        else:
+        max_x = constants.MAX_X
+        max_y = constants.MAX_Y
+        for upgrade in upgrades:
+            position = upgrade._position
+            if position._x > max_x or position._x < 0 or position._y < 0 or position._y > max_y:
+                # delete it once it is off screen
+                upgrade._cast.remove_actor("upgrades", upgrade)
+            else:
                 # move
-                x = round(self._position.get_x() + self._velocity.get_x())
-                y = round(self._position.get_y() + self._velocity.get_y())
-                self._position = Point(x, y)
-
-
-        # make the upgrade oscillate its color as it falls
-        self._color_fade += 0.3
-        # generate values
-        r = abs(round(cos(self._color_fade)*255))
-        g = abs(round(sin(self._color_fade)*255))
-        b = 0
-        # update the color
-        self.set_color(Color(r,g,b))
+                velocity = upgrade._velocity
+                position._x = round(position._x + velocity._x)
+                position._y = round(position._y + velocity._y)
+
+            # make the upgrade oscillate its color as it falls
+            upgrade._color_fade += 0.3
+            r = abs(round(cos(upgrade._color_fade)*255))
+            g = abs(round(sin(upgrade._color_fade)*255))
+            upgrade._appearance = upgrade._appearance.with_color(Color.get(r, g, 0))
         
 
 
@@ -0,0 +1,49 @@
+class ActionHook:
+    """Something that watches the director run the script.
+
+    The responsibility of ActionHook is to be told before and after every group of actions and
+    every single action the director executes, for example to time them. The base class does
+    nothing; subclasses override only the methods they need.
+    """
+
+    def before_group(self, group, cast, script):
+        """Called before the director executes the actions in a group.
+
+        Args:
+            group (string): The action group name.
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        pass
+
+    def before_action(self, group, action, cast, script):
+        """Called right before the director calls execute on an action.
+
+        Args:
+            group (string): The action group name.
+            action (Action): The action about to be executed.
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        pass
+
+    def after_action(self, group, action, cast, script):
+        """Called right after an action's execute returns.
+
+        Args:
+            group (string): The action group name.
+            action (Action): The action that was executed.
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        pass
+
+    def after_group(self, group, cast, script):
+        """Called after the director has executed every action in a group.
+
+        Args:
+            group (string): The action group name.
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        pass
@@ -0,0 +1,117 @@
+from time import perf_counter
+import constants
+from game.directing.action_hook import ActionHook
+from game.shared.rolling_histogram import RollingHistogram
+
+
+class ActionProfiler(ActionHook):
+    """Times every action and every group of actions while the game runs.
+
+    The responsibility of ActionProfiler is to keep rolling timing histograms for each action
+    (by class name, e.g. MoveActorsAction) and each action group, and to work out which action
+    is to blame when a frame takes longer than its budget. Add it to a director with
+    Director.add_hook(); its numbers can be read at any time while the game is running.
+
+    A frame is everything the director runs between one "output" group and the next, so it
+    includes every tick that frame had to catch up on.
+
+    Attributes:
+        _window (int): How many recent samples each histogram keeps.
+        _budget (float): How many seconds a frame may take before it counts as an overrun.
+        _actions (dict): { key: action name, value: RollingHistogram }
+        _groups (dict): { key: group name, value: RollingHistogram }
+        _overruns (dict): { key: action name, value: how many overrun frames it was the slowest in }
+        _frame_actions (dict): { key: action name, value: seconds spent in it this frame }
+        _action_start (float): When the current action started (perf_counter seconds).
+        _group_start (float): When the current group started (perf_counter seconds).
+    """
+
+    def __init__(self, window=constants.PROFILER_WINDOW, budget=constants.FRAME_BUDGET):
+        """Constructs a new ActionProfiler.
+
+        Args:
+            window (int): How many recent samples each histogram keeps (None keeps them all).
+            budget (float): How many seconds a frame may take before it counts as an overrun.
+        """
+        self._window = window
+        self._budget = budget
+        self._actions = {}
+        self._groups = {}
+        self._overruns = {}
+        self._frame_actions = {}
+        self._action_start = 0.0
+        self._group_start = 0.0
+
+    def before_group(self, group, cast, script):
+        self._group_start = perf_counter()
+
+    def before_action(self, group, action, cast, script):
+        self._action_start = perf_counter()
+
+    def after_action(self, group, action, cast, script):
+        elapsed = perf_counter() - self._action_start
+        name = type(action).__name__
+        histogram = self._actions.get(name)
+        if histogram is None:
+            histogram = self._actions[name] = RollingHistogram(self._window)
+        histogram.add(elapsed)
+        self._frame_actions[name] = self._frame_actions.get(name, 0.0) + elapsed
+
+    def after_group(self, group, cast, script):
+        elapsed = perf_counter() - self._group_start
+        histogram = self._groups.get(group)
+        if histogram is None:
+            histogram = self._groups[group] = RollingHistogram(self._window)
+        histogram.add(elapsed)
+
+        # the output group ends the frame
+        if group == "output":
+            self._finish_frame()
+
+    def _finish_frame(self):
+        """Works out who to blame if the frame's actions took longer than the budget."""
+        frame_time = sum(self._frame_actions.values())
+        if frame_time > self._budget and self._frame_actions:
+            slowest = max(self._frame_actions, key=self._frame_actions.get)
+            self._overruns[slowest] = self._overruns.get(slowest, 0) + 1
+        self._frame_actions = {}
+
+    def get_action_stats(self):
+        """Gets the timing of every action that has run.
+
+        Returns:
+            dict: { key: action name, value: RollingHistogram.get_stats() }
+        """
+        return {name: histogram.get_stats() for name, histogram in self._actions.items()}
+
+    def get_group_stats(self):
+        """Gets the timing of every action group that has run.
+
+        Returns:
+            dict: { key: group name, value: RollingHistogram.get_stats() }
+        """
+        return {name: histogram.get_stats() for name, histogram in self._groups.items()}
+
+    def get_overruns(self):
+        """Gets how many over-budget frames each action was the slowest part of.
+
+        Returns:
+            dict: { key: action name, value: number of frames }
+        """
+        return dict(self._overruns)
+
+    def get_report(self):
+        """Gets a readable summary, slowest action first.
+
+        Returns:
+            list of strings: One line per action and group, then the overruns.
+        """
+        lines = []
+        for kind, stats in [("action", self.get_action_stats()), ("group", self.get_group_stats())]:
+            for name, stat in sorted(stats.items(), key=lambda item: -item[1]["total_ms"]):
+                lines.append(f"{kind} {name}: {stat['calls']} calls, mean {stat['mean_ms']:.3f} ms, "
+                             f"p50 {stat['p50_ms']:.3f} ms, p99 {stat['p99_ms']:.3f} ms, "
+                             f"max {stat['max_ms']:.3f} ms")
+        for name, count in sorted(self._overruns.items(), key=lambda item: -item[1]):
+            lines.append(f"over budget: {name} was the slowest action in {count} frames")
+        return lines
@@ -0,0 +1,112 @@
+from time import perf_counter
+from game.directing.action_profiler import ActionProfiler
+from game.directing.director import Director
+
+
+class BenchmarkDirector(Director):
+    """A director that measures the game while it directs it.
+
+    The responsibility of BenchmarkDirector is to run a Scenario through the normal game loop and
+    record how long every frame and every action takes, and how many actors each cast group
+    holds, grouped by the scenario's sections. Each section has its own ActionProfiler, which is
+    swapped in as a hook when the section starts. The section profilers keep every sample, so
+    their percentiles cover the whole section, not just its last few hundred ticks.
+
+    Attributes:
+        _scenario (Scenario): The scenario being run.
+        _tick (int): Ticks since the game started (-1 while the menu is still showing).
+        _section (dict): The measurements of the section the current tick belongs to.
+        _profiler (ActionProfiler): The profiler of the current section (added as a hook).
+        _sections (dict): { key: section name, value: measurements }
+        _frame_start (float): When the current frame started (perf_counter seconds).
+    """
+
+    def __init__(self, video_service, keyboard_service, scenario):
+        """Constructs a new BenchmarkDirector.
+
+        Args:
+            video_service (NullVideoService): An instance of NullVideoService.
+            keyboard_service (ScriptedKeyboardService): Plays the scenario's key script.
+            scenario (Scenario): The scenario to run.
+        """
+        super().__init__(video_service, keyboard_service)
+        self._scenario = scenario
+        self._tick = -1
+        self._section = None
+        self._profiler = None
+        self._sections = {}
+        self._frame_start = 0
+
+    def get_sections(self):
+        """Gets the raw measurements of every section.
+
+        Returns:
+            dict: { key: section name, value: { "frame_times": list of seconds,
+                "draw_calls": list of ints, "peak_actors": { group: count },
+                "profiler": ActionProfiler } }
+        """
+        return self._sections
+
+    def get_ticks(self):
+        """Gets how many ticks ran after the game started."""
+        return max(self._tick, 0)
+
+    def _execute_actions(self, group, cast, script):
+        """(OVERRIDE) Calls execute for each action in the given group and records the frame once
+        the output actions have run. The section's profiler times the actions themselves.
+
+        Args:
+            group (string): The action group name.
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        if group == "input":
+            self._start_tick(cast, script)
+
+        super()._execute_actions(group, cast, script)
+
+        if group == "update":
+            self._finish_tick(cast, script)
+
+        if group == "output":
+            self._section["frame_times"].append(perf_counter() - self._frame_start)
+            self._section["draw_calls"].append(self._video_service.get_frame_draw_calls())
+
+    def _start_tick(self, cast, script):
+        """Sets up the scenario once the game starts and picks the section for this tick."""
+        self._frame_start = perf_counter()
+
+        # the game has started once the menu has created the ship
+        if self._tick < 0 and cast.get_first_actor("ships") is not None:
+            self._scenario.set_up(cast, script)
+            self._tick = 0
+
+        name = self._scenario.get_section(cast, script) if self._tick >= 0 else "menu"
+        if name not in self._sections:
+            self._sections[name] = {"frame_times": [], "draw_calls": [], "peak_actors": {},
+                                    "profiler": ActionProfiler(window=None)}
+        self._section = self._sections[name]
+
+        # time this section's actions with its own profiler
+        if self._profiler is not self._section["profiler"]:
+            if self._profiler is not None:
+                self.remove_hook(self._profiler)
+            self._profiler = self._section["profiler"]
+            self.add_hook(self._profiler)
+
+    def _finish_tick(self, cast, script):
+        """Records the actor counts and stops the run when the scenario is finished."""
+        peak_actors = self._section["peak_actors"]
+        for group in cast.get_groups():
+            count = cast.get_actor_count(group)
+            # the sparks group is one SparkSystem, so count the sparks inside it instead
+            if group == "sparks" and count:
+                count = cast.get_first_actor(group).get_count()
+            if count > peak_actors.get(group, 0):
+                peak_actors[group] = count
+
+        if self._tick >= 0:
+            self._scenario.on_tick(cast, script, self._tick)
+            self._tick += 1
+            if self._scenario.is_finished(cast, script, self._tick):
+                self._video_service.close_window()
@@ -1,3 +1,9 @@
+import constants
+
+# seconds of floating point error allowed when deciding if a whole tick has passed
+TICK_TOLERANCE = 1e-9
+
+
 class Director:
     """A person who directs the game. 
     
@@ -5,38 +11,117 @@ class Director:
 
     Attributes:
         _video_service (VideoService): For providing video output.
+        _keyboard_service (KeyboardService): For getting player input.
+        _hooks (list): ActionHooks told about every group and action executed (usually empty).
     """
 
-    def __init__(self, video_service):
-        """Constructs a new Director using the specified video service.
+    def __init__(self, video_service, keyboard_service):
+        """Constructs a new Director using the specified video and keyboard services.
         
         Args:
             video_service (VideoService): An instance of VideoService.
+            keyboard_service (KeyboardService): An instance of KeyboardService.
         """
         self._video_service = video_service
-        
+        self._keyboard_service = keyboard_service
+        self._hooks = []
+
+    def add_hook(self, hook):
+        """Adds an ActionHook that is told about every group and action the director executes.
+
+        Args:
+            hook (ActionHook): The hook to add, for example an ActionProfiler.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Removes a hook added with add_hook.
+
+        Args:
+            hook (ActionHook): The hook to remove.
+        """
+        self._hooks.remove(hook)
+
     def start_game(self, cast, script):
         """Starts the game using the given cast and script. Runs the main game loop.
 
+        Input and update actions run on a fixed tick (constants.FRAME_RATE) so the game speed never
+        changes, while output actions run as often as the window can draw. Actors are drawn
+        part-way between their last two tick positions so motion looks smooth.
+
         Args:
             cast (Cast): The cast of actors.
             script (Script): The script of actions.
         """
+        tick_length = 1 / constants.FRAME_RATE
         self._video_service.open_window()
+        previous_time = self._video_service.get_time()
+        # start with one tick waiting so the first frame has something to draw
+        lag = tick_length
+
         while self._video_service.is_window_open():
-            self._execute_actions("input", cast, script)
-            self._execute_actions("update", cast, script)
+            current_time = self._video_service.get_time()
+            lag += current_time - previous_time
+            previous_time = current_time
+            # after a very slow frame only catch up a few ticks instead of freezing to catch up all
+            lag = min(lag, tick_length * constants.MAX_TICKS_PER_FRAME)
+
+            # run as many ticks as the time since the last frame covers
+            # (small tolerance so a frame that lasted exactly one tick isn't lost to rounding)
+            while lag >= tick_length - TICK_TOLERANCE:
+                self._run_tick(cast, script)
+                lag -= tick_length
+
+            # draw part-way between the last two ticks
+            self._video_service.set_interpolation(max(lag, 0) / tick_length)
             self._execute_actions("output", cast, script)
         self._video_service.close_window()
 
+    def _run_tick(self, cast, script):
+        """Reads the keyboard and runs the input and update actions for one tick.
+
+        Args:
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        self._keyboard_service.update()
+        self._execute_actions("input", cast, script)
+        self._save_positions(cast)
+        self._execute_actions("update", cast, script)
+
+    def _save_positions(self, cast):
+        """Remembers where every actor is before the update actions move them, so they can be drawn
+        between their old and new positions.
+
+        Args:
+            cast (Cast): The cast of actors.
+        """
+        for actor in cast.get_all_actors_view():
+            actor.save_position()
+
     def _execute_actions(self, group, cast, script):
-        """Calls execute for each action in the given group.
+        """Calls execute for each action in the given group, telling any hooks before and after.
         
         Args:
             group (string): The action group name.
             cast (Cast): The cast of actors.
             script (Script): The script of actions.
         """
-        actions = script.get_actions(group)    
+        actions = script.get_actions(group)
+        hooks = self._hooks
+        # without hooks, just run the actions (this is the normal case, so keep it cheap)
+        if not hooks:
+            for action in actions:
+                action.execute(cast, script)
+            return
+
+        for hook in hooks:
+            hook.before_group(group, cast, script)
         for action in actions:
-            action.execute(cast, script)          
\ No newline at end of file
+            for hook in hooks:
+                hook.before_action(group, action, cast, script)
+            action.execute(cast, script)
+            for hook in reversed(hooks):
+                hook.after_action(group, action, cast, script)
+        for hook in reversed(hooks):
+            hook.after_group(group, cast, script)
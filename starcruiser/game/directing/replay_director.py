@@ -0,0 +1,144 @@
+import copy
+import random
+import constants
+from game.directing.director import Director
+
+
+class ReplayDirector(Director):
+    """A director that plays back a recorded game and can jump to any tick of it.
+
+    The responsibility of ReplayDirector is to run the game loop from a ScriptedKeyboardService
+    playing an InputLog's keys, stop when the recording runs out, and seek. While the replay runs
+    it keeps a keyframe every few ticks: a copy of the cast, the script and the random module's
+    state. Seeking restores the last keyframe before the wanted tick and runs the few ticks after
+    it without drawing them, instead of playing the whole game again from the start.
+
+    Attributes:
+        _audio_service (AudioService): Muted while seeking.
+        _services (list): The services, which keyframes share instead of copying.
+        _tick_count (int): How many ticks the recording has.
+        _keyframe_interval (int): Ticks between keyframes.
+        _keyframes (dict): { key: tick, value: (cast copy, script copy, random state) }
+        _seek_tick (int): The tick to jump to before the next frame is drawn (None to keep going).
+        _cast (Cast): The cast being played.
+        _script (Script): The script being played.
+    """
+
+    def __init__(self, video_service, keyboard_service, audio_service, tick_count,
+                 keyframe_interval=constants.KEYFRAME_INTERVAL):
+        """Constructs a new ReplayDirector.
+
+        Args:
+            video_service (VideoService): An instance of VideoService.
+            keyboard_service (ScriptedKeyboardService): Plays the recorded keys.
+            audio_service (AudioService): An instance of AudioService.
+            tick_count (int): How many ticks the recording has.
+            keyframe_interval (int): Ticks between keyframes.
+        """
+        super().__init__(video_service, keyboard_service)
+        self._audio_service = audio_service
+        self._services = [video_service, keyboard_service, audio_service]
+        self._tick_count = tick_count
+        self._keyframe_interval = keyframe_interval
+        self._keyframes = {}
+        self._seek_tick = None
+        self._cast = None
+        self._script = None
+
+    def get_tick(self):
+        """Gets the tick the replay has reached.
+
+        Returns:
+            int: The last tick that ran (-1 before the first one).
+        """
+        return self._keyboard_service.get_tick()
+
+    def seek(self, tick):
+        """Jumps to the given tick before the next frame is drawn.
+
+        Args:
+            tick (int): The tick to jump to (clamped to the recording).
+        """
+        self._seek_tick = max(-1, min(tick, self._tick_count - 1))
+
+    def start_game(self, cast, script):
+        """(OVERRIDE) Keeps a keyframe of the game before the first tick, then runs the game loop.
+
+        The random module has to be seeded with the recording's seed before this is called.
+
+        Args:
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        self._cast = cast
+        self._script = script
+        self._save_keyframe()
+        super().start_game(cast, script)
+
+    def _run_tick(self, cast, script):
+        """(OVERRIDE) Runs a tick, keeps a keyframe every few ticks and closes the window when the
+        recording runs out.
+
+        Args:
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        super()._run_tick(cast, script)
+        tick = self.get_tick()
+        if tick % self._keyframe_interval == 0 and tick not in self._keyframes:
+            self._save_keyframe()
+        if tick >= self._tick_count - 1 and self._seek_tick is None:
+            self._video_service.close_window()
+
+    def _execute_actions(self, group, cast, script):
+        """(OVERRIDE) Carries out a pending seek before the output actions draw the frame.
+
+        Args:
+            group (string): The action group name.
+            cast (Cast): The cast of actors.
+            script (Script): The script of actions.
+        """
+        if group == "output" and self._seek_tick is not None:
+            self._seek(self._seek_tick)
+        super()._execute_actions(group, cast, script)
+
+    def _seek(self, tick):
+        """Restores the last keyframe at or before the given tick if that is closer than where the
+        replay is now, then runs ticks until the given tick is reached."""
+        current = self.get_tick()
+        keyframe_tick = max(t for t in self._keyframes if t <= tick)
+        if tick < current or keyframe_tick > current:
+            cast, script, random_state = self._keyframes[keyframe_tick]
+            self._copy_game(cast, script, self._cast, self._script)
+            random.setstate(random_state)
+            self._keyboard_service.seek(keyframe_tick)
+
+        # the skipped ticks aren't heard, like they aren't seen
+        self._audio_service.set_muted(True)
+        while self.get_tick() < tick:
+            self._run_tick(self._cast, self._script)
+        self._audio_service.set_muted(False)
+        self._seek_tick = None
+        if tick >= self._tick_count - 1:
+            self._video_service.close_window()
+
+    def _save_keyframe(self):
+        """Keeps a copy of the game as it is after the current tick."""
+        cast = object.__new__(type(self._cast))
+        script = object.__new__(type(self._script))
+        self._copy_game(self._cast, self._script, cast, script)
+        self._keyframes[self.get_tick()] = (cast, script, random.getstate())
+
+    def _copy_game(self, cast, script, to_cast, to_script):
+        """Copies everything in a cast and script into another cast and script. Whatever pointed
+        at the first cast or script (for example a laser's cast) points at the other one in the
+        copy, and the services are shared rather than copied.
+        """
+        memo = {id(service): service for service in self._services}
+        memo[id(cast)] = to_cast
+        memo[id(script)] = to_script
+        cast_state, script_state = copy.deepcopy((vars(cast), vars(script)), memo)
+        vars(to_cast).clear()
+        vars(to_cast).update(cast_state)
+        vars(to_script).clear()
+        vars(to_script).update(script_state)
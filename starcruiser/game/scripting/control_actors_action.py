@@ -2,7 +2,6 @@ import constants
 from game.scripting.action import Action
 from game.shared.point import Point
 from game.casting.actor import Actor
-from game.casting.laser import Laser
 
 
 class ControlActorsAction(Action):
@@ -37,15 +36,15 @@ class ControlActorsAction(Action):
             cast (Cast): The cast of Actors in the game.
         """
         # reset movement velocity
-        self._player_direction = Point(0, 0)
+        self._player_direction.set(0, 0)
 
         # left key
         if self._keyboard_service.is_key_down('left'):
-            self._player_direction = Point(-constants.CELL_SIZE, 0)
+            self._player_direction.set(-constants.CELL_SIZE, 0)
 
         # right key
         if self._keyboard_service.is_key_down('right'):
-            self._player_direction = Point(constants.CELL_SIZE, 0)
+            self._player_direction.set(constants.CELL_SIZE, 0)
 
         # apply velocity to player
         ship = cast.get_first_actor("ships")
@@ -112,7 +111,7 @@ class ControlActorsAction(Action):
 
                 def make_laser():
                     # apply attributes to a new instance of laser
-                    laser = Laser(cast)
+                    laser = cast.acquire_actor("lasers")
                     laser.set_position(position)
                     laser.set_velocity(velocity)
                     laser.set_text(text)
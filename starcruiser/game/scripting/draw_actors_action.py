@@ -33,8 +33,8 @@ class DrawActorsAction(Action):
         # GATHER ACTORS TO DRAW - - -
 
         # menu items
-        menus = cast.get_actors("menus")
-        highscores = cast.get_actors("highscores")
+        menus = cast.get_actors_view("menus")
+        highscores = cast.get_actors_view("highscores")
 
         # if game is started get gameplay actors
         if self._game_started:
@@ -42,47 +42,46 @@ class DrawActorsAction(Action):
             # display elements
             score = cast.get_first_actor("scores")
             shield = cast.get_first_actor("shields")
-            messages = cast.get_actors("messages")
-            stage_messages = cast.get_actors("stage messages")
+            messages = cast.get_actors_view("messages")
+            stage_messages = cast.get_actors_view("stage messages")
             # ship parts
             ship = cast.get_first_actor("ships")
             parts = ship.get_parts()
             # lasers
-            lasers = cast.get_actors("lasers")
+            lasers = cast.get_actors_view("lasers")
             # asteroids
             asteroid_parts = []
-            asteroids = cast.get_actors("asteroids")
+            asteroids = cast.get_actors_view("asteroids")
             # append all asteroid parts into one list
             for asteroid in asteroids:
                 for part in asteroid.get_parts():
                     asteroid_parts.append(part)
             # asteroids
             ufo_parts = []
-            ufos = cast.get_actors("ufos")
+            ufos = cast.get_actors_view("ufos")
             # append all ufo parts into one list
             for ufo in ufos:
                 for part in ufo.get_parts():
                     ufo_parts.append(part)
             # explosions
-            explosions = cast.get_actors("explosions")
+            explosions = cast.get_actors_view("explosions")
             # sparks
-            sparks = cast.get_actors("sparks")
+            sparks = cast.get_actors_view("sparks")
             # upgrades
-            upgrades = cast.get_actors("upgrades")
+            upgrades = cast.get_actors_view("upgrades")
 
         # DRAW ACTORS - - - - - - -
         self._video_service.clear_buffer()
 
-        # draw menus
-        self._video_service.draw_actors(menus, True)
-        self._video_service.draw_actors(highscores)
+        # draw menus (they rarely change, so they are drawn as cached layers)
+        self._video_service.draw_layer("menus", menus, True)
+        self._video_service.draw_layer("highscores", highscores)
 
         if self._game_started:
             # draw hud elements
-            self._video_service.draw_actor(score)
-            self._video_service.draw_actor(shield)
-            self._video_service.draw_actors(messages, True)
-            self._video_service.draw_actors(stage_messages, True)
+            self._video_service.draw_layer("hud", (score, shield))
+            self._video_service.draw_layer("messages", messages, True)
+            self._video_service.draw_layer("stage messages", stage_messages, True)
             # draw player ship
             self._video_service.draw_actors(parts)
             # draw lasers
@@ -93,8 +92,9 @@ class DrawActorsAction(Action):
             self._video_service.draw_actors(ufo_parts)
             # draw explosions
             self._video_service.draw_actors(explosions)
-            # draw explosions
-            self._video_service.draw_actors(sparks)
+            # draw sparks
+            for spark_system in sparks:
+                self._video_service.draw_sparks(spark_system)
             # draw upgrades
             self._video_service.draw_actors(upgrades)
 
@@ -3,8 +3,7 @@ import random
 from game.casting.actor import Actor
 from game.scripting.action import Action
 from game.shared.point import Point
-from game.casting.explosion import Explosion
-from game.casting.spark import Spark
+from game.shared.spatial_hash import SpatialHash
 
 
 class HandleCollisionsAction(Action):
@@ -14,9 +13,17 @@ class HandleCollisionsAction(Action):
     The responsibility of HandleCollisionsAction is to handle the situation when the ship collides
     with enemies, or the laser collides with enemies, or ship collides with upgrades, or the game is over.
 
+    Lasers, enemies and the ship are swept along the path they moved this tick rather than
+    checked only where they ended up, so fast movers can't pass through each other between frames.
+
     Attributes:
         _is_game_over (boolean): Whether or not the game is over.
         _game_over_timer (int): waits n frames after player dies to display highscore table
+        _spatial_hash (SpatialHash): enemy parts and lasers sorted by grid cell for the current frame
+        _structure_hash (SpatialHash): multi-part enemies sorted by the cell of their origin, in
+            larger cells because each one covers many
+        _reach (int): the furthest an indexed enemy or laser moved this frame
+        _structure_reach (int): the furthest a multi-part enemy's parts are from its origin
     """
 
     def __init__(self, handle_menu_system, audio_service):
@@ -31,6 +38,11 @@ class HandleCollisionsAction(Action):
         # game over variables
         self._is_game_over = False
         self._game_over_timer = 0
+        # enemies and lasers indexed by grid cell (rebuilt every frame)
+        self._spatial_hash = SpatialHash(constants.CELL_SIZE)
+        self._structure_hash = SpatialHash(constants.CELL_SIZE * constants.STRUCTURE_CELLS)
+        self._reach = 0
+        self._structure_reach = 0
 
     def execute(self, cast, script):
         """Executes the handle collisions action.
@@ -41,6 +53,9 @@ class HandleCollisionsAction(Action):
         # as long as the game isn't over
         if not self._is_game_over:
 
+            # index enemies and lasers by cell once so every collision check can share it
+            self._build_spatial_hash(cast, ["asteroids","ufos"])
+
             # run the collision checks for enemies, lasers, and upgrades
             self._handle_laser_enemy_collision(cast, ["asteroids","ufos"])
             self._handle_player_enemy_collision(cast, ["asteroids","ufos"])
@@ -66,73 +81,309 @@ class HandleCollisionsAction(Action):
                     cast.remove_actor("messages", cast.get_first_actor("messages"))
 
 
+    def _build_spatial_hash(self, cast, groups):
+        """Sorts every enemy part and laser into the grid cell it occupies. The hash is built once
+        per frame and shared by all of the collision checks.
+
+        Only where things ended up is indexed. While building, the action remembers the furthest
+        anything moved this tick, and lookups reach that much further, so everything whose path
+        could meet the one being checked is still found.
+        Args:
+            cast (Cast): The cast of Actors in the game.
+            groups (list of strings): The enemy groups to index.
+        """
+        self._spatial_hash.clear()
+        self._structure_hash.clear()
+        # remember the order things were added so checks still find the same enemy first
+        order = 0
+        # the furthest anything moved, and the furthest a multi-part enemy's parts reach
+        reach = 0
+        self._structure_reach = 0
+        half_x = constants.MAX_X // 2
+        half_y = constants.MAX_Y // 2
+
+        # loop through every enemy in every group
+        for group in groups:
+            for enemy in cast.get_actors_view(group):
+                position = enemy.get_position()
+                x, y = position.get_x(), position.get_y()
+
+                # how far it moved (the short way around, in case it wrapped)
+                last = enemy.get_last_position()
+                if last is not None:
+                    dx = abs(x - last.get_x())
+                    dy = abs(y - last.get_y())
+                    if dx > half_x:
+                        dx = constants.MAX_X - dx
+                    if dy > half_y:
+                        dy = constants.MAX_Y - dy
+                    reach = max(reach, dx, dy)
+
+                # multi-part enemies are checked as a whole, by bounding box and occupied offsets
+                if enemy.has_layout():
+                    left, top, right, bottom = enemy.get_bounds()
+                    self._structure_reach = max(self._structure_reach, -left, -top, right, bottom)
+                    self._structure_hash.insert("structures", x, y, (order, enemy))
+                    order += 1
+                    continue
+
+                # index every part of this enemy
+                for enemypart in enemy.get_parts():
+                    position = enemypart.get_position()
+                    self._spatial_hash.insert("enemies", position.get_x(), position.get_y(),
+                                              (order, enemy, enemypart))
+
+                order += 1
+
+        # index every laser coming down at the ship (its own lasers fly up, away from it, but
+        # start right next to it, so a sweep could catch them as the ship moves sideways)
+        for laser in cast.get_actors_view("lasers"):
+            if laser.get_velocity().get_y() > 0:
+                position = laser.get_position()
+                self._spatial_hash.insert("lasers", position.get_x(), position.get_y(),
+                                          (order, laser, laser))
+                reach = max(reach, abs(laser.get_velocity().get_y()))
+            order += 1
+
+        self._reach = reach
+
+    def _get_path(self, actor):
+        """Gets the path an actor (or a part of a composite) moved along this tick.
+
+        The start is worked back from the current position by how far the actor moved, measured
+        the short way around the screen, so an actor that wrapped from one side to the other has a
+        short path that runs off the edge instead of one that crosses the whole screen.
+        Args:
+            actor (Actor): The actor or CompositePart.
+        Returns:
+            Tuple(int, int, int, int): The start x, start y, end x and end y of the path.
+        """
+        # read the values now, a part's position is reused by the next call
+        position = actor.get_position()
+        x, y = position.get_x(), position.get_y()
+
+        last = actor.get_last_position()
+        if last is None:
+            # added this tick, so it hasn't moved yet
+            return (x, y, x, y)
+        dx = self._get_short_distance(x - last.get_x(), constants.MAX_X)
+        dy = self._get_short_distance(y - last.get_y(), constants.MAX_Y)
+        return (x - dx, y - dy, x, y)
+
+    def _get_short_distance(self, distance, size):
+        """Gets a distance measured the short way around a screen dimension that wraps.
+        Args:
+            distance (float): The distance measured straight across.
+            size (int): How wide (or tall) the screen is.
+        """
+        half = size // 2
+        return (distance + half) % size - half
+
+    def _query_path(self, spatial_hash, group, path, reach):
+        """Gets the entries of a spatial hash that might meet the given path: anything that ended
+        the tick within reach (plus a cell) of the path's box, from either side of the screen if the
+        box runs off an edge.
+        Args:
+            spatial_hash (SpatialHash): The hash to look in.
+            group (string): The spatial hash group.
+            path (tuple): The path (see _get_path).
+            reach (int): How far past the path's box to look.
+        Returns:
+            List: The entries found, once each, in cast order.
+        """
+        x0, y0, x1, y1 = path
+        reach += constants.CELL_SIZE
+        left = min(x0, x1) - reach
+        right = max(x0, x1) + reach
+        top = min(y0, y1) - reach
+        bottom = max(y0, y1) + reach
+        entries = spatial_hash.query_box(group, left, top, right, bottom)
+        # paths wrap around the sides of the screen, so look on the other side too
+        if left < 0:
+            entries += spatial_hash.query_box(
+                group, left + constants.MAX_X, top, right + constants.MAX_X, bottom)
+        if right >= constants.MAX_X:
+            entries += spatial_hash.query_box(
+                group, left - constants.MAX_X, top, right - constants.MAX_X, bottom)
+        # the boxes can overlap, so keep only one of each
+        unique = {entry[0]: entry for entry in entries}
+        return [unique[order] for order in sorted(unique)]
+
+    def _get_relative_motion(self, path, other_path):
+        """Gets how one path moves as seen from something moving along another path.
+        Args:
+            path (tuple): The path of the moving thing (see _get_path).
+            other_path (tuple): The path of the thing it is seen from.
+        Returns:
+            Tuple(float, float, float, float): The x and y distance at the start of the tick and
+                how far the distance changes by the end of it.
+        """
+        dx = (path[2] - path[0]) - (other_path[2] - other_path[0])
+        dy = (path[3] - path[1]) - (other_path[3] - other_path[1])
+        x = self._get_short_distance(path[2] - other_path[2], constants.MAX_X) - dx
+        y = path[3] - other_path[3] - dy
+        return (x, y, dx, dy)
+
+    def _get_sweep_time(self, x, y, dx, dy):
+        """Gets when two cells moving relative to each other first overlap during the tick.
+
+        The distance between them is (x + dx * t, y + dy * t) for t from 0 (start of the tick) to 1
+        (end of it). They overlap while it is less than a cell on both axes. Each axis gives the
+        span of t it is close enough in, and the cells overlap where the spans do.
+        Args:
+            x (float): The x distance at the start of the tick.
+            y (float): The y distance at the start of the tick.
+            dx (float): How much the x distance changes during the tick.
+            dy (float): How much the y distance changes during the tick.
+        Returns:
+            float: The first t they overlap at (None if they never do).
+        """
+        cell_size = constants.CELL_SIZE
+        enter = 0
+        leave = 1
+        for distance, change in ((x, dx), (y, dy)):
+            if change == 0:
+                # the distance stays the same all tick
+                if abs(distance) >= cell_size:
+                    return None
+                continue
+            t0 = (-cell_size - distance) / change
+            t1 = (cell_size - distance) / change
+            enter = max(enter, min(t0, t1))
+            leave = min(leave, max(t0, t1))
+        if enter < leave:
+            return enter
+        return None
+
+    def _get_path_hit_time(self, path, other_path):
+        """Gets when two cells moving along their paths first overlap during the tick.
+        Args:
+            path (tuple): The path of one (see _get_path).
+            other_path (tuple): The path of the other.
+        Returns:
+            float: The first t they overlap at, from 0 to 1 (None if they never do).
+        """
+        return self._get_sweep_time(*self._get_relative_motion(path, other_path))
+
+    def _get_structure_hit_time(self, path, enemy, enemy_path):
+        """Gets when a cell moving along a path first overlaps a part of a multi-part enemy.
+
+        Only the parts near the path (seen from the enemy's origin) are swept, using the
+        enemy's bounding box and occupied offsets.
+        Args:
+            path (tuple): The path of the cell (see _get_path).
+            enemy (CompositeActor): The enemy to check.
+            enemy_path (tuple): The path of the enemy's origin.
+        Returns:
+            float: The first t they overlap at, from 0 to 1 (None if they never do).
+        """
+        x, y, dx, dy = self._get_relative_motion(path, enemy_path)
+        cell_size = constants.CELL_SIZE
+        offsets = enemy.get_offsets_in(min(x, x + dx) - cell_size, min(y, y + dy) - cell_size,
+                                       max(x, x + dx) + cell_size, max(y, y + dy) + cell_size)
+        first = None
+        for offset_x, offset_y in offsets:
+            t = self._get_sweep_time(x - offset_x, y - offset_y, dx, dy)
+            if t is not None and (first is None or t < first):
+                first = t
+        return first
+
+    def _get_candidates(self, group, path, include_structures=False):
+        """Gets everything whose path might meet the given path this tick, with its path.
+        Args:
+            group (string): The spatial hash group to look in.
+            path (tuple): The path to check (see _get_path), or a box around several paths.
+            include_structures (bool): Whether to look for multi-part enemies too.
+        Returns:
+            list: (entry, path, whether it is a multi-part enemy) for each one, in cast order.
+        """
+        candidates = [(entry, self._get_path(entry[2]), False) for entry
+                      in self._query_path(self._spatial_hash, group, path, self._reach)]
+        if include_structures:
+            reach = self._reach + self._structure_reach
+            candidates += [(entry, self._get_path(entry[1]), True) for entry
+                           in self._query_path(self._structure_hash, "structures", path, reach)]
+            candidates.sort(key=lambda candidate: candidate[0][0])
+        return candidates
+
+    def _find_first_hit(self, path, candidates):
+        """Finds the first candidate (in cast order) whose path meets the given path this tick.
+        Args:
+            path (tuple): The path to check (see _get_path).
+            candidates (list): What to check it against (see _get_candidates).
+        Returns:
+            Tuple: The entry hit and the t it was hit at (None, None if nothing was hit).
+        """
+        for entry, entry_path, is_structure in candidates:
+            if is_structure:
+                t = self._get_structure_hit_time(path, entry[1], entry_path)
+            else:
+                t = self._get_path_hit_time(path, entry_path)
+            if t is not None:
+                return entry, t
+        return None, None
+
+    def _get_parts_box(self, composite):
+        """Gets a box around the paths every part of a composite moved along this tick, so one
+        lookup finds the candidates for all of them.
+        Args:
+            composite (CompositeActor): The composite.
+        Returns:
+            Tuple(int, int, int, int): The left, top, right and bottom of the box.
+        """
+        x0, y0, x1, y1 = self._get_path(composite)
+        left, top, right, bottom = composite.get_bounds()
+        return (min(x0, x1) + left, min(y0, y1) + top, max(x0, x1) + right, max(y0, y1) + bottom)
+
     def _handle_laser_enemy_collision(self, cast, groups):
         """removes health from enemies when laser hits them
         Args:
             cast (Cast): The cast of Actors in the game.
+            groups (list of strings): The enemy groups to check.
         """
         # get list of all lasers on the screen right now
         lasers = cast.get_actors("lasers")
-        # keep track of whether there's a hit so we can break the nested for loops
-        hit = False
 
         # for every laser
         for laser in lasers:
-            # loop through every group in the enemies groups list
-            for group in groups:
-                if hit: break
-
-                # loop through every enemy in this group
-                for enemy in cast.get_actors(group):
-                    if hit: break
-
-                    # loop through every part of this enemy
-                    for enemypart in enemy._parts:
 
-                        # get corrected enemy position
-                        enemy_position = Point(enemypart.get_position().get_x() - enemypart.get_velocity().get_x(), enemypart.get_position().get_y())
+            # sweep the laser along the path it moved this tick, so it can't jump over an enemy
+            path = self._get_path(laser)
+            hit, t = self._find_first_hit(path, self._get_candidates("enemies", path, True))
 
-                        # get laser position
-                        laser_position = laser.get_position()
-                        # also get it's last position just in case they jumped over eachother
-                        laser_last_position = Point(laser.get_position().get_x(), laser.get_position().get_y()+constants.CELL_SIZE)
+            if hit is not None:
+                enemy = hit[1]
 
-                        # assume false
-                        collision = False
+                # create an explosion where the laser reached the enemy
+                x0, y0, x1, y1 = path
+                x = int(x0 + (x1 - x0) * t) % constants.MAX_X
+                y = int(y0 + (y1 - y0) * t)
+                self._create_explosion(cast, Point(x, y))
+                # apply damage from laser to enemy health
+                destroyed = enemy.remove_health(laser.get_damage())
 
-                        if laser_position.equals(enemypart.get_position()) or laser_last_position.equals(enemypart.get_position()):
-                            collision = True
+                # if enemy was destroyed
+                if destroyed:
+                    # play the enemies destroy sound
+                    self._audio_service.play_sound(enemy.get_exp_sound())
+                else:
+                    # play enemies hit sound
+                    self._audio_service.play_sound(enemy.get_hit_sound())
 
-                        if laser_position.equals(enemy_position) or laser_last_position.equals(enemy_position):
-                            collision = True
+                # delete the laser
+                cast.remove_actor("lasers", laser)
 
-                        # if enemy parts position is equal to lasers
-                        if collision:
+                # enemies and lasers changed, so re-index them for the other checks
+                self._build_spatial_hash(cast, groups)
 
-                            # create an explosion at the lasers position
-                            self._create_explosion(cast, laser_last_position)
-                            # apply damage from laser to enemy health
-                            destroyed = enemy.remove_health(laser.get_damage())
-
-                            # if enemy was destroyed
-                            if destroyed:
-                                # play the enemies destroy sound
-                                self._audio_service.play_sound(enemy.get_exp_sound())                        
-                            else:
-                                # play enemies hit sound
-                                self._audio_service.play_sound(enemy.get_hit_sound())
-
-                            # delete the laser
-                            cast.remove_actor("lasers", laser)
-
-                            # break all loops
-                            hit = True
-                            break
+                # only one laser hit is applied each frame
+                return
 
     def _handle_player_enemy_collision(self, cast, groups):
         """Checks if the ship has collided with an enemy and applies damage to shields.
         Args:
             cast (Cast): The cast of Actors in the game.
+            groups (list of strings): The enemy groups to check.
         """
         # get reference to ship
         ship = cast.get_first_actor("ships")
@@ -142,62 +393,51 @@ class HandleCollisionsAction(Action):
 
             # get list of ship parts
             parts = ship.get_parts()
-            # break for loops if there's a collision
-            hit = False
+            # look up the enemies near any part once, then check each part against them
+            candidates = self._get_candidates("enemies", self._get_parts_box(ship), True)
 
             # loop through every part
             for part in parts:
-                if hit: break
-
-                # loop through every enemy group
-                for group in groups:
-                    if hit: break
-
-                    # loop through every enemy in this group
-                    for enemy in cast.get_actors(group):
-                        if hit: break
-
-                        # loop through every part in this enemies part list
-                        for enemypart in enemy._parts:
-
-                            # if this ship part is colliding with this enemy part
-                            if part.get_position().equals(enemypart.get_position()):
-                                # set hit to true so we can break the loop and only apply one hit at a time
-                                hit = True
-
-                                # get reference to shields instance
-                                shields = cast.get_first_actor("shields")
-                                shields.add_points( - enemy.get_damage())
-
-                                # create sparks that bounce off player ship
-                                self._create_sparks(cast, 20, part.get_position(), 5, 13, 270, 40)
-                            
-                                # if player is moving sideways send sparks sideways too
-                                if ship.get_velocity().get_x() > 0: # right
-                                    self._create_sparks(cast, 20, part.get_position(), 10, 23, 350, 40)
-                                if ship.get_velocity().get_x() < 0: # left
-                                    self._create_sparks(cast, 20, part.get_position(), 10, 23, 190, 40)
-
-                                # remove all the enemies health
-                                enemy.remove_health(1000) # (must be 1000, see asteroid class for details)
-
-                                # if we have less than 0 shields now
-                                if shields.get_points() < 0:
-                                    # explode player, game over
-                                    self._is_game_over = True
-                                    ship.set_is_dead(True)
-                                else:
-                                    # set ship is hurt to true
-                                    ship.set_is_hurt(True)
-                                    # play ship hit sound
-                                    self._audio_service.play_sound("ship-hit")
-                                    # if we are low on shields
-                                    if shields.get_points() <= 4:
-                                        # play low shields warning sound
-                                        self._audio_service.play_sound("low-shields")
-
-                                # break the loop
-                                break
+                # find the first enemy (in cast order) whose path meets this ship part's path
+                hit, t = self._find_first_hit(self._get_path(part), candidates)
+
+                # if this ship part is colliding with an enemy part
+                if hit is not None:
+                    enemy = hit[1]
+
+                    # get reference to shields instance
+                    shields = cast.get_first_actor("shields")
+                    shields.add_points( - enemy.get_damage())
+
+                    # create sparks that bounce off player ship
+                    self._create_sparks(cast, 20, part.get_position(), 5, 13, 270, 40)
+
+                    # if player is moving sideways send sparks sideways too
+                    if ship.get_velocity().get_x() > 0: # right
+                        self._create_sparks(cast, 20, part.get_position(), 10, 23, 350, 40)
+                    if ship.get_velocity().get_x() < 0: # left
+                        self._create_sparks(cast, 20, part.get_position(), 10, 23, 190, 40)
+
+                    # remove all the enemies health
+                    enemy.remove_health(1000) # (must be 1000, see asteroid class for details)
+
+                    # if we have less than 0 shields now
+                    if shields.get_points() < 0:
+                        # explode player, game over
+                        self._is_game_over = True
+                        ship.set_is_dead(True)
+                    else:
+                        # set ship is hurt to true
+                        ship.set_is_hurt(True)
+                        # play ship hit sound
+                        self._audio_service.play_sound("ship-hit")
+                        # if we are low on shields
+                        if shields.get_points() <= 4:
+                            # play low shields warning sound
+                            self._audio_service.play_sound("low-shields")
+
+                    # only apply one hit at a time
+                    return
 
     def _handle_player_lasers_collision(self, cast):
         """Checks if the ship has collided with an enemy laser and applies damage to shields.
@@ -212,56 +452,52 @@ class HandleCollisionsAction(Action):
 
             # get list of ship parts
             parts = ship.get_parts()
-            # break for loops if there's a collision
-            hit = False
+            # look up the lasers near any part once, then check each part against them
+            candidates = self._get_candidates("lasers", self._get_parts_box(ship))
 
             # loop through every part
             for part in parts:
-                if hit: break
-
-                # loop through every laser
-                for laser in cast.get_actors("lasers"):
-                    if hit: break
-
-                    # if this ship part is colliding with this laser
-                    if part.get_position().equals(laser.get_position()):
-                        # set hit to true so we can break the loop and only apply one hit at a time
-                        hit = True
-
-                        # get reference to shields instance
-                        shields = cast.get_first_actor("shields")
-                        # apply appropriate damage to player shields
-                        shields.add_points( - laser.get_damage())
-
-                        # create sparks that bounce off player ship
-                        self._create_sparks(cast, 20, part.get_position(), 5, 13, 270, 40)
-                    
-                        # if player is moving sideways send sparks sideways too
-                        if ship.get_velocity().get_x() > 0: # right
-                            self._create_sparks(cast, 20, part.get_position(), 10, 23, 350, 40)
-                        if ship.get_velocity().get_x() < 0: # left
-                            self._create_sparks(cast, 20, part.get_position(), 10, 23, 190, 40)
-
-                        # remove the laser
-                        cast.remove_actor("lasers", laser)
-
-                        # if we have less than 0 shields now
-                        if shields.get_points() < 0:
-                            # explode player, game over
-                            self._is_game_over = True
-                            ship.set_is_dead(True)
-                        else:
-                            # set ship is hurt to true
-                            ship.set_is_hurt(True)
-                            # play ship hit sound
-                            self._audio_service.play_sound("ship-hit")
-                            # if we are low on shields
-                            if shields.get_points() <= 4:
-                                # play low shields warning sound
-                                self._audio_service.play_sound("low-shields")
-
-                        # break the loop
-                        break
+                # find the first laser (in cast order) whose path meets this ship part's path
+                hit, t = self._find_first_hit(self._get_path(part), candidates)
+
+                # if this ship part is colliding with a laser
+                if hit is not None:
+                    laser = hit[1]
+
+                    # get reference to shields instance
+                    shields = cast.get_first_actor("shields")
+                    # apply appropriate damage to player shields
+                    shields.add_points( - laser.get_damage())
+
+                    # create sparks that bounce off player ship
+                    self._create_sparks(cast, 20, part.get_position(), 5, 13, 270, 40)
+
+                    # if player is moving sideways send sparks sideways too
+                    if ship.get_velocity().get_x() > 0: # right
+                        self._create_sparks(cast, 20, part.get_position(), 10, 23, 350, 40)
+                    if ship.get_velocity().get_x() < 0: # left
+                        self._create_sparks(cast, 20, part.get_position(), 10, 23, 190, 40)
+
+                    # remove the laser
+                    cast.remove_actor("lasers", laser)
+
+                    # if we have less than 0 shields now
+                    if shields.get_points() < 0:
+                        # explode player, game over
+                        self._is_game_over = True
+                        ship.set_is_dead(True)
+                    else:
+                        # set ship is hurt to true
+                        ship.set_is_hurt(True)
+                        # play ship hit sound
+                        self._audio_service.play_sound("ship-hit")
+                        # if we are low on shields
+                        if shields.get_points() <= 4:
+                            # play low shields warning sound
+                            self._audio_service.play_sound("low-shields")
+
+                    # only apply one hit at a time
+                    return
 
 
     def _handle_game_over(self, cast):
@@ -324,38 +560,42 @@ class HandleCollisionsAction(Action):
         """
         # get ship reference
         ship = cast.get_first_actor("ships")
-        # get list of all ship parts
-        parts = ship.get_parts()
+        # the ship's cells are looked up on the board instead of checking every part
+        raster = cast.get_raster()
         # get list of all upgrades
         upgrades = cast.get_actors("upgrades")
 
         # for every upgrade
         for upgrade in upgrades:
-            # for every part in ship
-            for part in parts:
-                # see if part position x matches upgrade position x
-                if part.get_position().get_x() == upgrade.get_position().get_x():
-                    # if we are within a certain y distance consider it a collision
-                    if abs(part.get_position().get_y() - upgrade.get_position().get_y()) < 15:
-                        # get reference to shields
-                        shields = cast.get_first_actor("shields")
-
-                        # add points (apply upgrade)
-                        if upgrade.get_type() == "shield":
-                            shields.add_points(10)
-
-                        if upgrade.get_type() == "gun-rapid":
-                            ship.set_gun_type("rapid")
-
-                        if upgrade.get_type() == "gun-shotgun":
-                            ship.set_gun_type("shotgun")
-
-                        # remove that upgrade from screen
-                        cast.remove_actor("upgrades", upgrade)
-                        # play upgrade sound
-                        self._audio_service.play_sound("upgrade")
-                        # break loop so we don't count it twice
-                        break
+            x = upgrade.get_position().get_x()
+            y = upgrade.get_position().get_y()
+            # ship parts are always on the screen
+            if x < 0 or x >= constants.MAX_X:
+                continue
+            # check the cells of the upgrade's column it overlaps (a part there is less than a
+            # cell away vertically, so consider it a collision)
+            cell_y = y - y % constants.CELL_SIZE
+            for part_y in (cell_y, cell_y + constants.CELL_SIZE):
+                if abs(part_y - y) < constants.CELL_SIZE and raster.get_group(x, part_y) == "ships":
+                    # get reference to shields
+                    shields = cast.get_first_actor("shields")
+
+                    # add points (apply upgrade)
+                    if upgrade.get_type() == "shield":
+                        shields.add_points(10)
+
+                    if upgrade.get_type() == "gun-rapid":
+                        ship.set_gun_type("rapid")
+
+                    if upgrade.get_type() == "gun-shotgun":
+                        ship.set_gun_type("shotgun")
+
+                    # remove that upgrade from screen
+                    cast.remove_actor("upgrades", upgrade)
+                    # play upgrade sound
+                    self._audio_service.play_sound("upgrade")
+                    # break loop so we don't count it twice
+                    break
 
     def _create_sparks(self, cast, amount, position, speed_min, speed_max, dir, dir_range):
         """"Create a certain number of sparks at a certain location between min/max speed and min/max direction
@@ -368,17 +608,14 @@ class HandleCollisionsAction(Action):
             dir (int): direction spark will move in degrees 0-360
             dir_range (int):  randomizes the direction angle by this amount
         """
+        sparks = cast.get_first_actor("sparks")
+        if sparks is None:
+            return
         # create this amount of sparks
         for i in range(0, amount):
-            # create instance
-            spark = Spark(cast)
-            spark.set_text(".")
-            spark.set_color(constants.WHITE)
-            spark.set_speed(speed_min + random.random() * (speed_max-speed_min))
-            spark.set_direction(dir + (random.random()-0.5)*dir_range)
-            spark.set_position(position)
-            # add spark to "sparks" cast group
-            cast.add_actor("sparks", spark)
+            speed = speed_min + random.random() * (speed_max-speed_min)
+            direction = dir + (random.random()-0.5)*dir_range
+            sparks.emit(position, speed, direction)
 
     def _create_explosion(self, cast, position):
         """"Create an explosion at location
@@ -387,7 +624,7 @@ class HandleCollisionsAction(Action):
             position (Point): position to create the explosion       
         """
         # create an explosion at the parts position
-        explosion = Explosion(cast)
+        explosion = cast.acquire_actor("explosions")
         explosion.set_text(".")
         explosion.set_color(constants.WHITE)
         explosion.set_velocity(Point(0, 1))
@@ -23,7 +23,6 @@ class HandleEnemyCreation(Action):
         stage_seconds (float): increments in seconds how long each stage will run
         y_randomness (int): controls the randomness of the y position (vertical) that enemies will spawn, if zero enemies spawn in a straight row
         paused (bool): used to pause the stage succession by stopping the stage_seconds timer
-        last_spawn_list (list): remembers recent enemy positions to avoid spawning a new one at the same x/y position
 
         game_stages (object): stores the information for each stage (length, enemy types, rapidness of spawn, stagename, etc.)
     """
@@ -40,13 +39,15 @@ class HandleEnemyCreation(Action):
         self._stage_seconds = 0
         self._y_randomness = 0
         self._paused = False
-        self._last_spawn_list = []
         # get game stages information
         self._game_stages = constants.GAME_STAGES
 
     def set_paused(self, paused):
         self._paused = paused
 
+    def get_stage_number(self):
+        return self._game_stage_number
+
     def execute(self, cast, script):
         """Executes the handle enemy creation action.
         Args:
@@ -94,17 +95,10 @@ class HandleEnemyCreation(Action):
                     # set up y_randomness for spawn y positions
                     self.y_randomness = self._current_stage["y_randomness"]
 
-                    # reset recent enemies spawned list
-                    self._last_spawn_list = []
-
                     # for every enemy type in the enemytypes list for this stage
                     for enemytype in self._current_stage["enemytypes"]:
                         # create an enemy of that type
-                        enemy = self._create_enemy_of_type(cast, enemytype)
-                        # make sure it was created succesfully
-                        if enemy != 0:
-                            # if so, add it to the recent enemies spawned list
-                            self._last_spawn_list.append(enemy)
+                        self._create_enemy_of_type(cast, enemytype)
                 else:
                     # count down wait spawn timer in seconds
                     self._wait_spawn -= 1 / constants.FRAME_RATE
@@ -207,6 +201,11 @@ class HandleEnemyCreation(Action):
             enemy = self._make_ufo(cast)
             cast.add_actor("ufos", enemy)
 
+        # mark it on the board so the next enemy made this frame doesn't take its cell
+        raster = cast.get_raster()
+        if enemy != 0 and raster is not None:
+            raster.mark("ufos" if enemy_type == "ufo" else "asteroids", enemy)
+
         # return enemy reference (zero if unsuccesful)
         return enemy
 
@@ -222,7 +221,7 @@ class HandleEnemyCreation(Action):
         # check enemy types - - - - -
 
         # if any asteroids exist
-        if len(cast.get_actors("asteroids")) > 0:
+        if cast.get_actor_count("asteroids") > 0:
             result = False
 
         # return final result
@@ -235,40 +234,26 @@ class HandleEnemyCreation(Action):
         Returns:
             reference to the new meteoroid
         """
-        # how many times to try finding an empty position to create another anemy
-        tries = 10
-        # used to track if the position is free or not
-        free = True
         # start by selecting a random position to try
         x = random.randint(1, constants.COLUMNS - 1)
         y = random.randint(-5 - self.y_randomness, -5)
         position = Point(x, y)
         position = position.scale(constants.CELL_SIZE)
 
-        # keep trying (tries) n times for an empty spot
-        while not free:
-            # reset
-            free = True
-
-            if tries > 0:
-                # try n times to find a free position
-                tries -= 1
-                # check recently made enemies list
-                for enemy in self._last_spawn_list:
-                    # if position is not free
-                    if position.equals(enemy.get_position()):
-                        #continue the loop
-                        free = False
-
-            if free == False:
-                # pick a new spot to try
-                x = random.randint(1, constants.COLUMNS - 1)
-                y = random.randint(-5 - self.y_randomness, -5)
-                position = Point(x, y)
-                position = position.scale(constants.CELL_SIZE)
-                # then the loop will run again
-
-        # once the loop breaks we will use the position
+        # if something is already there, move to the first free cell of the spawn rows in the same
+        # column (below the position first, then above it)
+        raster = cast.get_raster()
+        if raster is not None and not raster.is_free(position.get_x(), position.get_y()):
+            top = (-5 - self.y_randomness) * constants.CELL_SIZE
+            bottom = -5 * constants.CELL_SIZE
+            free_y = raster.find_free(position.get_x(), position.get_y(), bottom)
+            if free_y is None:
+                free_y = raster.find_free(position.get_x(), top, position.get_y())
+            # if the whole column is taken, keep the position anyway
+            if free_y is not None:
+                position = Point(position.get_x(), free_y)
+
+        # use the position
         velocity = Point(0, constants.CELL_SIZE)
         asteroid = Asteroid(cast)
         asteroid.set_position(position)
@@ -3,13 +3,19 @@ import constants
 from game.scripting.action import Action
 from game.shared.point import Point
 from game.casting.actor import Actor
+from game.casting.actor_pool import ActorPool
+from game.casting.explosion import Explosion
+from game.casting.laser import Laser
 from game.casting.score import Score
 from game.casting.shields import Shields
 from game.casting.ship import Ship
+from game.casting.spark_system import SparkSystem
+from game.casting.upgrade import Upgrade
 from game.scripting.control_actors_action import ControlActorsAction
 from game.scripting.move_actors_action import MoveActorsAction
 from game.scripting.handle_collisions_action import HandleCollisionsAction
 from game.scripting.handle_enemy_creation import HandleEnemyCreation
+from game.shared.occupancy_raster import OccupancyRaster
 
 
 class handleMenuSystem(Action):
@@ -550,6 +556,8 @@ class handleMenuSystem(Action):
 
         # if we are first setting up the game (as opposed to unpausing)
         if initialStart == True:
+            # the sounds load in the background while the menu is up; the game needs them all
+            self._audio_service.wait_until_loaded()
             # enemy creator action remains persistent so it's only created once here
             self._handle_enemy_creation_action = HandleEnemyCreation(
                 self._audio_service)
@@ -565,6 +573,21 @@ class handleMenuSystem(Action):
             shields.set_color(constants.BLACK)
             cast.add_actor("scores", scores)
             cast.add_actor("shields", shields)
+            # one spark system draws every spark (it is kept when a new game starts, without the
+            # last game's sparks)
+            sparks = cast.get_first_actor("sparks")
+            if sparks is None:
+                cast.add_actor("sparks", SparkSystem())
+            else:
+                sparks.clear()
+            # short-lived actors are reused instead of created every time (pools are kept too)
+            if cast.get_pool("lasers") is None:
+                cast.add_pool("lasers", ActorPool(Laser, cast))
+                cast.add_pool("explosions", ActorPool(Explosion, cast))
+                cast.add_pool("upgrades", ActorPool(Upgrade, cast))
+            # one grid of which cells are taken is shared by the actions (it is kept too)
+            if cast.get_raster() is None:
+                cast.set_raster(OccupancyRaster(cast, constants.RASTER_GROUPS))
             # tell the draw actors the game has started and to draw gameplay elements (ship, enemies, etc.)
             self._draw_actors_instance.set_game_started(True)
 
@@ -7,6 +7,14 @@ class MoveActorsAction(Action):
 
     The responsibility of MoveActorsAction is to move all the actors that have a velocity greater
     than zero.
+
+    Actors are moved a class at a time with move_all, so a run of plain movers (lasers,
+    explosions, asteroids, upgrades) is one loop without a method call per actor. Actors with
+    their own behavior (like the ufo) still have move_next called on each one. Actors are moved in
+    the same order as before.
+
+    Once everything has moved, the cast's OccupancyRaster (if it has one) is marked out of date, so
+    the rest of the frame sees where the actors are now.
     """
 
     def execute(self, cast, script):
@@ -16,6 +24,21 @@ class MoveActorsAction(Action):
             cast (Cast): The cast of Actors in the game.
             script (Script): The script of Actions in the game.
         """
-        actors = cast.get_all_actors()
-        for actor in actors:
-            actor.move_next()
+        # split the actors into runs of one class, in cast order (this also copies them, because
+        # moving can add or remove some, e.g. a laser leaving the screen)
+        runs = []
+        run_class = None
+        for actor in cast.get_all_actors_view():
+            actor_class = type(actor)
+            if actor_class is not run_class:
+                run_class = actor_class
+                run = []
+                runs.append((actor_class, run))
+            run.append(actor)
+
+        for actor_class, actors in runs:
+            actor_class.move_all(actors)
+
+        raster = cast.get_raster()
+        if raster is not None:
+            raster.invalidate()
@@ -1,99 +1,451 @@
+import queue
+import threading
+import time
+import traceback
 import pyray
 import constants
+from game.services.voice_pool import VoicePool
 
 
 class AudioService:
     """Plays sounds and music
+
+    Sounds and music asked for during a frame are collected and played together when the frame
+    is flushed, so the audio device is called a bounded number of times per frame however many
+    enemies are on screen.
+
+    Sound files are registered by name and decoded by a loader thread in the background, menu
+    sounds first, so the window can open and show the menu straight away. A decoded file is made
+    into a playable sound on the main thread, a few each frame as they are ready (see flush). A
+    sound that is played before it has been loaded is loaded right then, and wait_until_loaded
+    makes sure everything is ready (the menu calls it before the first stage).
+
+    Each sound is played through a VoicePool, so it can overlap itself a few times (see
+    constants.SOUND_VOICES) instead of restarting. The number of voices playing at once is
+    capped at constants.MAX_VOICES: past that new sounds are dropped, except the priority sounds
+    (constants.PRIORITY_SOUNDS), which always play and steal a voice if they have to.
+
+    Music isn't decoded up front like the sounds. Each track is a stream that decodes a little
+    at a time as it plays, topped up every frame by flush, and loops on its own. Changing the
+    music crossfades: the old track fades out while the new one fades in.
+
+    In threaded mode the game loop never calls the audio device. flush hands the frame's
+    requests to an audio thread through a queue.SimpleQueue and returns straight away; the audio
+    thread plays them, loads the sounds and keeps the music streams topped up even when the game
+    loop stalls. get_queue_stats tells how far behind the audio thread is.
     """
 
-    def __init__(self):
-        """Constructs a new AudioService
+    def __init__(self, threaded=False):
+        """Constructs a new AudioService and starts loading the sounds in the background.
         Args:
-
+            threaded (bool): whether to call the audio device from an audio thread instead of
+                the game loop.
         """
         # this is to initialize the audio device
         pyray.init_audio_device()
 
-        self._sounds = {}
+        # while muted nothing is played (for example while a replay seeks)
+        self._muted = False
+
+        # the file of every sound, in the order they are loaded
+        self._files = {}
+        # menu
+        self._files['menu-select'] = constants.MENU_SELECT_SOUND
+        self._files['menu-start'] = constants.MENU_START_SOUND
+        self._files['enter-initial'] = constants.ENTER_INITIAL_SOUND
+        self._files['new-highscore'] = constants.NEW_HIGHSCORE_SOUND
         # ship
-        self._sounds['laser'] = pyray.load_sound(constants.SHIP_FIRE_SOUND)
-        self._sounds['ship-hit'] = pyray.load_sound(constants.SHIP_HIT_SOUND)
-        self._sounds['ship-exp'] = pyray.load_sound(constants.SHIP_EXPLOSION_SOUND)
+        self._files['laser'] = constants.SHIP_FIRE_SOUND
+        self._files['ship-hit'] = constants.SHIP_HIT_SOUND
+        self._files['ship-exp'] = constants.SHIP_EXPLOSION_SOUND
         # asteroids
-        self._sounds['ast-hit'] = pyray.load_sound(constants.ASTEROIDS_HIT_SOUND)
-        self._sounds['ast-hit-sml'] = pyray.load_sound(constants.ASTEROIDS_HIT_SML_SOUND)
-        self._sounds['ast-hit-lrg'] = pyray.load_sound(constants.ASTEROIDS_HIT_LRG_SOUND)
-        self._sounds['ast-hit-giant'] = pyray.load_sound(constants.ASTEROIDS_HIT_GIANT_SOUND)
-        self._sounds['ast-exp-huge'] = pyray.load_sound(constants.ASTEROIDS_HUGE_EXP_SOUND)
-        self._sounds['ast-exp-giant'] = pyray.load_sound(constants.ASTEROIDS_GIANT_EXP_SOUND)
+        self._files['ast-hit'] = constants.ASTEROIDS_HIT_SOUND
+        self._files['ast-hit-sml'] = constants.ASTEROIDS_HIT_SML_SOUND
+        self._files['ast-hit-lrg'] = constants.ASTEROIDS_HIT_LRG_SOUND
+        self._files['ast-hit-giant'] = constants.ASTEROIDS_HIT_GIANT_SOUND
+        self._files['ast-exp-huge'] = constants.ASTEROIDS_HUGE_EXP_SOUND
+        self._files['ast-exp-giant'] = constants.ASTEROIDS_GIANT_EXP_SOUND
         # ufo
-        self._sounds['ufo-fly'] = pyray.load_sound(constants.UFO_FLY_SOUND)
-        self._sounds['ufo-laser'] = pyray.load_sound(constants.UFO_LASER_SOUND)
-        self._sounds['ufo-exp'] = pyray.load_sound(constants.UFO_EXP_SOUND)
-        # menu
-        self._sounds['menu-select'] = pyray.load_sound(constants.MENU_SELECT_SOUND)
-        self._sounds['menu-start'] = pyray.load_sound(constants.MENU_START_SOUND)
-        self._sounds['enter-initial'] = pyray.load_sound(constants.ENTER_INITIAL_SOUND)
-        self._sounds['new-highscore'] = pyray.load_sound(constants.NEW_HIGHSCORE_SOUND)
+        self._files['ufo-fly'] = constants.UFO_FLY_SOUND
+        self._files['ufo-laser'] = constants.UFO_LASER_SOUND
+        self._files['ufo-exp'] = constants.UFO_EXP_SOUND
         # game
-        self._sounds['game-over'] = pyray.load_sound(constants.GAMEOVER_SOUND)
-        self._sounds['new-stage'] = pyray.load_sound(constants.NEW_STAGE_SOUND)
-        self._sounds['upgrade'] = pyray.load_sound(constants.UPGRADE_SOUND)
-        self._sounds['low-shields'] = pyray.load_sound(constants.LOW_SHIELDS_WARNING_SOUND)
-        # music
-        self._sounds['menu-music'] = pyray.load_sound(constants.MUSIC_MENU_SOUND)
-        self._sounds['game-music'] = pyray.load_sound(constants.MUSIC_GAMEPLAY_SOUND)
-
-    
+        self._files['game-over'] = constants.GAMEOVER_SOUND
+        self._files['new-stage'] = constants.NEW_STAGE_SOUND
+        self._files['upgrade'] = constants.UPGRADE_SOUND
+        self._files['low-shields'] = constants.LOW_SHIELDS_WARNING_SOUND
+
+        # the file of every music track (streamed, see flush)
+        self._music_files = {}
+        self._music_files['menu-music'] = constants.MUSIC_MENU_SOUND
+        self._music_files['game-music'] = constants.MUSIC_GAMEPLAY_SOUND
+        # the opened music streams { key: music name, value: Music }
+        self._streams = {}
+        # the volume of every track playing, including ones fading out { key: music name,
+        # value: volume from 0 to 1 }
+        self._music_volumes = {}
+        # when the music volumes were last changed (None before the first flush)
+        self._music_time = None
+
+        # the voices of the sounds ready to play { key: sound name, value: VoicePool } (only
+        # used on the main thread)
+        self._pools = {}
+        # how many sounds were played, played by stealing a busy voice or dropped
+        self._voice_stats = {"played": 0, "stolen": 0, "dropped": 0}
+
+        # shared with the loader thread, guarded by _loaded
+        # the sounds the loader hasn't started on yet, in the order to load them
+        self._queue = list(self._files)
+        # decoded files waiting to be made into sounds { key: sound name, value: Wave }
+        self._waves = {}
+        # how long decoding each file took { key: sound name, value: milliseconds }
+        self._load_ms = {}
+        # notified every time a file is decoded
+        self._loaded = threading.Condition()
+        self._is_stopping = False
+
+        # requests collected during the frame, played by flush (see flush)
+        self._pending_sounds = {}
+        self._pending_loops = {}
+        self._pending_music = None
+        # the music that should be playing ("none" if there isn't any)
+        self._music = "none"
+
+        # threaded mode: commands for the audio thread (None when not threaded) and how long
+        # they waited to be carried out
+        self._commands = None
+        self._audio_thread = None
+        self._queue_stats = {"commands": 0, "errors": 0, "max_depth": 0, "total_latency_ms": 0,
+                             "max_latency_ms": 0}
+
+        self._load_start = time.perf_counter()
+        self._load_seconds = None
+        self._loader = threading.Thread(target=self._load_in_background, daemon=True)
+        self._loader.start()
+        if threaded:
+            self._commands = queue.SimpleQueue()
+            self._audio_thread = threading.Thread(target=self._run_audio_thread, daemon=True)
+            self._audio_thread.start()
+
+    def _load_in_background(self):
+        """ decodes the sound files one at a time, in order, until they are all decoded
+            (runs on the loader thread)"""
+        while True:
+            with self._loaded:
+                if self._is_stopping or not self._queue:
+                    return
+                name = self._queue.pop(0)
+            start = time.perf_counter()
+            wave = pyray.load_wave(self._files[name])
+            with self._loaded:
+                self._waves[name] = wave
+                self._load_ms[name] = (time.perf_counter() - start) * 1000
+                self._loaded.notify_all()
+
+    def _get_pool(self, name):
+        """ gets the voices of a sound ready to play, loading it now if it isn't yet
+            (waits for the loader if it is decoding this sound right now)"""
+        pool = self._pools.get(name)
+        if pool is not None:
+            return pool
+        if name not in self._files:
+            raise KeyError(f"unknown sound: {name}")
+        with self._loaded:
+            if name in self._queue:
+                # the loader hasn't got to it, so decode it here instead
+                self._queue.remove(name)
+                wave = None
+            else:
+                while name not in self._waves:
+                    self._loaded.wait()
+                wave = self._waves.pop(name)
+        if wave is None:
+            start = time.perf_counter()
+            wave = pyray.load_wave(self._files[name])
+            with self._loaded:
+                self._load_ms[name] = (time.perf_counter() - start) * 1000
+        return self._make_sound(name, wave)
+
+    def _make_sound(self, name, wave):
+        """ makes a decoded file into a sound and its voices on the main thread"""
+        sound = pyray.load_sound_from_wave(wave)
+        pyray.unload_wave(wave)
+        pool = VoicePool(sound, constants.SOUND_VOICES.get(name, 1))
+        self._pools[name] = pool
+        if len(self._pools) == len(self._files):
+            self._load_seconds = time.perf_counter() - self._load_start
+        return pool
+
+    def _make_ready_sounds(self, limit):
+        """ makes up to limit of the files the loader has decoded into sounds"""
+        with self._loaded:
+            names = list(self._waves)[:limit]
+            waves = [self._waves.pop(name) for name in names]
+        for name, wave in zip(names, waves):
+            self._make_sound(name, wave)
+
+    def wait_until_loaded(self, names=None):
+        """ makes sure sounds are ready to play, loading any that aren't yet
+
+        Args:
+            names (list of strings): The sounds to wait for (None waits for all of them).
+        """
+        if not self._is_threaded():
+            self._load(names)
+            return
+        # the audio thread owns the sounds, so it loads them while this waits (for a while; any
+        # sounds it hasn't loaded by then are loaded when they are first played)
+        done = threading.Event()
+        self._send(("load", time.perf_counter(), names, done))
+        done.wait(constants.AUDIO_LOAD_TIMEOUT)
+
+    def _load(self, names):
+        """ loads the given sounds (None loads all of them)"""
+        for name in self._files if names is None else names:
+            self._get_pool(name)
+
+    def get_load_progress(self):
+        """ gets how many of the sounds have been decoded
+
+        Returns:
+            Tuple(int, int): The number decoded and the number of sounds.
+        """
+        with self._loaded:
+            return (len(self._load_ms), len(self._files))
+
+    def get_load_stats(self):
+        """ gets how long loading the sounds took
+
+        Returns:
+            dict: "decode_ms" is the time each decoded sound took { key: sound name, value:
+                milliseconds }, "seconds" is the time from starting to load until every sound
+                was ready (None until then).
+        """
+        with self._loaded:
+            decode_ms = dict(self._load_ms)
+        return {"decode_ms": decode_ms, "seconds": self._load_seconds}
+
+    def get_voice_stats(self):
+        """ gets how many sounds were played, how many of those stole a busy voice and how
+            many were dropped because too many voices were playing
+
+        Returns:
+            dict: { key: "played", "stolen" or "dropped", value: number of sounds }
+        """
+        return dict(self._voice_stats)
+
+    def _get_stream(self, music):
+        """ gets a music track's stream, opening it the first time (which decodes nothing)"""
+        stream = self._streams.get(music)
+        if stream is None:
+            stream = pyray.load_music_stream(self._music_files[music])
+            stream.looping = True
+            self._streams[music] = stream
+        return stream
+
+    def get_queue_stats(self):
+        """ gets how the audio thread is keeping up (all zero when not threaded)
+
+        Returns:
+            dict: "depth" is how many commands are waiting now, "max_depth" the most there have
+                been, "commands" how many have been carried out, "errors" how many of those
+                failed, and "mean_latency_ms" and "max_latency_ms" how long they waited between
+                being sent and carried out.
+        """
+        stats = self._queue_stats
+        commands = stats["commands"]
+        return {
+            "depth": self._commands.qsize() if self._commands is not None else 0,
+            "max_depth": stats["max_depth"],
+            "commands": commands,
+            "errors": stats["errors"],
+            "mean_latency_ms": stats["total_latency_ms"] / commands if commands else 0,
+            "max_latency_ms": stats["max_latency_ms"]
+        }
+
+    def _is_threaded(self):
+        """ whether commands go to a running audio thread (if it has stopped, the game loop
+            plays the sounds itself rather than filling a queue nobody reads)"""
+        return self._audio_thread is not None and self._audio_thread.is_alive()
+
+    def _send(self, command):
+        """ puts a command on the audio thread's queue and keeps track of how deep it gets"""
+        self._commands.put(command)
+        depth = self._commands.qsize()
+        if depth > self._queue_stats["max_depth"]:
+            self._queue_stats["max_depth"] = depth
+
+    def _run_audio_thread(self):
+        """ carries out commands until told to stop, topping up the music streams whenever no
+            command comes for a while (runs on the audio thread)"""
+        while True:
+            try:
+                command = self._commands.get(timeout=constants.AUDIO_THREAD_WAIT)
+            except queue.Empty:
+                command = None
+            if command is not None and command[0] == "stop":
+                return
+            # a command that fails is reported and skipped, the thread keeps going
+            try:
+                self._run_command(command)
+            except Exception:
+                self._queue_stats["errors"] += 1
+                traceback.print_exc()
+            finally:
+                # never leave wait_until_loaded waiting
+                if command is not None and command[0] == "load":
+                    command[3].set()
+
+    def _run_command(self, command):
+        """ carries out one command (None when none came, which only tops up the music)"""
+        if command is None:
+            self._update_music(time.monotonic())
+            return
+        stats = self._queue_stats
+        kind = command[0]
+        latency = (time.perf_counter() - command[1]) * 1000
+        stats["commands"] += 1
+        stats["total_latency_ms"] += latency
+        if latency > stats["max_latency_ms"]:
+            stats["max_latency_ms"] = latency
+        if kind == "frame":
+            self._play_frame(command[2], command[3], command[4])
+        elif kind == "load":
+            self._load(command[2])
+
     def release(self):
+        # stop the audio thread, then the loader, before unloading what they have made
+        if self._audio_thread is not None:
+            self._commands.put(("stop",))
+            self._audio_thread.join()
+            self._audio_thread = None
+        with self._loaded:
+            self._is_stopping = True
+        self._loader.join()
         self.unload_sounds()
         pyray.close_audio_device()
         
     def unload_sounds(self):
-        for sound in self._sounds.values():
-            pyray.unload_sound(sound)
-        self._sounds.clear()
+        for pool in self._pools.values():
+            pool.unload()
+        self._pools.clear()
+        for stream in self._streams.values():
+            pyray.unload_music_stream(stream)
+        self._streams.clear()
+        self._music_volumes.clear()
+        with self._loaded:
+            for wave in self._waves.values():
+                pyray.unload_wave(wave)
+            self._waves.clear()
+
+    def set_muted(self, muted):
+        """ stops playing new sounds and music while muted
+            (anything already asked for this frame is dropped too)"""
+        self._muted = muted
+        if muted:
+            self._pending_sounds.clear()
+            self._pending_loops.clear()
+            self._pending_music = None
 
     def play_sound(self, sound):
-        """ plays sound using string and looking it up in _sounds dictionary"""
-        pyray.play_sound(self._sounds[sound])
+        """ asks for a sound (a string key of _files) to be played when the frame is flushed
+            asking for the same sound again in the same frame plays it once"""
+        if self._muted:
+            return
+        self._pending_sounds[sound] = True
 
     def set_loop_sound(self, sound):
-        """ plays sound using string and looking it up in _sounds dictionary
-            checks to see if it's already playing"""
-        # only plays one at a time
-        if not pyray.is_sound_playing(self._sounds[sound]):
-            pyray.play_sound(self._sounds[sound])
+        """ asks for a sound to keep playing; it is started again when the frame is flushed
+            if it has finished"""
+        if self._muted:
+            return
+        self._pending_loops[sound] = True
 
+    def set_music(self, music):
+        """ asks for music to be playing ("menu-music", "game-music" or "none" for silence)
+            the last music asked for in a frame wins; any other song fades out"""
+        if self._muted:
+            return
+        self._pending_music = music
 
+    def flush(self):
+        """ plays everything asked for since the last flush. This is called once a frame (see
+            VideoService.flush_buffer), so a frame costs at most one play call per different
+            sound, however many actors asked for it.
 
-    def set_music(self, music):
-        """ plays music using string and looking it up in _sounds dictionary
-            stops any other songs playing"""
-
-        if music == "menu-music":
-            # stop current music playing if any
-            if pyray.is_sound_playing(self._sounds["game-music"]):
-                pyray.stop_sound(self._sounds["game-music"])
-            # play correct music if it's not already 
-            if not pyray.is_sound_playing(self._sounds["menu-music"]):
-                pyray.play_sound(self._sounds["menu-music"])
-                
-        if music == "game-music":
-            # stop current music playing if any
-            if pyray.is_sound_playing(self._sounds["menu-music"]):
-                pyray.stop_sound(self._sounds["menu-music"])
-            # play correct music if it's not already 
-            if not pyray.is_sound_playing(self._sounds["game-music"]):
-                pyray.play_sound(self._sounds["game-music"])
-
-        if music == "none":
-            # stop any music playing
-            if pyray.is_sound_playing(self._sounds["menu-music"]):
-                pyray.stop_sound(self._sounds["menu-music"])
-            # stop any music playing
-            if pyray.is_sound_playing(self._sounds["game-music"]):
-                pyray.stop_sound(self._sounds["game-music"])
-
-
-        
\ No newline at end of file
+            Whether a loop sound is still playing is remembered by its VoicePool rather than
+            asked of the audio device: a voice is known to be playing until its length has
+            passed, and only after that is the device asked (once per frame). The music streams
+            are topped up here too. In threaded mode all of this is handed to the audio thread
+            and flush returns straight away."""
+        sounds = list(self._pending_sounds)
+        loops = list(self._pending_loops)
+        music = self._pending_music
+        self._pending_sounds.clear()
+        self._pending_loops.clear()
+        self._pending_music = None
+        if not self._is_threaded():
+            self._play_frame(sounds, loops, music)
+        else:
+            self._send(("frame", time.perf_counter(), sounds, loops, music))
+
+    def _play_frame(self, sounds, loops, music):
+        """ plays one frame's sounds and loops, switches the music and tops up the music
+            streams (on the audio thread in threaded mode)"""
+        # make a few more of the files decoded in the background playable
+        self._make_ready_sounds(constants.SOUNDS_MADE_PER_FRAME)
+
+        now = time.monotonic()
+        for sound in sounds:
+            self._start(sound, now)
+
+        for sound in loops:
+            if not self._get_pool(sound).is_playing(now):
+                self._start(sound, now)
+
+        if music is not None and music != self._music:
+            self._music = music
+            # start the new track silent (unless it is still fading out) and fade it in
+            if music in self._music_files and music not in self._music_volumes:
+                stream = self._get_stream(music)
+                pyray.set_music_volume(stream, 0)
+                pyray.play_music_stream(stream)
+                self._music_volumes[music] = 0
+        self._update_music(now)
+
+    def _update_music(self, now):
+        """ moves the volume of every track playing toward full (the music that should be
+            playing) or silent (any other), stops the tracks that have faded out and gives the
+            rest of them more to play"""
+        elapsed = 0 if self._music_time is None else now - self._music_time
+        self._music_time = now
+        step = elapsed / constants.MUSIC_FADE_SECONDS
+        for music, volume in list(self._music_volumes.items()):
+            stream = self._streams[music]
+            if music == self._music:
+                target = min(volume + step, 1)
+            else:
+                target = max(volume - step, 0)
+            if target != volume:
+                if target == 0:
+                    pyray.stop_music_stream(stream)
+                    del self._music_volumes[music]
+                    continue
+                pyray.set_music_volume(stream, target)
+                self._music_volumes[music] = target
+            pyray.update_music_stream(stream)
+
+    def _start(self, sound, now):
+        """ plays a sound on one of its voices, unless too many voices are already playing
+            and it isn't a priority sound"""
+        pool = self._get_pool(sound)
+        if sound not in constants.PRIORITY_SOUNDS:
+            playing = 0
+            for other in self._pools.values():
+                playing += other.count_playing(now)
+            if playing >= constants.MAX_VOICES:
+                self._voice_stats["dropped"] += 1
+                return
+        self._voice_stats["played"] += 1
+        if pool.play(now):
+            self._voice_stats["stolen"] += 1
@@ -63,6 +63,12 @@ class KeyboardService:
         # for easily checking every letter key
         self._letters_list = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "q", "r", "s", "t", "u", "v", "w", "x", "y", "z"]
 
+    def update(self):
+        """Prepares for the next tick. Nothing to do here because pyray polls the keyboard
+        itself every time the frame is flushed.
+        """
+        pass
+
     def is_key_up(self, key):
         """Checks if the given key is currently up.
 
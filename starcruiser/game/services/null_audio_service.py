@@ -0,0 +1,134 @@
+from collections import Counter
+
+
+class NullAudioService:
+    """Plays nothing. A stand-in for AudioService that needs no audio device and loads no sound
+    files. It records the sounds the game asks for so they can be checked afterwards.
+
+    Like AudioService, requests are collected during the frame and only played when the frame is
+    flushed, with the same sound asked for twice in a frame played once.
+
+    Attributes:
+        _played (list of strings): Every sound played by flush, in order.
+        _sound_counts (Counter): How many times each sound was requested (played or looped).
+        _music (string): The music that is currently set ("none" if there isn't any).
+        _muted (bool): Whether requests are ignored instead of recorded.
+        _pending_sounds (dict): The sounds asked for since the last flush, in order.
+        _pending_music (string): The music asked for since the last flush (None if none was).
+    """
+
+    def __init__(self):
+        """Constructs a new NullAudioService."""
+        self._played = []
+        self._sound_counts = Counter()
+        self._music = "none"
+        self._muted = False
+        self._pending_sounds = {}
+        self._pending_music = None
+
+    def wait_until_loaded(self, names=None):
+        """Returns straight away, there is nothing to load.
+
+        Args:
+            names (list of strings): The sounds to wait for (None waits for all of them).
+        """
+        pass
+
+    def get_load_progress(self):
+        """Gets how many of the sounds have been decoded, which is none of none.
+
+        Returns:
+            Tuple(int, int): The number decoded and the number of sounds.
+        """
+        return (0, 0)
+
+    def get_load_stats(self):
+        """Gets how long loading the sounds took, which is no time at all.
+
+        Returns:
+            dict: "decode_ms" is the time each decoded sound took (empty), "seconds" is the time
+                until every sound was ready.
+        """
+        return {"decode_ms": {}, "seconds": 0}
+
+    def release(self):
+        """Stops the music. There is nothing else to release."""
+        self._music = "none"
+
+    def set_muted(self, muted):
+        """Ignores every request while muted (and drops the ones not flushed yet), like
+        AudioService plays nothing."""
+        self._muted = muted
+        if muted:
+            self._pending_sounds.clear()
+            self._pending_music = None
+
+    def play_sound(self, sound):
+        """Records a request to play the given sound when the frame is flushed."""
+        if self._muted:
+            return
+        self._pending_sounds[sound] = True
+        self._sound_counts[sound] += 1
+
+    def set_loop_sound(self, sound):
+        """Records a request to keep the given sound playing."""
+        if self._muted:
+            return
+        self._sound_counts[sound] += 1
+
+    def set_music(self, music):
+        """Remembers which music should be playing once the frame is flushed."""
+        if self._muted:
+            return
+        self._pending_music = music
+
+    def flush(self):
+        """Plays every different sound asked for since the last flush and switches the music."""
+        self._played.extend(self._pending_sounds)
+        self._pending_sounds.clear()
+        if self._pending_music is not None:
+            self._music = self._pending_music
+            self._pending_music = None
+
+    def get_played_sounds(self):
+        """Gets every sound played by flush, in order.
+
+        Returns:
+            list of strings: The sound names.
+        """
+        return self._played
+
+    def get_sound_counts(self):
+        """Gets how many times each sound was requested.
+
+        Returns:
+            Counter: { key: sound name, value: number of requests }
+        """
+        return self._sound_counts
+
+    def get_voice_stats(self):
+        """Gets how many sounds were played, stolen a voice or were dropped. Nothing is mixed, so
+        no voice is ever stolen and no sound dropped.
+
+        Returns:
+            dict: { key: "played", "stolen" or "dropped", value: number of sounds }
+        """
+        return {"played": len(self._played), "stolen": 0, "dropped": 0}
+
+    def get_queue_stats(self):
+        """Gets how the audio thread is keeping up. There is no audio thread, so it is all zero.
+
+        Returns:
+            dict: "depth", "max_depth", "commands", "errors", "mean_latency_ms" and
+                "max_latency_ms" (see AudioService.get_queue_stats).
+        """
+        return {"depth": 0, "max_depth": 0, "commands": 0, "errors": 0, "mean_latency_ms": 0,
+                "max_latency_ms": 0}
+
+    def get_music(self):
+        """Gets the music that is currently set.
+
+        Returns:
+            string: The music name ("none" if there isn't any).
+        """
+        return self._music
@@ -0,0 +1,168 @@
+import constants
+from game.shared.render_layer import RenderLayer
+from game.shared.text_grid import TextGrid
+
+
+class NullVideoService:
+    """Outputs nothing. A stand-in for VideoService that lets the game run without a window, for
+    example in CI or on a build box. It counts what would have been drawn so throughput can be
+    measured.
+
+    Attributes:
+        _audio_service (AudioService): Released when the window is closed.
+        _max_frames (int): Closes the window after this many frames (None runs until closed).
+        _is_open (bool): Whether or not the window is open.
+        _frame (int): How many frames have been flushed.
+        _draw_calls (int): How many draw calls have been made in total.
+        _frame_draw_calls (int): How many draw calls were made in the current frame.
+        _grid (TextGrid): Collects grid-aligned characters in grid mode (None otherwise).
+        _layers (dict): The layers drawn so far { key: name, value: RenderLayer }.
+    """
+
+    def __init__(self, audio_service, max_frames=None, grid=False):
+        """Constructs a new NullVideoService.
+
+        Args:
+            audio_service (AudioService): An instance of AudioService.
+            max_frames (int): Closes the window after this many frames (None runs until closed).
+            grid (bool): count draw calls the way VideoService's grid mode would make them.
+        """
+        self._audio_service = audio_service
+        self._max_frames = max_frames
+        self._is_open = False
+        self._frame = 0
+        self._draw_calls = 0
+        self._frame_draw_calls = 0
+        self._grid = TextGrid() if grid else None
+        self._layers = {}
+
+    def close_window(self):
+        """Closes the window and releases the audio service."""
+        if self._is_open:
+            self._is_open = False
+            self._audio_service.release()
+
+    def clear_buffer(self):
+        """Starts counting the draw calls of a new frame."""
+        self._frame_draw_calls = 0
+        if self._grid is not None:
+            self._grid.clear()
+
+    def draw_actor(self, actor, centered=False):
+        """Counts one draw call for the given actor.
+
+        Args:
+            actor (Actor): The actor to draw.
+        """
+        # in grid mode, characters on a cell are counted with the rest of their row later
+        if self._grid is not None and not centered and self._grid.put_actor(actor):
+            return
+        self._draw_calls += 1
+        self._frame_draw_calls += 1
+
+    def draw_actors(self, actors, centered=False):
+        """Counts one draw call for each of the given actors.
+
+        Args:
+            actors (list): A list of actors to draw.
+        """
+        for actor in actors:
+            self.draw_actor(actor, centered)
+
+    def draw_layer(self, name, actors, centered=False):
+        """Counts the draw calls VideoService.draw_layer would make: one for each actor when the
+        layer has changed, plus one to copy the layer to the screen.
+
+        Args:
+            name (string): The name of the layer.
+            actors (list): A list of actors to draw.
+            centered (bool): Whether to center the text on each actor's position.
+        """
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = self._layers[name] = RenderLayer(name)
+        count = 0
+        if layer.update(RenderLayer.get_signature(actors, centered)):
+            count += len(actors)
+        if actors:
+            count += 1
+        self._draw_calls += count
+        self._frame_draw_calls += count
+
+    def get_layer_renders(self):
+        """Gets how many times each layer has been drawn again because it changed.
+
+        Returns:
+            dict: The number of renders for each layer name.
+        """
+        return {name: layer.get_renders() for name, layer in self._layers.items()}
+
+    def draw_sparks(self, spark_system):
+        """Counts one draw call for each spark in a SparkSystem.
+
+        Args:
+            spark_system (SparkSystem): The sparks to draw.
+        """
+        count = spark_system.get_count()
+        self._draw_calls += count
+        self._frame_draw_calls += count
+
+    def flush_buffer(self):
+        """Finishes the current frame and plays the sounds asked for during it."""
+        self._audio_service.flush()
+        if self._grid is not None:
+            runs = len(self._grid.get_runs())
+            self._draw_calls += runs
+            self._frame_draw_calls += runs
+        self._frame += 1
+
+    def get_time(self):
+        """Gets the simulated time since the window opened. Every frame lasts exactly one tick so
+        headless runs are repeatable and never wait.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+        return self._frame / constants.FRAME_RATE
+
+    def is_window_open(self):
+        """Whether or not the window is still open.
+
+        Returns:
+            bool: True until the window is closed or the frame limit is reached.
+        """
+        if self._max_frames is not None and self._frame >= self._max_frames:
+            return False
+        return self._is_open
+
+    def open_window(self):
+        """Opens the (invisible) window."""
+        self._is_open = True
+
+    def set_interpolation(self, amount):
+        """Ignored, nothing is drawn."""
+        pass
+
+    def get_frame_count(self):
+        """Gets how many frames have been flushed.
+
+        Returns:
+            int: The number of frames.
+        """
+        return self._frame
+
+    def get_draw_calls(self):
+        """Gets how many draw calls have been made since the window opened.
+
+        Returns:
+            int: The total number of draw calls.
+        """
+        return self._draw_calls
+
+    def get_frame_draw_calls(self):
+        """Gets how many draw calls were made in the current (or last) frame.
+
+        Returns:
+            int: The number of draw calls.
+        """
+        return self._frame_draw_calls
@@ -0,0 +1,63 @@
+from game.shared.input_log import InputLog, KEYS
+
+
+class RecordingKeyboardService:
+    """Reads another keyboard service and records what it read.
+
+    The responsibility of RecordingKeyboardService is to write the keys held down on every tick to
+    an InputLog. The game is answered from the recorded keys rather than the keyboard itself, so
+    the game that was played sees exactly the input a replay will see.
+
+    Attributes:
+        _keyboard_service (KeyboardService): The keyboard being recorded.
+        _log (InputLog): Where the keys are recorded.
+        _bits (dict): The bit of each key { key: name, value: bit }.
+        _mask (int): The keys held down on the current tick, as a bitmask.
+    """
+
+    def __init__(self, keyboard_service, log):
+        """Constructs a new RecordingKeyboardService.
+
+        Args:
+            keyboard_service (KeyboardService): The keyboard to record.
+            log (InputLog): Where to record the keys.
+        """
+        self._keyboard_service = keyboard_service
+        self._log = log
+        self._bits = {key: 1 << bit for bit, key in enumerate(KEYS)}
+        self._mask = 0
+
+    def get_log(self):
+        return self._log
+
+    def update(self):
+        """Reads the keyboard for the next tick and records it."""
+        self._keyboard_service.update()
+        self._mask = InputLog.encode_keys(self._keyboard_service)
+        self._log.append(self._mask)
+
+    def is_key_up(self, key):
+        """Checks if the given key was up when this tick was recorded.
+
+        Args:
+            key (string): The given key (up, down, left, right, space)
+        """
+        return not self._mask & self._bits[key.lower()]
+
+    def is_key_down(self, key):
+        """Checks if the given key was down when this tick was recorded.
+
+        Args:
+            key (string): The given key (up, down, left, right, space)
+        """
+        return bool(self._mask & self._bits[key.lower()])
+
+    def is_any_letter_key_down(self):
+        """Checks if any letter keys were down when this tick was recorded.
+        """
+        for key in KEYS:
+            if len(key) == 1 and self._mask & self._bits[key]:
+                # return the letter
+                return key
+        # else return False
+        return False
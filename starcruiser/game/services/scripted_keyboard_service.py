@@ -0,0 +1,82 @@
+class ScriptedKeyboardService:
+    """Plays back key states from a script instead of reading the keyboard.
+
+    The responsibility of ScriptedKeyboardService is to answer the same questions as
+    KeyboardService so the game can be driven without a window (for example in CI).
+
+    Attributes:
+        _script (list): (tick, keys) pairs sorted by tick. The keys (list of strings) are held down
+            from that tick until the next pair.
+        _tick (int): The current tick (-1 before the first update).
+        _next (int): Index of the next pair in the script.
+        _keys_down (frozenset): The keys that are currently held down.
+    """
+
+    def __init__(self, script=None):
+        """Constructs a new ScriptedKeyboardService.
+
+        Args:
+            script (list): (tick, keys) pairs sorted by tick. Every key is up once the script runs out
+                of pairs that change it.
+        """
+        self._script = list(script or [])
+        self._tick = -1
+        self._next = 0
+        self._keys_down = frozenset()
+
+        # for easily checking every letter key
+        self._letters_list = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "q", "r", "s", "t", "u", "v", "w", "x", "y", "z"]
+
+    def update(self):
+        """Advances the script to the next tick."""
+        self._tick += 1
+        while self._next < len(self._script) and self._script[self._next][0] <= self._tick:
+            self._keys_down = frozenset(key.lower() for key in self._script[self._next][1])
+            self._next += 1
+
+    def seek(self, tick):
+        """Jumps to the given tick, as if update had been called until the tick was reached.
+
+        Args:
+            tick (int): The tick to jump to (-1 goes back to before the first update).
+        """
+        self._tick = tick
+        self._next = 0
+        self._keys_down = frozenset()
+        while self._next < len(self._script) and self._script[self._next][0] <= tick:
+            self._keys_down = frozenset(key.lower() for key in self._script[self._next][1])
+            self._next += 1
+
+    def get_tick(self):
+        """Gets the current tick.
+
+        Returns:
+            int: The current tick (-1 before the first update).
+        """
+        return self._tick
+
+    def is_key_up(self, key):
+        """Checks if the given key is currently up.
+
+        Args:
+            key (string): The given key (up, down, left, right, space)
+        """
+        return key.lower() not in self._keys_down
+
+    def is_key_down(self, key):
+        """Checks if the given key is currently down.
+
+        Args:
+            key (string): The given key (up, down, left, right, space)
+        """
+        return key.lower() in self._keys_down
+
+    def is_any_letter_key_down(self):
+        """Checks if any letter keys are currently down.
+        """
+        for letter in self._letters_list:
+            if letter in self._keys_down:
+                # return the letter
+                return letter
+        # else return False
+        return False
@@ -1,25 +1,61 @@
+from collections import OrderedDict
 import pyray
 import constants
+from game.shared.color import Color
+from game.shared.render_layer import RenderLayer
+from game.shared.text_grid import TextGrid
+
+# how many measured text widths to remember (the least recently used are forgotten first)
+MAX_MEASURED_TEXTS = 512
 
 
 class VideoService:
     """Outputs the game state. The responsibility of the class of objects is to draw the game state
     on the screen.
+
+    In grid mode, one-character actors that sit exactly on a grid cell are not drawn one by one.
+    They are collected in a TextGrid and drawn at the end of the frame, one draw call for each run
+    of same-colored characters in a row, using a copy of the default font in which every
+    character is exactly one cell wide. Those actors are drawn where they are, without sliding
+    between ticks, and on top of everything else.
+
+    Things that rarely change (menus, the HUD, the debug grid) are drawn as layers: each layer is
+    drawn into its own render texture only when it changes, and every frame just copies the
+    texture to the screen (see draw_layer).
+
+    Text is drawn with the font that is loaded when the window opens, and the width of centered
+    text is measured once and remembered, so the same text isn't laid out again every frame.
     """
 
-    def __init__(self, audio_service, debug=False):
+    def __init__(self, audio_service, debug=False, grid=False):
         """Constructs a new VideoService using the specified debug mode.
 
         Args:
             debug (bool): whether or not to draw in debug mode.
+            grid (bool): whether or not to batch grid-aligned characters into rows.
         """
         self._audio_service = audio_service
         self._debug = debug
-        
+        # how far between the last two ticks actors are drawn (see set_interpolation)
+        self._interpolation = 1
+        # grid mode (the font is made when the window opens)
+        self._grid = TextGrid() if grid else None
+        self._grid_font = None
+        self._grid_glyphs = None
+        # the cached layers { key: name, value: RenderLayer }
+        self._layers = {}
+        # the font all text is drawn with (loaded when the window opens)
+        self._font = None
+        # widths of measured text { key: (text, font size), value: width }, oldest first
+        self._text_widths = OrderedDict()
 
     def close_window(self):
         """Closes the window and releases all computing resources."""
         self._audio_service.release()
+        for layer in self._layers.values():
+            if layer.get_image() is not None:
+                pyray.unload_render_texture(layer.get_image())
+        self._layers = {}
         pyray.close_window()
 
     def clear_buffer(self):
@@ -29,7 +65,9 @@ class VideoService:
         pyray.begin_drawing()
         pyray.clear_background(pyray.BLACK)
         if self._debug == True:
-            self._draw_grid()
+            self._draw_debug_grid()
+        if self._grid is not None:
+            self._grid.clear()
 
     def draw_actor(self, actor, centered=False):
         """Draws the given actor's text on the screen.
@@ -37,18 +75,12 @@ class VideoService:
         Args:
             actor (Actor): The actor to draw.
         """
-        text = actor.get_text()
-        x = actor.get_position().get_x()
-        y = actor.get_position().get_y()
-        font_size = actor.get_font_size()
-        color = actor.get_color().to_tuple()
+        # in grid mode, characters on a cell are drawn with the rest of their row later
+        if self._grid is not None and not centered and self._grid.put_actor(actor):
+            return
 
-        if centered:
-            width = pyray.measure_text(text, font_size)
-            offset = int(width / 2)
-            x -= offset
-
-        pyray.draw_text(text, x, y, font_size, color)
+        x, y = actor.get_interpolated_position(self._interpolation)
+        self._draw_text(actor, round(x), round(y), centered)
 
     def draw_actors(self, actors, centered=False):
         """Draws the text for the given list of actors on the screen.
@@ -59,12 +91,108 @@ class VideoService:
         for actor in actors:
             self.draw_actor(actor, centered)
 
+    def draw_layer(self, name, actors, centered=False):
+        """Draws a group of actors that rarely changes. The actors are drawn into the layer's
+        texture only when one of them changed since the last frame (or actors were added or
+        removed), otherwise the texture from before is copied to the screen in one draw call.
+        Layer actors are drawn where they are, without sliding between ticks.
+
+        Args:
+            name (string): The name of the layer (each group of actors needs its own).
+            actors (list): A list of actors to draw.
+            centered (bool): Whether to center the text on each actor's position.
+        """
+        layer = self._get_layer(name)
+        if layer.update(RenderLayer.get_signature(actors, centered)):
+            pyray.begin_texture_mode(layer.get_image())
+            pyray.clear_background(pyray.BLANK)
+            for actor in actors:
+                position = actor.get_position()
+                self._draw_text(actor, round(position.get_x()), round(position.get_y()), centered)
+            pyray.end_texture_mode()
+        # an empty layer has nothing to copy
+        if actors:
+            self._draw_layer_image(layer)
+
+    def _draw_text(self, actor, x, y, centered):
+        """Draws an actor's text at the given screen coordinates."""
+        text = actor.get_text()
+        font_size = actor.get_font_size()
+        color = self._get_native_color(actor.get_color())
+
+        if centered:
+            x -= self._get_x_offset(text, font_size)
+
+        pyray.draw_text_ex(self._font, text, pyray.Vector2(x, y), font_size,
+                           self._get_spacing(font_size), color)
+
+    def _get_layer(self, name):
+        """Gets the layer with the given name, making it and its texture the first time."""
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = self._layers[name] = RenderLayer(name)
+            layer.set_image(pyray.load_render_texture(constants.MAX_X, constants.MAX_Y))
+        return layer
+
+    def _draw_layer_image(self, layer):
+        """Copies a layer's texture to the screen."""
+        texture = layer.get_image().texture
+        # render textures are stored upside down, so read them with a negative height
+        source = pyray.Rectangle(0, 0, texture.width, -texture.height)
+        pyray.draw_texture_rec(texture, source, pyray.Vector2(0, 0), pyray.WHITE)
+
+    def _get_native_color(self, color):
+        """Gets a color as a raylib Color struct, converting it only the first time.
+
+        Args:
+            color (Color): The color.
+
+        Returns:
+            Color struct: The color ready to pass to pyray.
+        """
+        native = color.get_native()
+        if native is None:
+            # the struct lives in the memory of the pointer, so keep both
+            pointer = pyray.ffi.new("Color *", color.to_tuple())
+            native = pointer[0]
+            color.set_native(native, pointer)
+        return native
+
+    def draw_sparks(self, spark_system):
+        """Draws every spark in a SparkSystem, each in its own shade of grey.
+
+        Args:
+            spark_system (SparkSystem): The sparks to draw.
+        """
+        text = spark_system.get_text()
+        font_size = spark_system.get_font_size()
+        spacing = self._get_spacing(font_size)
+        amount = self._interpolation
+        x, y, last_x, last_y, bright = spark_system.get_sparks()
+        for i in range(len(x)):
+            # draw part-way between the spark's last two positions
+            draw_x = round(last_x[i] + (x[i] - last_x[i]) * amount)
+            draw_y = round(last_y[i] + (y[i] - last_y[i]) * amount)
+            pyray.draw_text_ex(self._font, text, pyray.Vector2(draw_x, draw_y), font_size, spacing,
+                               self._get_native_color(Color.grey(bright[i])))
+
     def flush_buffer(self):
         """Copies the buffer contents to the screen. This method should be called at the end of
-        the game's output phase.
+        the game's output phase. The sounds asked for during the frame are played too.
         """
+        self._audio_service.flush()
+        if self._grid is not None:
+            self._draw_grid_runs()
         pyray.end_drawing()
 
+    def get_time(self):
+        """Gets the time since the window opened.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+        return pyray.get_time()
+
     def is_window_open(self):
         """Whether or not the window was closed by the user.
 
@@ -80,8 +208,55 @@ class VideoService:
             title (string): The title of the window.
         """
 
+        # draw in step with the display's refresh rate (the Director keeps the game speed fixed)
+        pyray.set_config_flags(pyray.FLAG_VSYNC_HINT)
         pyray.init_window(constants.MAX_X, constants.MAX_Y, constants.CAPTION)
-        pyray.set_target_fps(constants.FRAME_RATE)
+        pyray.set_target_fps(constants.RENDER_RATE)
+        self._font = pyray.get_font_default()
+        self._text_widths.clear()
+        if self._grid is not None:
+            self._make_grid_font()
+
+    def set_interpolation(self, amount):
+        """Sets how far between their last two tick positions actors are drawn this frame.
+
+        Args:
+            amount (float): 0 draws actors where they were at the last tick, 1 where they are now.
+        """
+        self._interpolation = amount
+
+    def _make_grid_font(self):
+        """Makes a copy of the default font in which every character moves the next one exactly
+        one cell to the right, so a whole row of cells can be drawn as one string.
+        """
+        font = pyray.get_font_default()
+        glyphs = pyray.ffi.new("GlyphInfo[]", font.glyphCount)
+        # draw_text_ex scales advanceX by font size / base size
+        advance = round(font.baseSize * self._grid.get_cell_size() / self._grid.get_font_size())
+        for i in range(font.glyphCount):
+            glyphs[i] = font.glyphs[i]
+            glyphs[i].advanceX = advance
+        font.glyphs = glyphs
+        # keep the new glyph array alive as long as the font uses it
+        self._grid_glyphs = glyphs
+        self._grid_font = font
+
+    def _draw_grid_runs(self):
+        """Draws the characters collected in the grid, one call per run of one color."""
+        font_size = self._grid.get_font_size()
+        for x, y, text, color in self._grid.get_runs():
+            pyray.draw_text_ex(self._grid_font, text, pyray.Vector2(x, y), font_size, 0,
+                               self._get_native_color(color))
+
+    def _draw_debug_grid(self):
+        """Draws the debug grid, which never changes, from its layer."""
+        layer = self._get_layer("debug grid")
+        if layer.update(("grid",)):
+            pyray.begin_texture_mode(layer.get_image())
+            pyray.clear_background(pyray.BLANK)
+            self._draw_grid()
+            pyray.end_texture_mode()
+        self._draw_layer_image(layer)
 
     def _draw_grid(self):
         """Draws a grid on the screen."""
@@ -91,6 +266,28 @@ class VideoService:
         for x in range(0, constants.MAX_X, constants.CELL_SIZE):
             pyray.draw_line(x, 0, x, constants.MAX_Y, pyray.GRAY)
 
+    def _get_spacing(self, font_size):
+        """Gets the space between characters that pyray.draw_text uses for the default font."""
+        return max(font_size, 10) // 10
+
     def _get_x_offset(self, text, font_size):
-        width = pyray.measure_text(text, font_size)
+        """Gets how far left of its position text has to start to be centered on it.
+
+        Args:
+            text (string): The text.
+            font_size (int): The font size.
+
+        Returns:
+            int: Half the width of the text.
+        """
+        key = (text, font_size)
+        width = self._text_widths.get(key)
+        if width is None:
+            width = int(pyray.measure_text_ex(self._font, text, font_size,
+                                              self._get_spacing(font_size)).x)
+            self._text_widths[key] = width
+            if len(self._text_widths) > MAX_MEASURED_TEXTS:
+                self._text_widths.popitem(last=False)
+        else:
+            self._text_widths.move_to_end(key)
         return int(width / 2)
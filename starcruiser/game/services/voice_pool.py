@@ -0,0 +1,105 @@
+import pyray
+
+# sound aliases arrived in raylib 5.0; with an older raylib every sound has a single voice
+HAS_SOUND_ALIASES = hasattr(pyray, "load_sound_alias")
+
+
+class VoicePool:
+    """The voices one sound can be played with at the same time.
+
+    The responsibility of VoicePool is to let a sound overlap itself a limited number of times.
+    The first voice is the loaded sound and the others are aliases of it, which share its
+    samples, so more voices cost no more memory (before raylib 5.0 there are no aliases, so there
+    is only the one voice, which restarts like a sound always did). Playing picks a voice that
+    has finished. When every voice is busy, the one that started first is restarted (stolen)
+    instead.
+
+    When each voice will finish is worked out from the sound's length, so choosing a voice and
+    counting the voices playing doesn't call the audio device.
+
+    Attributes:
+        _voices (list): The Sound of each voice (the loaded sound first, then its aliases).
+        _length (float): How long the sound lasts in seconds.
+        _ends (list): When each voice will finish (None if it isn't playing).
+    """
+
+    def __init__(self, sound, voice_count):
+        """Constructs a new VoicePool, making the aliases of a loaded sound.
+
+        Args:
+            sound (Sound): The loaded sound.
+            voice_count (int): How many voices (at least one).
+        """
+        if not HAS_SOUND_ALIASES:
+            voice_count = 1
+        self._voices = [sound]
+        for i in range(voice_count - 1):
+            self._voices.append(pyray.load_sound_alias(sound))
+        sample_rate = sound.stream.sampleRate
+        self._length = sound.frameCount / sample_rate if sample_rate else 0
+        self._ends = [None] * len(self._voices)
+
+    def count_playing(self, now):
+        """Counts the voices that haven't finished yet.
+
+        Args:
+            now (float): The current time (time.monotonic).
+
+        Returns:
+            int: The number of voices playing.
+        """
+        count = 0
+        for end in self._ends:
+            if end is not None and end > now:
+                count += 1
+        return count
+
+    def is_playing(self, now):
+        """Whether any voice is still playing. The audio device is only asked about a voice once
+        its length has passed and it should have finished.
+
+        Args:
+            now (float): The current time (time.monotonic).
+
+        Returns:
+            bool: True if a voice is playing.
+        """
+        for index, end in enumerate(self._ends):
+            if end is None:
+                continue
+            if end > now or pyray.is_sound_playing(self._voices[index]):
+                return True
+            self._ends[index] = None
+        return False
+
+    def play(self, now):
+        """Plays the sound on a voice that has finished, or steals the one that started first if
+        none has.
+
+        Args:
+            now (float): The current time (time.monotonic).
+
+        Returns:
+            bool: True if a voice was stolen.
+        """
+        index = 0
+        stolen = True
+        for i, end in enumerate(self._ends):
+            if end is None or end <= now:
+                index = i
+                stolen = False
+                break
+            if end < self._ends[index]:
+                index = i
+        # playing a voice that is still playing restarts it
+        pyray.play_sound(self._voices[index])
+        self._ends[index] = now + self._length
+        return stolen
+
+    def unload(self):
+        """Unloads the aliases and then the sound they share."""
+        for alias in self._voices[1:]:
+            pyray.unload_sound_alias(alias)
+        pyray.unload_sound(self._voices[0])
+        self._voices = []
+        self._ends = []
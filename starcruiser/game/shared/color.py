@@ -1,20 +1,33 @@
 class Color:
     """A color.
 
-    The responsibility of Color is to hold and provide information about itself. Color has a few 
+    The responsibility of Color is to hold and provide information about itself. Color has a few
     convenience methods for comparing them and converting to a tuple.
 
+    Colors never change, so the same values only need one Color. Color.get and Color.grey return
+    the shared one from a palette, which lets the video service convert each color to the form
+    the graphics library wants once (see get_native) instead of on every draw.
+
     Attributes:
         _red (int): The red value.
         _green (int): The green value.
         _blue (int): The blue value.
         _alpha (int): The alpha or opacity.
+        _native (any): The color converted for the graphics library (None until converted).
+        _native_owner (any): Whatever keeps the memory of _native alive.
     """
-    
+
+    __slots__ = ("_red", "_green", "_blue", "_alpha", "_native", "_native_owner")
+
+    # every color handed out by get { key: (red, green, blue, alpha), value: Color }
+    _palette = {}
+    # the 256 shades of grey from black (0) to white (255), filled in below the class
+    _greys = []
+
     def __init__(self, red, green, blue, alpha = 255):
-        """Constructs a new Color using the specified red, green, blue and alpha values. The alpha 
-        value is the color's opacity.
-        
+        """Constructs a new Color using the specified red, green, blue and alpha values. The alpha
+        value is the color's opacity. Use Color.get instead to share colors from the palette.
+
         Args:
             red (int): A red value.
             green (int): A green value.
@@ -23,8 +36,59 @@ class Color:
         """
         self._red = red
         self._green = green
-        self._blue = blue 
+        self._blue = blue
         self._alpha = alpha
+        self._native = None
+        self._native_owner = None
+
+    @classmethod
+    def get(cls, red, green, blue, alpha = 255):
+        """Gets the palette's color with the given values, adding it the first time.
+
+        Args:
+            red (int): A red value.
+            green (int): A green value.
+            blue (int): A blue value.
+            alpha (int): An alpha or opacity.
+
+        Returns:
+            Color: The shared color.
+        """
+        key = (red, green, blue, alpha)
+        color = cls._palette.get(key)
+        if color is None:
+            color = cls._palette[key] = cls(red, green, blue, alpha)
+        return color
+
+    @classmethod
+    def grey(cls, level):
+        """Gets the palette's grey with the given brightness.
+
+        Args:
+            level (int): 0 is black, 255 is white.
+
+        Returns:
+            Color: The shared color.
+        """
+        return cls._greys[level]
+
+    def get_native(self):
+        """Gets the color converted for the graphics library, if it has been converted.
+
+        Returns:
+            any: The converted color (None if it hasn't been converted yet).
+        """
+        return self._native
+
+    def set_native(self, native, owner=None):
+        """Remembers the color converted for the graphics library so it is only converted once.
+
+        Args:
+            native (any): The converted color.
+            owner (any): Whatever has to stay alive for the converted color to stay valid.
+        """
+        self._native = native
+        self._native_owner = owner
 
     def to_tuple(self):
         """Gets the color as a tuple of four values (red, green, blue, alpha).
@@ -32,4 +96,12 @@ class Color:
         Returns:
             Tuple(int, int, int, int): The color as a tuple.
         """
-        return (self._red, self._green, self._blue, self._alpha)   
\ No newline at end of file
+        return (self._red, self._green, self._blue, self._alpha)
+
+    def __deepcopy__(self, memo):
+        # colors never change, so a replay keyframe (see ReplayDirector) shares them instead of
+        # copying them out of the palette
+        return self
+
+
+Color._greys = [Color.get(level, level, level) for level in range(256)]
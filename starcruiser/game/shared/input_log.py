@@ -0,0 +1,150 @@
+import struct
+import constants
+
+# every key the game reads, in bit order (bit 0 is "left")
+KEYS = ("left", "right", "up", "down", "space", "enter", "back",
+        "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m",
+        "n", "o", "p", "q", "r", "s", "t", "u", "v", "w", "x", "y", "z")
+# file layout: magic, version, frame rate, seed, tick count, run count, then the runs
+MAGIC = b"SCRL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHqII")
+# one run: how many ticks in a row had the same keys down, and those keys as a bitmask
+RUN = struct.Struct("<IQ")
+
+
+class InputLog:
+    """The keys that were held down on every tick of a game, and the seed it was played with.
+
+    The responsibility of InputLog is to store recorded input compactly and read it back. Each
+    tick's keys are a bitmask (one bit per name in KEYS), and ticks in a row with the same keys
+    are stored once as a run, so holding a key for a minute costs 12 bytes. The seed goes in the
+    file's header, so seeding the random module with it and playing the input back through a
+    ScriptedKeyboardService (see get_key_script) plays the same game again.
+
+    Attributes:
+        _seed (int): What the random module was seeded with.
+        _frame_rate (int): The ticks per second of the recorded game.
+        _runs (list): [tick count, bitmask] for each run, in order.
+        _ticks (int): How many ticks have been recorded.
+    """
+
+    def __init__(self, seed=0, frame_rate=constants.FRAME_RATE):
+        """Constructs a new, empty InputLog.
+
+        Args:
+            seed (int): What the random module was seeded with.
+            frame_rate (int): The ticks per second of the recorded game.
+        """
+        self._seed = seed
+        self._frame_rate = frame_rate
+        self._runs = []
+        self._ticks = 0
+
+    def get_seed(self):
+        return self._seed
+
+    def get_frame_rate(self):
+        return self._frame_rate
+
+    def get_tick_count(self):
+        return self._ticks
+
+    def get_runs(self):
+        """Gets the recorded runs.
+
+        Returns:
+            list: [tick count, bitmask] for each run, in order.
+        """
+        return self._runs
+
+    def append(self, mask):
+        """Records the keys held down on the next tick.
+
+        Args:
+            mask (int): The keys as a bitmask (see encode_keys).
+        """
+        if self._runs and self._runs[-1][1] == mask:
+            self._runs[-1][0] += 1
+        else:
+            self._runs.append([1, mask])
+        self._ticks += 1
+
+    def get_key_script(self):
+        """Gets the recorded input as a key script for ScriptedKeyboardService.
+
+        Returns:
+            list: (tick, keys) pairs sorted by tick, one for each run.
+        """
+        script = []
+        tick = 0
+        for count, mask in self._runs:
+            script.append((tick, InputLog.decode_mask(mask)))
+            tick += count
+        return script
+
+    def save(self, path):
+        """Writes the log to a binary file.
+
+        Args:
+            path (string): Where to save it.
+        """
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self._frame_rate, self._seed, self._ticks,
+                                   len(self._runs)))
+            for count, mask in self._runs:
+                file.write(RUN.pack(count, mask))
+
+    @classmethod
+    def load(cls, path):
+        """Reads a log written by save.
+
+        Args:
+            path (string): The file to read.
+
+        Returns:
+            InputLog: The log.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not an input log")
+        magic, version, frame_rate, seed, ticks, run_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an input log this version can read")
+        if len(data) != HEADER.size + run_count * RUN.size:
+            raise ValueError(f"{path} is truncated")
+
+        log = cls(seed, frame_rate)
+        for count, mask in RUN.iter_unpack(data[HEADER.size:]):
+            log._runs.append([count, mask])
+        log._ticks = ticks
+        return log
+
+    @staticmethod
+    def encode_keys(keyboard_service):
+        """Gets the keys a keyboard service says are down as a bitmask.
+
+        Args:
+            keyboard_service (KeyboardService): The keyboard to read.
+
+        Returns:
+            int: One bit for each key in KEYS that is down.
+        """
+        mask = 0
+        for bit, key in enumerate(KEYS):
+            if keyboard_service.is_key_down(key):
+                mask |= 1 << bit
+        return mask
+
+    @staticmethod
+    def decode_mask(mask):
+        """Gets the names of the keys in a bitmask.
+
+        Args:
+            mask (int): A bitmask made by encode_keys.
+
+        Returns:
+            list: The names of the keys that are down.
+        """
+        return [key for bit, key in enumerate(KEYS) if mask & (1 << bit)]
@@ -0,0 +1,225 @@
+import constants
+from game.casting.composite_actor import CompositeActor
+
+
+class OccupancyRaster:
+    """A grid of every cell on the board and what is in it.
+
+    The responsibility of OccupancyRaster is to answer "what is in this cell?" and "where is the
+    next free (or taken) cell in this column?" without looping through the cast. It is marked out
+    of date once a frame, after the actors move (see MoveActorsAction), and whenever an actor in
+    one of its groups is removed from the cast, and rebuilt from every part of the actors in the
+    groups it tracks the first time it is asked something after that. A frame that asks nothing
+    (no spawns or upgrades) doesn't pay for a rebuild. Nothing should ask it during the move
+    phase, when it still holds where the actors were at the end of the last tick.
+
+    Each cell is one byte: 0 when free, otherwise the number of the group in it (its position in
+    the groups list plus one). Cells are stored a column at a time, so a column is one run of
+    bytes and searching down it is a single bytearray.find. The grid also covers a few rows above
+    the screen, where enemies are spawned. When two actors share a cell, it holds the group of
+    the last one marked (only the group is kept, not the actor).
+
+    Attributes:
+        _cast (Cast): The cast whose actors are tracked.
+        _is_stale (bool): Whether the actors may have moved since the cells were marked.
+        _columns (int): How many cells across.
+        _rows (int): How many cells down, including the rows above the screen.
+        _top_rows (int): How many of the rows are above the screen.
+        _groups (list): The names of the cast groups that are tracked.
+        _cells (bytearray): The group number of each cell (column by column).
+        _empty (bytes): All zeros, for clearing the cells in one copy.
+        _cell_offsets (dict): The part offsets of each layout in cells { key: offsets in screen
+            coordinates, value: offsets in cells }
+    """
+
+    def __init__(self, cast, groups, columns=constants.COLUMNS, rows=constants.ROWS,
+                 top_rows=constants.RASTER_TOP_ROWS):
+        """Constructs a new OccupancyRaster, out of date until it is first asked something.
+
+        Args:
+            cast (Cast): The cast whose actors are tracked.
+            groups (list): The names of the cast groups to track (at most 255).
+            columns (int): How many cells across.
+            rows (int): How many cells down the screen.
+            top_rows (int): How many more rows to keep above the screen.
+        """
+        self._cast = cast
+        self._is_stale = True
+        self._columns = columns
+        self._rows = rows + top_rows
+        self._top_rows = top_rows
+        self._groups = list(groups)
+        self._cells = bytearray(self._columns * self._rows)
+        self._empty = bytes(len(self._cells))
+        self._cell_offsets = {}
+
+    def invalidate(self):
+        """Marks the grid out of date because the actors have moved."""
+        self._is_stale = True
+
+    def is_tracking(self, group):
+        """Whether the grid marks the actors of the given group.
+
+        Args:
+            group (string): The name of the group.
+
+        Returns:
+            bool: True if the group is one of the tracked groups.
+        """
+        return group in self._groups
+
+    def _refresh(self):
+        """Clears the grid and marks the cell of every part of every actor in the tracked groups,
+        if the grid is out of date."""
+        if not self._is_stale:
+            return
+        self._is_stale = False
+        self._cells[:] = self._empty
+        for group in self._groups:
+            for actor in self._cast.get_actors_view(group):
+                self._mark(group, actor)
+
+    def mark(self, group, actor):
+        """Marks the cell of every part of an actor added to the cast since the grid was built.
+
+        Args:
+            group (string): The name of the actor's group (one of the tracked groups).
+            actor (Actor): The actor.
+        """
+        # an out of date grid is rebuilt from the cast, which already has the actor
+        if self._is_stale:
+            return
+        self._mark(group, actor)
+
+    def _mark(self, group, actor):
+        """Marks the cell of every part of an actor."""
+        code = self._groups.index(group) + 1
+        cell_size = constants.CELL_SIZE
+        cells = self._cells
+
+        if isinstance(actor, CompositeActor) and actor.has_layout():
+            # parts are whole cells away from the origin, so their cells are the origin's cell
+            # moved by the same number of cells
+            offsets = self._get_cell_offsets(actor.get_offsets())
+            position = actor.get_position()
+            column = int(position.get_x() // cell_size)
+            row = int(position.get_y() // cell_size) + self._top_rows
+            for column_offset, row_offset in offsets:
+                part_row = row + row_offset
+                if 0 <= part_row < self._rows:
+                    index = ((column + column_offset) % self._columns) * self._rows + part_row
+                    cells[index] = code
+            return
+
+        parts = actor.get_parts() if isinstance(actor, CompositeActor) else (actor,)
+        for part in parts:
+            position = part.get_position()
+            index = self.get_index(position.get_x(), position.get_y())
+            if index is not None:
+                cells[index] = code
+
+    def _get_cell_offsets(self, offsets):
+        """Gets a layout's part offsets in cells, working them out the first time.
+
+        Args:
+            offsets (frozenset): The (x, y) offset of every part in screen coordinates (see
+                CompositeActor.get_offsets).
+
+        Returns:
+            tuple: The (columns, rows) offset of every part.
+        """
+        cell_offsets = self._cell_offsets.get(offsets)
+        if cell_offsets is None:
+            cell_size = constants.CELL_SIZE
+            cell_offsets = tuple((x // cell_size, y // cell_size) for x, y in offsets)
+            self._cell_offsets[offsets] = cell_offsets
+        return cell_offsets
+
+    def get_index(self, x, y):
+        """Gets where the cell holding the given screen coordinates is in the grid.
+
+        Args:
+            x (int): The horizontal screen coordinate (wraps around the sides).
+            y (int): The vertical screen coordinate.
+
+        Returns:
+            int: The index of the cell (None if it is above or below the grid).
+        """
+        row = int(y // constants.CELL_SIZE) + self._top_rows
+        if row < 0 or row >= self._rows:
+            return None
+        column = int(x // constants.CELL_SIZE) % self._columns
+        return column * self._rows + row
+
+    def get_group(self, x, y):
+        """Gets the group of whatever is in the cell holding the given screen coordinates.
+
+        Args:
+            x (int): The horizontal screen coordinate.
+            y (int): The vertical screen coordinate.
+
+        Returns:
+            string: The name of the group (None if the cell is free or off the grid).
+        """
+        self._refresh()
+        index = self.get_index(x, y)
+        if index is None or not self._cells[index]:
+            return None
+        return self._groups[self._cells[index] - 1]
+
+    def is_free(self, x, y):
+        """Whether nothing is in the cell holding the given screen coordinates.
+
+        Args:
+            x (int): The horizontal screen coordinate.
+            y (int): The vertical screen coordinate.
+
+        Returns:
+            bool: True if the cell is free (cells off the grid are always free).
+        """
+        self._refresh()
+        index = self.get_index(x, y)
+        return index is None or not self._cells[index]
+
+    def find_free(self, x, top, bottom):
+        """Finds the first free cell in a column, searching down from one screen coordinate to
+        another.
+
+        Args:
+            x (int): The horizontal screen coordinate of the column.
+            top (int): Where to start searching (included).
+            bottom (int): Where to stop searching (included).
+
+        Returns:
+            int: The vertical screen coordinate of the free cell (None if there isn't one).
+        """
+        return self._find(0, x, top, bottom)
+
+    def find_group(self, group, x, top, bottom):
+        """Finds the first cell holding part of an actor in the given group in a column,
+        searching down from one screen coordinate to another.
+
+        Args:
+            group (string): The name of the group.
+            x (int): The horizontal screen coordinate of the column.
+            top (int): Where to start searching (included).
+            bottom (int): Where to stop searching (included).
+
+        Returns:
+            int: The vertical screen coordinate of the cell (None if there isn't one).
+        """
+        return self._find(self._groups.index(group) + 1, x, top, bottom)
+
+    def _find(self, code, x, top, bottom):
+        """Searches down part of a column for the first cell with the given group number."""
+        self._refresh()
+        cell_size = constants.CELL_SIZE
+        first = max(int(top // cell_size) + self._top_rows, 0)
+        last = min(int(bottom // cell_size) + self._top_rows, self._rows - 1)
+        if first > last:
+            return None
+        start = (int(x // cell_size) % self._columns) * self._rows
+        index = self._cells.find(code, start + first, start + last + 1)
+        if index < 0:
+            return None
+        return (index - start - self._top_rows) * cell_size
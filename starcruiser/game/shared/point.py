@@ -4,10 +4,18 @@ class Point:
     The responsibility of Point is to hold and provide information about itself. Point has a few 
     convenience methods for adding, scaling, and comparing them.
 
+    add, reverse and scale return a new Point. set, set_from, iadd and wrap change the Point
+    itself instead, so code that runs every tick (like moving actors) doesn't create new ones.
+    Only change a Point in place if you own it: an actor owns its position and velocity, and
+    set_position/set_velocity copy the given values into them.
+
     Attributes:
         _x (integer): The horizontal distance from the origin.
         _y (integer): The vertical distance from the origin.
     """
+
+    # only these two attributes, so points are small and quick to create
+    __slots__ = ("_x", "_y")
     
     def __init__(self, x, y):
         """Constructs a new Point using the specified x and y values.
@@ -32,6 +40,14 @@ class Point:
         y = self._y + other.get_y()
         return Point(x, y)
 
+    def copy(self):
+        """Gets a new point with the same x and y values.
+
+        Returns:
+            Point: The copy.
+        """
+        return Point(self._x, self._y)
+
     def equals(self, other):
         """Whether or not this Point is equal to the given one.
 
@@ -59,6 +75,61 @@ class Point:
         """
         return self._y
 
+    def iadd(self, other):
+        """Adds the given point to this one (changes this point).
+
+        Args:
+            other (Point): The Point to add.
+
+        Returns:
+            Point: This point.
+        """
+        self._x += other._x
+        self._y += other._y
+        return self
+
+    def set(self, x, y):
+        """Changes both values of this point.
+
+        Args:
+            x (int): The new x value.
+            y (int): The new y value.
+
+        Returns:
+            Point: This point.
+        """
+        self._x = x
+        self._y = y
+        return self
+
+    def set_from(self, other):
+        """Copies the values of the given point into this one.
+
+        Args:
+            other (Point): The Point to copy.
+
+        Returns:
+            Point: This point.
+        """
+        self._x = other._x
+        self._y = other._y
+        return self
+
+    def wrap(self, max_x, max_y=None):
+        """Wraps this point around the edges of the screen (changes this point).
+
+        Args:
+            max_x (int): x values wrap to stay from 0 up to (not including) max_x.
+            max_y (int): y values wrap the same way (None leaves y alone).
+
+        Returns:
+            Point: This point.
+        """
+        self._x %= max_x
+        if max_y is not None:
+            self._y %= max_y
+        return self
+
     def reverse(self):
         """Reverses the point by inverting both x and y values.
 
@@ -0,0 +1,72 @@
+class RenderLayer:
+    """A group of actors that is drawn once into an off-screen image and then reused.
+
+    The responsibility of RenderLayer is to know when its picture is out of date. A layer is
+    dirty when any of its actors changed its text, font size, color or position, or when actors
+    were added or removed, since the last time it was drawn. Menus, the high score table and the
+    HUD change far less often than once a frame, so most frames just copy the image to the screen.
+
+    Attributes:
+        _name (string): The name of the layer.
+        _signature (tuple): What the actors looked like when the image was last drawn.
+        _image (any): The off-screen image (belongs to the video service, None until made).
+        _renders (int): How many times the image has been drawn.
+    """
+
+    def __init__(self, name):
+        """Constructs a new RenderLayer that has never been drawn.
+
+        Args:
+            name (string): The name of the layer.
+        """
+        self._name = name
+        self._signature = None
+        self._image = None
+        self._renders = 0
+
+    def get_name(self):
+        return self._name
+
+    def get_image(self):
+        return self._image
+
+    def set_image(self, image):
+        self._image = image
+
+    def get_renders(self):
+        return self._renders
+
+    def update(self, signature):
+        """Checks the layer against what it should look like now and remembers the new look.
+
+        Args:
+            signature (tuple): What the layer should look like (see get_signature).
+
+        Returns:
+            bool: True if the image has to be drawn again, False if it can be reused.
+        """
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        self._renders += 1
+        return True
+
+    @staticmethod
+    def get_signature(actors, centered=False):
+        """Gets what the given actors look like, in a form that can be compared.
+
+        Appearances are shared and never change (see Appearance), so holding on to them is enough
+        to notice a new text, font size or color.
+
+        Args:
+            actors (list): The actors in the layer.
+            centered (bool): Whether the actors are drawn centered on their position.
+
+        Returns:
+            tuple: The signature.
+        """
+        signature = [centered]
+        for actor in actors:
+            position = actor.get_position()
+            signature.append((actor.get_appearance(), position.get_x(), position.get_y()))
+        return tuple(signature)
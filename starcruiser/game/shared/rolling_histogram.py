@@ -0,0 +1,84 @@
+from collections import deque
+
+
+class RollingHistogram:
+    """The most recent timings of something, plus totals since it was created.
+
+    The responsibility of RollingHistogram is to remember the last few hundred samples so that
+    percentiles describe how something is behaving right now, while also
+    counting every sample ever added.
+
+    Attributes:
+        _samples (deque): The most recent samples in seconds (the oldest drops off when full).
+        _count (int): How many samples have been added in total.
+        _total (float): The sum of every sample added, in seconds.
+        _max (float): The slowest sample ever added, in seconds.
+    """
+
+    def __init__(self, window):
+        """Constructs a new RollingHistogram.
+
+        Args:
+            window (int): How many recent samples to keep (None keeps every sample).
+        """
+        self._samples = deque(maxlen=window)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def add(self, seconds):
+        """Adds one sample.
+
+        Args:
+            seconds (float): How long something took.
+        """
+        self._samples.append(seconds)
+        self._count += 1
+        self._total += seconds
+        if seconds > self._max:
+            self._max = seconds
+
+    def get_count(self):
+        """Gets how many samples have been added in total."""
+        return self._count
+
+    def get_total(self):
+        """Gets the sum of every sample added, in seconds."""
+        return self._total
+
+    def get_last(self):
+        """Gets the most recent sample in seconds (0 if there isn't one)."""
+        return self._samples[-1] if self._samples else 0.0
+
+    def get_percentile(self, percent):
+        """Gets a nearest-rank percentile of the recent samples.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            float: The percentile in seconds (0 if there are no samples).
+        """
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def get_stats(self):
+        """Summarizes the samples.
+
+        Returns:
+            dict: calls and total_ms count every sample, mean_ms, p50_ms, p99_ms and last_ms only
+                the recent ones, max_ms is the slowest ever.
+        """
+        recent = len(self._samples)
+        return {
+            "calls": self._count,
+            "total_ms": self._total * 1000,
+            "mean_ms": sum(self._samples) * 1000 / recent if recent else 0.0,
+            "p50_ms": self.get_percentile(50) * 1000,
+            "p99_ms": self.get_percentile(99) * 1000,
+            "last_ms": self.get_last() * 1000,
+            "max_ms": self._max * 1000
+        }
@@ -0,0 +1,75 @@
+class SpatialHash:
+    """A uniform grid of buckets for looking things up by position.
+
+    The responsibility of SpatialHash is to sort items into the grid cell they occupy so that
+    collision checks only compare things that share a cell, instead of every pair of actors.
+
+    Attributes:
+        _cell_size (int): The width and height of a single cell.
+        _cells (dict): A dictionary of buckets { key: (group, column, row), value: a list of items }
+    """
+
+    def __init__(self, cell_size):
+        """Constructs a new SpatialHash using the given cell size.
+
+        Args:
+            cell_size (int): The width and height of a single cell.
+        """
+        self._cell_size = cell_size
+        self._cells = {}
+
+    def clear(self):
+        """Empties every bucket so the hash can be rebuilt for the next frame."""
+        self._cells.clear()
+
+    def get_key(self, group, x, y):
+        """Gets the bucket key for the cell that contains the given coordinates.
+
+        Args:
+            group (string): The name of the group.
+            x (int): The horizontal screen coordinate.
+            y (int): The vertical screen coordinate.
+
+        Returns:
+            Tuple(string, int, int): The group, column and row of the cell.
+        """
+        return (group, int(x // self._cell_size), int(y // self._cell_size))
+
+    def insert(self, group, x, y, item):
+        """Adds an item to the bucket of the cell that contains the given coordinates.
+
+        Args:
+            group (string): The name of the group.
+            x (int): The horizontal screen coordinate.
+            y (int): The vertical screen coordinate.
+            item (any): The item to store.
+        """
+        key = self.get_key(group, x, y)
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = [item]
+        else:
+            bucket.append(item)
+
+    def query_box(self, group, left, top, right, bottom):
+        """Gets the items stored in every cell a box touches (edges included). An item stored in
+        more than one of those cells is returned more than once.
+
+        Args:
+            group (string): The name of the group.
+            left (int): The smallest horizontal screen coordinate of the box.
+            top (int): The smallest vertical screen coordinate of the box.
+            right (int): The largest horizontal screen coordinate of the box.
+            bottom (int): The largest vertical screen coordinate of the box.
+
+        Returns:
+            List: The items in those cells (empty if there are none).
+        """
+        cell_size = self._cell_size
+        items = []
+        for row in range(int(top // cell_size), int(bottom // cell_size) + 1):
+            for column in range(int(left // cell_size), int(right // cell_size) + 1):
+                bucket = self._cells.get((group, column, row))
+                if bucket is not None:
+                    items.extend(bucket)
+        return items
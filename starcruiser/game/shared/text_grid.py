@@ -0,0 +1,124 @@
+import constants
+
+
+class TextGrid:
+    """A screen-sized grid of characters, one per cell.
+
+    The responsibility of TextGrid is to collect the one-character actors that sit exactly on a
+    grid cell during a frame, and then hand them back as runs: pieces of a row that share one
+    color. Drawing a run is a single draw call however many characters it holds, so the number of
+    draw calls depends on how many rows and colors are on screen instead of how many actors.
+
+    Attributes:
+        _columns (int): The number of cells across.
+        _rows (int): The number of cells down.
+        _cell_size (int): The width and height of a cell.
+        _font_size (int): Only actors with this font size fit in a cell.
+        _chars (list): One list per row of the character in each cell (None if empty).
+        _colors (list): One list per row of the Color of each cell (None if empty).
+        _used_rows (set): The rows that have something in them this frame.
+    """
+
+    def __init__(self, columns=constants.COLUMNS, rows=constants.MAX_Y // constants.CELL_SIZE,
+                 cell_size=constants.CELL_SIZE, font_size=constants.FONT_SIZE):
+        """Constructs a new, empty TextGrid.
+
+        Args:
+            columns (int): The number of cells across.
+            rows (int): The number of cells down.
+            cell_size (int): The width and height of a cell.
+            font_size (int): Only actors with this font size fit in a cell.
+        """
+        self._columns = columns
+        self._rows = rows
+        self._cell_size = cell_size
+        self._font_size = font_size
+        self._chars = [[None] * columns for row in range(rows)]
+        self._colors = [[None] * columns for row in range(rows)]
+        self._used_rows = set()
+
+    def get_cell_size(self):
+        return self._cell_size
+
+    def get_font_size(self):
+        return self._font_size
+
+    def clear(self):
+        """Empties the grid for the next frame (only the rows that were used)."""
+        for row in self._used_rows:
+            chars = self._chars[row]
+            colors = self._colors[row]
+            for column in range(self._columns):
+                chars[column] = None
+                colors[column] = None
+        self._used_rows.clear()
+
+    def put_actor(self, actor):
+        """Puts an actor in the grid if it is one character that sits exactly on a cell.
+
+        Args:
+            actor (Actor): The actor to put in the grid.
+
+        Returns:
+            bool: True if the actor went in the grid, False if it has to be drawn some other way.
+        """
+        text = actor.get_text()
+        if len(text) != 1 or actor.get_font_size() != self._font_size:
+            return False
+
+        position = actor.get_position()
+        x = position.get_x()
+        y = position.get_y()
+        column = int(x // self._cell_size)
+        row = int(y // self._cell_size)
+        # it has to line up with the cell exactly and be on the screen
+        if (column * self._cell_size != x or row * self._cell_size != y
+                or column < 0 or column >= self._columns or row < 0 or row >= self._rows):
+            return False
+
+        # later actors cover earlier ones, like they would if each was drawn on its own
+        self._chars[row][column] = text
+        self._colors[row][column] = actor.get_color()
+        self._used_rows.add(row)
+        return True
+
+    def get_runs(self):
+        """Gets the characters in the grid as runs of one color.
+
+        Empty cells between two characters of the same color are part of the run (as spaces), so
+        a row of one color is a single run even if it has gaps.
+
+        Returns:
+            list: (x, y, text, Color) for each run, in screen coordinates.
+        """
+        runs = []
+        cell_size = self._cell_size
+        for row in sorted(self._used_rows):
+            chars = self._chars[row]
+            colors = self._colors[row]
+            y = row * cell_size
+            start = None
+            run_color = None
+            pieces = []
+            last = 0
+            for column in range(self._columns):
+                char = chars[column]
+                if char is None:
+                    continue
+                color = colors[column]
+                if start is not None and color is not run_color:
+                    runs.append((start * cell_size, y, "".join(pieces), run_color))
+                    start = None
+                if start is None:
+                    start = column
+                    run_color = color
+                    pieces = []
+                    last = column - 1
+                # fill the gap since the last character of this run with spaces
+                if column - last > 1:
+                    pieces.append(" " * (column - last - 1))
+                pieces.append(char)
+                last = column
+            if start is not None:
+                runs.append((start * cell_size, y, "".join(pieces), run_color))
+        return runs
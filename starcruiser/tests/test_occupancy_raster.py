@@ -0,0 +1,55 @@
+import constants
+from game.casting.cast import Cast
+from game.casting.ship import Ship
+from game.casting.ufo import Ufo
+from game.services.null_audio_service import NullAudioService
+from game.shared.occupancy_raster import OccupancyRaster
+from game.shared.point import Point
+
+
+def make_cast(ship_x):
+    """Makes a cast with a raster, a ship at the bottom and a ufo near the top in column 10."""
+    cast = Cast()
+    cast.set_raster(OccupancyRaster(cast, constants.RASTER_GROUPS))
+    ship = Ship()
+    ship.set_position(Point(ship_x, constants.MAX_Y - 5 * constants.CELL_SIZE))
+    cast.add_actor("ships", ship)
+    ufo = Ufo(cast, NullAudioService())
+    ufo.set_position(Point(10 * constants.CELL_SIZE, 5 * constants.CELL_SIZE))
+    ufo.set_up_ufo()
+    cast.add_actor("ufos", ufo)
+    return cast, ship, ufo
+
+
+def test_ufo_sees_the_ships_current_column():
+    cast, ship, ufo = make_cast(30 * constants.CELL_SIZE)
+    raster = cast.get_raster()
+    # the raster is built while the ship is far away
+    assert raster.find_group("ships", ufo.get_position().get_x(), 0, constants.MAX_Y) is None
+    assert not ufo._is_ship_below()
+
+    # the ship moves under the ufo during the move phase, before the raster is rebuilt
+    ship.get_position().set(11 * constants.CELL_SIZE, ship.get_position().get_y())
+    assert ufo._is_ship_below()
+
+    # and away again
+    ship.get_position().set(20 * constants.CELL_SIZE, ship.get_position().get_y())
+    assert not ufo._is_ship_below()
+
+
+def test_removed_actors_leave_no_cells_behind():
+    cast, ship, ufo = make_cast(10 * constants.CELL_SIZE)
+    raster = cast.get_raster()
+    x = ship.get_position().get_x()
+    assert raster.find_group("ships", x, 0, constants.MAX_Y) is not None
+
+    cast.remove_actor("ships", ship)
+    assert raster.find_group("ships", x, 0, constants.MAX_Y) is None
+
+
+def test_raster_covers_the_playfield_rows():
+    cast, ship, ufo = make_cast(10 * constants.CELL_SIZE)
+    raster = cast.get_raster()
+    bottom = constants.MAX_Y - constants.CELL_SIZE
+    assert raster.get_index(0, bottom) is not None
+    assert raster.get_index(0, constants.MAX_Y) is None